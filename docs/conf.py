@@ -166,6 +166,8 @@ rst_epilog = """
 
 .. |_ColumnCollection| replace:: :class:`_ColumnCollection`
 
+.. |CompressionPolicy| replace:: :class:`.CompressionPolicy`
+
 .. |Connector| replace:: :class:`.Connector`
 
 .. |CoreProperties| replace:: :class:`.CoreProperties`
@@ -298,10 +300,14 @@ rst_epilog = """
 
 .. |RadarSeries| replace:: :class:`.RadarSeries`
 
+.. |ReadOnlyPackageError| replace:: :exc:`.ReadOnlyPackageError`
+
 .. |_Relationship| replace:: :class:`._Relationship`
 
 .. |_Relationships| replace:: :class:`_Relationships`
 
+.. |RenderResult| replace:: :class:`.RenderResult`
+
 .. |RGBColor| replace:: :class:`.RGBColor`
 
 .. |_Row| replace:: :class:`_Row`
@@ -344,6 +350,8 @@ rst_epilog = """
 
 .. |Table| replace:: :class:`Table`
 
+.. |Template| replace:: :class:`.Template`
+
 .. |TextFrame| replace:: :class:`.TextFrame`
 
 .. |TickLabels| replace:: :class:`.TickLabels`
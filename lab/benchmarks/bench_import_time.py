@@ -0,0 +1,110 @@
+# encoding: utf-8
+
+"""Benchmark the time taken by `import pptx` in a fresh interpreter.
+
+Each import is timed in a new subprocess, so no module is already imported. Times the
+import alone, and the import followed by opening the default template and reading the
+text of a slide, which is when the custom element classes are registered. The best and
+median of the runs are reported for each, along with the time `import pptx` spends in
+importing `pptx.oxml`, as reported by `python -X importtime`, and a profile of the
+modules taking longest to import, by their own import time, of the fastest of the runs.
+
+When a budget in milliseconds is given, exits with status 1 if the best import time
+exceeds it, so it can guard against a change that makes importing slower again.
+
+Run from the repository root:
+
+    $ PYTHONPATH=. python lab/benchmarks/bench_import_time.py [runs] [budget_ms]
+"""
+
+from __future__ import print_function
+
+import subprocess
+import sys
+
+IMPORT = "import pptx"
+
+IMPORT_AND_OPEN = (
+    "import pptx\n"
+    "prs = pptx.Presentation()\n"
+    "slide = prs.slides.add_slide(prs.slide_layouts[0])\n"
+    "slide.shapes.title.text = 'foobar'\n"
+)
+
+TIMER = (
+    "import timeit\n"
+    "start = timeit.default_timer()\n"
+    "exec(compile(%r, '<bench>', 'exec'))\n"
+    "print(timeit.default_timer() - start)\n"
+)
+
+
+def best_and_median_ms(code, runs):
+    """Return (best, median) milliseconds taken to run `code` in a fresh interpreter."""
+    times = sorted(
+        float(subprocess.check_output([sys.executable, "-c", TIMER % code])) * 1000
+        for _ in range(runs)
+    )
+    return times[0], times[len(times) // 2]
+
+
+def import_profiles(runs):
+    """Return list of `python -X importtime` profiles of `import pptx`, fastest first.
+
+    Each profile is a dict {module_name: (self_ms, cumulative_ms)}.
+    """
+    profiles = []
+    for _ in range(runs):
+        stderr = subprocess.check_output(
+            [sys.executable, "-X", "importtime", "-c", IMPORT],
+            stderr=subprocess.STDOUT,
+        ).decode("utf-8")
+        profile = {}
+        for line in stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[1].isdigit():
+                self_us = int(fields[0].split(":")[1])
+                profile[fields[2]] = (self_us / 1000.0, int(fields[1]) / 1000.0)
+        profiles.append(profile)
+    return sorted(profiles, key=lambda profile: profile["pptx"][1])
+
+
+def print_profile(profile, count=15):
+    """Print the `count` modules in `profile` taking longest to import by themselves."""
+    print("\nslowest modules to import     self ms   cumulative ms")
+    heaviest = sorted(profile.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (self_ms, cumulative_ms) in heaviest[:count]:
+        print("  %-28s %7.1f     %7.1f" % (name, self_ms, cumulative_ms))
+
+
+def main(runs=15, budget_ms=None):
+    import_ms = best_and_median_ms(IMPORT, runs)
+    open_ms = best_and_median_ms(IMPORT_AND_OPEN, runs)
+    profile = import_profiles(runs)[0]
+    modules = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pptx; "
+            "print(sum(m.startswith('pptx.oxml') for m in sys.modules))",
+        ]
+    )
+
+    print("                               best ms   median ms")
+    print("import pptx                    %7.1f     %7.1f" % import_ms)
+    print("  of which importing pptx.oxml %7.1f" % profile["pptx.oxml"][1])
+    print("import pptx, then add a slide  %7.1f     %7.1f" % open_ms)
+    print("pptx.oxml modules imported     %7d" % int(modules))
+    print_profile(profile)
+
+    if budget_ms is not None and import_ms[0] > budget_ms:
+        print("FAIL: import took more than %.1f ms" % budget_ms)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    runs = int(args[0]) if args else 15
+    budget_ms = float(args[1]) if len(args) > 1 else None
+    sys.exit(main(runs, budget_ms))
@@ -0,0 +1,85 @@
+# encoding: utf-8
+
+"""Benchmark traversal of the part graph of a large package.
+
+Builds a package of 10,000 slides, each related to its slide layout, a notes slide and
+an image of its own, for 30,000+ parts in all. Times the recursive generator traversal
+`OpcPackage.iter_rels()` used to perform, a first (uncached) traversal, and repeated
+traversals with the graph unchanged, like the calls made while adding images and
+saving.
+
+Run from the repository root:
+
+    $ PYTHONPATH=. python lab/benchmarks/bench_part_graph.py [slide_count]
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.package import OpcPackage, Part
+from pptx.opc.packuri import PackURI
+
+
+def build_package(slide_count):
+    """Return an |OpcPackage| with a presentation part related to `slide_count` slides."""
+    package = OpcPackage(None)
+    prs_part = Part(PackURI("/ppt/presentation.xml"), None, package)
+    package.relate_to(prs_part, RT.OFFICE_DOCUMENT)
+    layout = Part(PackURI("/ppt/slideLayouts/slideLayout1.xml"), None, package)
+    for n in range(1, slide_count + 1):
+        slide = Part(PackURI("/ppt/slides/slide%d.xml" % n), None, package)
+        notes = Part(PackURI("/ppt/notesSlides/notesSlide%d.xml" % n), None, package)
+        image = Part(PackURI("/ppt/media/image%d.png" % n), None, package)
+        prs_part.relate_to(slide, RT.SLIDE)
+        slide.relate_to(layout, RT.SLIDE_LAYOUT)
+        slide.relate_to(notes, RT.NOTES_SLIDE)
+        slide.relate_to(image, RT.IMAGE)
+        notes.relate_to(slide, RT.SLIDE)
+    return package
+
+
+def recursive_iter_rels(package):
+    """Reference implementation, the recursive generator formerly in `iter_rels()`."""
+    visited = set()
+
+    def walk_rels(rels):
+        for rel in rels.values():
+            yield rel
+            if rel.is_external:
+                continue
+            part = rel.target_part
+            if part in visited:
+                continue
+            visited.add(part)
+            for rel in walk_rels(part.rels):
+                yield rel
+
+    for rel in walk_rels(package._rels):
+        yield rel
+
+
+def main(slide_count):
+    package = build_package(slide_count)
+    part_count = sum(1 for _ in package.iter_parts())
+    assert list(recursive_iter_rels(package)) == list(package.iter_rels())
+    print("parts: %d, rels: %d" % (part_count, sum(1 for _ in package.iter_rels())))
+
+    def report(label, stmt, number):
+        seconds = min(timeit.repeat(stmt, number=number, repeat=3)) / number
+        print("%-40s %9.3f ms" % (label, seconds * 1000))
+
+    report("recursive walk (former iter_rels)", lambda: list(recursive_iter_rels(package)), 3)
+
+    def uncached():
+        package._part_graph_cache = None
+        list(package.iter_rels())
+
+    report("iterative walk (cache cleared)", uncached, 3)
+    report("iter_parts() with graph unchanged", lambda: list(package.iter_parts()), 100)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
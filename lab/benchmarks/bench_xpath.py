@@ -0,0 +1,186 @@
+# encoding: utf-8
+
+"""Benchmark `BaseOxmlElement.xpath()` on slides having many shapes.
+
+Builds the shape tree of a slide having 1,000 or more shapes, then times the XPath
+expressions evaluated on it in hot paths: `max_shape_id` (`//@id`), the placeholder
+names checked by `_next_ph_name` (`//p:cNvPr/@name`), and a couple of short relative
+expressions of the kind that are evaluated once per shape or per data point. Each is
+timed evaluated by `BaseOxmlElement.xpath()`, and by lxml compiling the expression on
+each call as `xpath()` did before its compiled-expression cache, so the difference is
+the per-call saving.
+
+Then times `CT_GroupShape.max_shape_id` and `._next_shape_id`, which read every @id as
+plain strings rather than by way of `xpath()`, against their former implementations.
+
+Last, times 1, 2 and 4 threads each evaluating `//p:cNvPr/@name` on the same tree, once
+with all of them sharing one compiled expression, as the cache did before it was kept
+per thread, and once by way of `xpath()`. lxml evaluates a compiled expression for one
+thread at a time, so sharing one makes threads wait on each other; the difference shows
+on a multi-core machine.
+
+Run from the repository root:
+
+    $ PYTHONPATH=. python lab/benchmarks/bench_xpath.py [shape_count ...]
+"""
+
+from __future__ import print_function
+
+import sys
+import threading
+import timeit
+
+from lxml import etree
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import _nsmap, nsdecls
+
+EXPRESSIONS = (
+    ("max_shape_id", "//@id"),
+    ("_next_ph_name", "//p:cNvPr/@name"),
+    ("child shapes", "./p:sp"),
+    ("shape by id", "./p:sp[p:nvSpPr/p:cNvPr/@id='7']"),
+    ("text runs", "./p:txBody/a:p/a:r"),
+)
+
+SP_XML = (
+    "<p:sp>"
+    '<p:nvSpPr><p:cNvPr id="%d" name="TextBox %d"/><p:cNvSpPr txBox="1"/><p:nvPr/>'
+    "</p:nvSpPr>"
+    "<p:spPr/>"
+    "<p:txBody><a:bodyPr/><a:p><a:r><a:t>shape %d</a:t></a:r></a:p></p:txBody>"
+    "</p:sp>"
+)
+
+
+def spTree(shape_count):
+    """Return `p:spTree` element containing `shape_count` text box shapes."""
+    xml = (
+        '<p:spTree %s><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/>'
+        "</p:nvGrpSpPr><p:grpSpPr/>%s</p:spTree>"
+        % (
+            nsdecls("a", "p"),
+            "".join(SP_XML % (n, n, n) for n in range(2, shape_count + 2)),
+        )
+    )
+    return parse_xml(xml)
+
+
+def per_call_us(func):
+    """Return the best of 5 average microseconds per call of `func`.
+
+    Each of the 5 runs calls `func` enough times to take about a tenth of a second.
+    """
+    start = timeit.default_timer()
+    func()
+    number = max(1, int(0.1 / max(timeit.default_timer() - start, 1e-7)))
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def former_max_shape_id(spTree):
+    """Reference implementation, `CT_GroupShape.max_shape_id` as it was."""
+    id_str_lst = etree.ElementBase.xpath(spTree, "//@id", namespaces=_nsmap)
+    used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
+    return max(used_ids) if used_ids else 0
+
+
+def former_next_shape_id(spTree):
+    """Reference implementation, `CT_GroupShape._next_shape_id` as it was."""
+    id_str_lst = etree.ElementBase.xpath(spTree, "//@id", namespaces=_nsmap)
+    used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
+    for n in range(1, len(used_ids) + 2):
+        if n not in used_ids:
+            return n
+
+
+def threaded_seconds(thread_count, evaluate, calls=100):
+    """Return seconds taken by `thread_count` threads each calling `evaluate`."""
+
+    def work():
+        for _ in range(calls):
+            evaluate()
+
+    threads = [threading.Thread(target=work) for _ in range(thread_count)]
+    start = timeit.default_timer()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return timeit.default_timer() - start
+
+
+def main(shape_counts):
+    print("%-14s %7s %13s %13s %8s" % ("expression", "shapes", "uncached us",
+                                       "cached us", "saving"))
+    for shape_count in shape_counts:
+        tree = spTree(shape_count)
+        sp = tree[2]
+        for name, expr in EXPRESSIONS:
+            element = tree if expr.startswith(("/", "./p:sp")) else sp
+
+            def uncached():
+                return etree.ElementBase.xpath(element, expr, namespaces=_nsmap)
+
+            def cached():
+                return element.xpath(expr)
+
+            assert cached() == uncached()
+            uncached_us = per_call_us(uncached)
+            cached_us = per_call_us(cached)
+            print(
+                "%-14s %7d %13.2f %13.2f %7.0f%%"
+                % (
+                    name,
+                    shape_count,
+                    uncached_us,
+                    cached_us,
+                    (uncached_us - cached_us) / uncached_us * 100,
+                )
+            )
+
+    print("\n%-14s %7s %13s %13s %8s" % ("property", "shapes", "former us", "now us",
+                                         "saving"))
+    for shape_count in shape_counts:
+        tree = spTree(shape_count)
+        for name, former, now in (
+            ("max_shape_id", former_max_shape_id, lambda: tree.max_shape_id),
+            ("_next_shape_id", former_next_shape_id, lambda: tree._next_shape_id),
+        ):
+            assert former(tree) == now()
+            former_us = per_call_us(lambda: former(tree))
+            now_us = per_call_us(now)
+            print(
+                "%-14s %7d %13.2f %13.2f %7.0f%%"
+                % (
+                    name,
+                    shape_count,
+                    former_us,
+                    now_us,
+                    (former_us - now_us) / former_us * 100,
+                )
+            )
+
+    print("\n%-14s %7s %13s %13s %8s" % ("threads", "shapes", "shared s",
+                                         "per-thread s", "saving"))
+    expr = "//p:cNvPr/@name"
+    for shape_count in shape_counts:
+        tree = spTree(shape_count)
+        shared = etree.XPath(expr, namespaces=_nsmap)
+        for thread_count in (1, 2, 4):
+            shared_s = threaded_seconds(thread_count, lambda: shared(tree))
+            now_s = threaded_seconds(thread_count, lambda: tree.xpath(expr))
+            print(
+                "%-14d %7d %13.3f %13.3f %7.0f%%"
+                % (
+                    thread_count,
+                    shape_count,
+                    shared_s,
+                    now_s,
+                    (shared_s - now_s) / shared_s * 100,
+                )
+            )
+
+
+if __name__ == "__main__":
+    counts = [int(arg) for arg in sys.argv[1:]] or [1000, 5000]
+    main(counts)
@@ -0,0 +1,124 @@
+# encoding: utf-8
+
+"""Coroutines to open and save a presentation without blocking an asyncio event loop.
+
+The CPU-bound work of reading, parsing and compressing a package is run in an executor
+while the event loop goes on with other tasks. This module requires Python 3.5 or later
+and is imported only when one of these coroutines is first called, by way of
+:func:`pptx.open_async` or :meth:`.Presentation.save_async`.
+"""
+
+import asyncio
+import functools
+import inspect
+
+from pptx.api import Presentation
+from pptx.compat import BytesIO, is_string
+from pptx.opc.blob import CHUNK_SIZE
+
+# --- `asyncio.get_running_loop()` is new in Python 3.7; before that, the loop
+# --- `get_event_loop()` returns from within a coroutine is the running one.
+_get_running_loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)
+
+
+async def open_async(pptx=None, executor=None, read_only=False, lazy=False):
+    """Return a |Presentation| object loaded from `pptx` without blocking.
+
+    `pptx` is anything :func:`pptx.Presentation` accepts, or an asyncio-style stream,
+    such as an `asyncio.StreamReader` or an aiohttp request body, whose `read()`
+    method is a coroutine. Such a stream is read in chunks on the event loop before the
+    package is loaded. The package is loaded in `executor`, the default executor of the
+    running loop when it is |None|. `read_only` and `lazy` are as described for
+    :func:`pptx.Presentation`.
+    """
+    loop = _get_running_loop()
+    if pptx is not None and not is_string(pptx) and _reads_async(pptx):
+        pptx = await _read_stream(pptx)
+    return await loop.run_in_executor(
+        executor, functools.partial(Presentation, pptx, read_only, lazy)
+    )
+
+
+async def save_async(
+    prs,
+    file,
+    compression=None,
+    workers=None,
+    prune=False,
+    dedupe=False,
+    executor=None,
+):
+    """Save `prs` to `file` without blocking, one part at a time.
+
+    `file` is a path or a file-like object, as for :meth:`.Presentation.save`, or an
+    asyncio-style stream whose `write()` method is a coroutine or that has a `drain()`
+    coroutine, like an `asyncio.StreamWriter` or an aiohttp response. The package is
+    serialized in `executor` in chunks of one or a few parts, each written to `file`
+    before the next is serialized. Cancelling the task that awaits this stops the save
+    at the next chunk, leaving `file` incomplete. The other arguments are as described
+    for :meth:`.Presentation.save`.
+    """
+    loop = _get_running_loop()
+    chunks = prs.iter_chunks(compression, workers, prune, dedupe)
+
+    def next_chunk():
+        return next(chunks, None)
+
+    if is_string(file):
+        f = await loop.run_in_executor(executor, functools.partial(open, file, "wb"))
+        write = functools.partial(loop.run_in_executor, executor, f.write)
+    else:
+        f, write = None, functools.partial(_write_to_stream, file)
+
+    in_executor = cancelled_in_executor = False
+    try:
+        while True:
+            in_executor = True
+            chunk = await loop.run_in_executor(executor, next_chunk)
+            in_executor = False
+            if chunk is None:
+                break
+            in_executor = f is not None
+            await write(chunk)
+            in_executor = False
+    except asyncio.CancelledError:
+        cancelled_in_executor = in_executor
+        raise
+    finally:
+        # --- work in the executor can't be interrupted, so when cancelled while a
+        # --- chunk is being serialized or written there, the chunk generator and file
+        # --- are left to be closed when they're garbage-collected ---
+        if not cancelled_in_executor:
+            chunks.close()
+            if f is not None:
+                f.close()
+
+
+async def _read_stream(stream):
+    """Return |BytesIO| object containing the bytes read from asyncio-style `stream`."""
+    buffer = BytesIO()
+    while True:
+        chunk = await stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        buffer.write(chunk)
+    buffer.seek(0)
+    return buffer
+
+
+def _reads_async(stream):
+    """True when the `read()` method of `stream` is a coroutine function."""
+    return inspect.iscoroutinefunction(getattr(stream, "read", None))
+
+
+async def _write_to_stream(stream, chunk):
+    """Write `chunk` to `stream`, awaiting the write or a drain when there is one.
+
+    A plain file-like object is written to directly.
+    """
+    result = stream.write(chunk)
+    if inspect.isawaitable(result):
+        await result
+    drain = getattr(stream, "drain", None)
+    if drain is not None:
+        await drain()
@@ -15,23 +15,75 @@ from .opc.constants import CONTENT_TYPE as CT
 from .package import Package
 
 
-def Presentation(pptx=None):
+def Presentation(pptx=None, read_only=False, lazy=False):
     """
     Return a |Presentation| object loaded from *pptx*, where *pptx* can be
     either a path to a ``.pptx`` file (a string) or a file-like object. If
     *pptx* is missing or ``None``, the built-in default presentation
     "template" is loaded.
+
+    When *read_only* is |True|, the presentation is opened in read-only mode.
+    It takes less memory and can be read by many threads at once, but any
+    attempt to change its parts or their relationships, such as adding a
+    slide or picture, raises |ReadOnlyPackageError|. Changes to text and
+    other XML content are not detected and must not be made.
+
+    When *lazy* is |True|, each slide, and the parts such as pictures and
+    notes used only by that slide, are loaded when the slide is first
+    accessed rather than when the presentation is opened, making a large
+    presentation much quicker to open. A *pptx* file-like object must then
+    remain open until the presentation is saved.
+
+    Otherwise every part, including each image, video and embedded file, is
+    read into memory when the presentation is opened, so the file can be
+    changed or removed after that. Only with *read_only* or *lazy* is a large
+    media part left in the file until it's needed, which is what keeps memory
+    use down when opening a presentation carrying a lot of media.
     """
-    if pptx is None:
-        pptx = _default_pptx_path()
+    return _open_presentation_part(pptx, read_only, lazy).presentation
 
-    presentation_part = Package.open(pptx).main_document_part
 
-    if not _is_pptx_package(presentation_part):
-        tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
-        raise ValueError(tmpl % (pptx, presentation_part.content_type))
+def open_async(pptx=None, executor=None, read_only=False, lazy=False):
+    """
+    Return a coroutine that loads a |Presentation| object from *pptx*
+    without blocking the running asyncio event loop, for use as ``await
+    pptx.open_async(pptx)``. *pptx* is anything :func:`Presentation` accepts
+    or an asyncio-style stream, such as an ``asyncio.StreamReader`` or an
+    aiohttp request body, which is read in chunks. The package is loaded in
+    *executor*, the default executor of the running loop when it is omitted.
+    *read_only* and *lazy* are as described for :func:`Presentation`.
+    Requires Python 3.5 or later.
+    """
+    from pptx.aio import open_async
+
+    return open_async(pptx, executor, read_only, lazy)
+
 
-    return presentation_part.presentation
+class Template(object):
+    """
+    A presentation package loaded once, from which any number of new,
+    independent |Presentation| objects can be formed cheaply.
+
+    *pptx* is a path to a ``.pptx`` file or a file-like object, as for
+    :func:`Presentation`, and the built-in default template is used when it
+    is missing or ``None``. The file is read when the template is formed.
+    Each presentation from :meth:`new_presentation` shares the unchanged
+    content of the template and copies the XML of a slide, layout or other
+    part only when it first accesses it, so the template file is not
+    reopened and reparsed for each one. The template file must remain in
+    place, and a file-like *pptx* open, while those presentations are in use.
+    """
+
+    def __init__(self, pptx=None):
+        self._package = _open_presentation_part(pptx).package
+
+    def new_presentation(self):
+        """
+        Return a new |Presentation| object having the content of this
+        template. Changes to it do not affect the template or any other
+        presentation formed from it.
+        """
+        return self._package.copy().main_document_part.presentation
 
 
 def _default_pptx_path():
@@ -49,3 +101,23 @@ def _is_pptx_package(prs_part):
     """
     valid_content_types = (CT.PML_PRESENTATION_MAIN, CT.PML_PRES_MACRO_MAIN)
     return prs_part.content_type in valid_content_types
+
+
+def _open_presentation_part(pptx, read_only=False, lazy=False):
+    """
+    Return the |PresentationPart| object of the package loaded from *pptx*,
+    or from the built-in default template when *pptx* is ``None``. The
+    package is opened in read-only mode when *read_only* is |True| and its
+    slides are loaded on first access when *lazy* is |True|. Raises
+    |ValueError| when the package is not a PowerPoint file.
+    """
+    if pptx is None:
+        pptx = _default_pptx_path()
+
+    presentation_part = Package.open(pptx, read_only, lazy).main_document_part
+
+    if not _is_pptx_package(presentation_part):
+        tmpl = "file '%s' is not a PowerPoint file, content type is '%s'"
+        raise ValueError(tmpl % (pptx, presentation_part.content_type))
+
+    return presentation_part
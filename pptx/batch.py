@@ -0,0 +1,123 @@
+# encoding: utf-8
+
+"""Batch generation of presentations from a template, on a pool of processes.
+
+Each worker process loads the template once, as a |Template| object, and forms the
+presentation for each record it's given from that. The records are rendered in parallel
+but the results are produced in the order of the records.
+"""
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import collections
+import multiprocessing
+import timeit
+
+from pptx.api import Template
+from pptx.compat import BytesIO, is_string
+
+
+class RenderResult(
+    collections.namedtuple(
+        "RenderResult", ("index", "output", "render_time", "save_time")
+    )
+):
+    """Outcome of rendering the presentation for one record.
+
+    `index` is the position of the record in the records iterable. `output` is the path
+    the presentation was saved to, or its bytes when it was not saved to a path.
+    `render_time` and `save_time` are the seconds taken, in the worker process, by the
+    render callable and by saving the presentation respectively.
+    """
+
+    __slots__ = ()
+
+
+# --- the |Template| object of a worker process, loaded once when it starts ---
+_worker_template = None
+
+
+def render_batch(
+    template, records, render, processes=None, max_in_flight=None, progress=None
+):
+    """Generate a |RenderResult| object for each record in iterable `records`.
+
+    `template` is a path to a .pptx file, a file-like object containing one, or None
+    for the built-in default template. `render` is a callable that takes a new
+    |Presentation| object formed from the template and a record, and fills in the
+    presentation for that record. When it returns a path, the presentation is saved
+    there; otherwise the bytes of the saved presentation are the output. `render`
+    and each record are sent to a worker process so must be picklable; `render`
+    must be a module-level function for that reason.
+
+    `processes` is the number of worker processes, the number of CPUs by default.
+    At most `max_in_flight` records, twice the number of processes by default, are
+    taken from `records` before the result of the first of them is generated, which
+    bounds the memory held by outputs not yet consumed. Results are generated in the
+    order of `records`. `progress` is an optional callable called with each
+    |RenderResult| as soon as its record is done, possibly before the results of
+    earlier records are, from a background thread of the calling process.
+
+    An exception raised by `render` is raised again here, for its record.
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if max_in_flight is None:
+        max_in_flight = 2 * processes
+
+    # --- a file-like template can't be sent to a worker, but its bytes can ---
+    template_path, template_blob = template, None
+    if template is not None and not is_string(template):
+        template.seek(0)
+        template_path, template_blob = None, template.read()
+
+    pool = multiprocessing.Pool(
+        processes, _init_worker, (template_path, template_blob)
+    )
+    try:
+        pending = collections.deque()
+        for index, record in enumerate(records):
+            pending.append(
+                pool.apply_async(
+                    _render_record, (render, index, record), callback=progress
+                )
+            )
+            if len(pending) >= max_in_flight:
+                yield pending.popleft().get()
+        while pending:
+            yield pending.popleft().get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _init_worker(template_path, template_blob):
+    """Load the template of this worker process, once, as it starts."""
+    global _worker_template
+    _worker_template = Template(
+        template_path if template_blob is None else BytesIO(template_blob)
+    )
+
+
+def _render_record(render, index, record):
+    """Return |RenderResult| for the presentation `render` forms for `record`.
+
+    Runs in a worker process, where `_worker_template` is loaded.
+    """
+    prs = _worker_template.new_presentation()
+
+    start = timeit.default_timer()
+    path = render(prs, record)
+    render_time = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    if path is None:
+        stream = BytesIO()
+        prs.save(stream)
+        output = stream.getvalue()
+    else:
+        prs.save(path)
+        output = path
+    save_time = timeit.default_timer() - start
+
+    return RenderResult(index, output, render_time, save_time)
@@ -4,8 +4,6 @@
 
 from contextlib import contextmanager
 
-from xlsxwriter import Workbook
-
 from ..compat import BytesIO
 
 
@@ -32,6 +30,9 @@ class _BaseWorkbookWriter(object):
         stream object (such as a ``BytesIO`` instance) is expected as
         *xlsx_file*.
         """
+        # ---XlsxWriter is only needed once a chart workbook is written---
+        from xlsxwriter import Workbook
+
         workbook = Workbook(xlsx_file, {"in_memory": True})
         worksheet = workbook.add_worksheet()
         yield workbook, worksheet
@@ -122,9 +122,17 @@ class MetaEnumeration(type):
     def __new__(meta, clsname, bases, clsdict):
         meta._add_enum_members(clsdict)
         meta._collect_valid_settings(clsdict)
-        meta._generate_docs_page(clsname, clsdict)
         return type.__new__(meta, clsname, bases, clsdict)
 
+    @property
+    def __docs_rst__(cls):
+        """
+        The RST documentation page for the enumeration. Generated on each
+        access rather than when the class is defined, since only the docs
+        build reads it.
+        """
+        return _DocsPageFormatter(cls.__name__, cls.__dict__).page_str
+
     @classmethod
     def _add_enum_members(meta, clsdict):
         """
@@ -139,21 +147,15 @@ class MetaEnumeration(type):
     @classmethod
     def _collect_valid_settings(meta, clsdict):
         """
-        Return a sequence containing the enumeration values that are valid
-        assignment values. Return-only values are excluded.
+        Add a frozenset containing the enumeration values that are valid
+        assignment values, so each can be validated in constant time.
+        Return-only values are excluded.
         """
         enum_members = clsdict["__members__"]
-        valid_settings = []
+        valid_settings = set()
         for member in enum_members:
-            valid_settings.extend(member.valid_settings)
-        clsdict["_valid_settings"] = valid_settings
-
-    @classmethod
-    def _generate_docs_page(meta, clsname, clsdict):
-        """
-        Return the RST documentation page for the enumeration.
-        """
-        clsdict["__docs_rst__"] = _DocsPageFormatter(clsname, clsdict).page_str
+            valid_settings.update(member.valid_settings)
+        clsdict["_valid_settings"] = frozenset(valid_settings)
 
 
 class EnumerationBase(object):
@@ -171,7 +173,11 @@ class EnumerationBase(object):
         """
         Raise |ValueError| if *value* is not an assignable value.
         """
-        if value not in cls._valid_settings:
+        try:
+            is_valid = value in cls._valid_settings
+        except TypeError:  # --- an unhashable value can't be a member ---
+            is_valid = False
+        if not is_valid:
             raise ValueError(
                 "%s not a member of %s enumeration" % (value, cls.__name__)
             )
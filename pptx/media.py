@@ -5,10 +5,11 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import base64
-import hashlib
+import mmap
 import os
 
 from .compat import is_string
+from .opc.blob import BaseBlob, BufferBlob, blob_bytes, blob_from_path, blob_sha1
 from .opc.constants import CONTENT_TYPE as CT
 from .util import lazyproperty
 
@@ -24,21 +25,29 @@ class Video(object):
 
     @classmethod
     def from_blob(cls, blob, mime_type, filename=None):
-        """Return a new |Video| object loaded from image binary in *blob*."""
+        """Return a new |Video| object loaded from image binary in *blob*.
+
+        *blob* can also be a |BaseBlob| object, such as a |FileBlob|.
+        """
         return cls(blob, mime_type, filename)
 
     @classmethod
     def from_path_or_file_like(cls, movie_file, mime_type):
         """Return a new |Video| object containing video in *movie_file*.
 
-        *movie_file* can be either a path (string) or a file-like
-        (e.g. StringIO) object.
+        *movie_file* can be either a path (string), an `mmap.mmap` object or a
+        file-like (e.g. StringIO) object. A video in an mmap, or in a file at a
+        path that is at least `FILE_BLOB_MIN_SIZE` bytes, is not read into
+        memory; it is streamed into the package when it is saved, so that file
+        must stay in place, unchanged, until then.
         """
         if is_string(movie_file):
             # treat movie_file as a path
-            with open(movie_file, "rb") as f:
-                blob = f.read()
+            blob = blob_from_path(movie_file)
             filename = os.path.basename(movie_file)
+        elif isinstance(movie_file, mmap.mmap):
+            blob = BufferBlob(movie_file)
+            filename = None
         else:
             # assume movie_file is a file-like object
             blob = movie_file.read()
@@ -49,7 +58,7 @@ class Video(object):
     @property
     def blob(self):
         """The bytestream of the media "file"."""
-        return self._blob
+        return blob_bytes(self._blob)
 
     @property
     def content_type(self):
@@ -78,6 +87,15 @@ class Video(object):
             CT.X_MS_VIDEO: "avi",
         }.get(self._mime_type, "vid")
 
+    @property
+    def file_blob(self):
+        """Optional |BaseBlob| object the bytes of this video are read from.
+
+        |None| when the video is held in memory.
+        """
+        blob = self._blob
+        return blob if isinstance(blob, BaseBlob) else None
+
     @property
     def filename(self):
         """Return a filename.ext string appropriate to this video.
@@ -98,7 +116,7 @@ class Video(object):
 
         Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        return blob_sha1(self._blob)
 
 
 SPEAKER_IMAGE_BYTES = base64.b64decode(
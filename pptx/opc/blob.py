@@ -0,0 +1,152 @@
+# encoding: utf-8
+
+"""Blob objects, providing the bytes of a part without holding them in memory.
+
+A blob object stands in for the `bytes` of a large binary part, like a video. Its
+content is read from where it lives, a file, a zip archive member, or a buffer such as
+an `mmap.mmap` object, only when needed, and can be read in chunks so the whole of it
+need never be in memory at once.
+"""
+
+import hashlib
+import os
+import zipfile
+
+from pptx.util import lazyproperty
+
+# --- number of bytes read at a time when a blob is read in chunks ---
+CHUNK_SIZE = 1024 * 1024
+
+# --- a file inserted from a path is read only when needed when at least this big ---
+FILE_BLOB_MIN_SIZE = 16 * 1024 * 1024
+
+
+class BaseBlob(object):
+    """Base class for blob objects."""
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            "`%s` must implement `.iter_chunks()`" % type(self).__name__
+        )
+
+    def read(self):
+        """Return the bytes of this blob, all in memory at once."""
+        return b"".join(self.iter_chunks())
+
+    @lazyproperty
+    def sha1(self):
+        """SHA1 hex digest of the bytes of this blob, computed chunk by chunk."""
+        sha1 = hashlib.sha1()
+        for chunk in self.iter_chunks():
+            sha1.update(chunk)
+        return sha1.hexdigest()
+
+    @property
+    def size(self):
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            "`%s` must implement `.size`" % type(self).__name__
+        )
+
+
+class BufferBlob(BaseBlob):
+    """Blob of the bytes in `buffer`, an object like an `mmap.mmap` object.
+
+    `buffer` can be any object supporting `len()` and slicing into bytes. The chunks are
+    copied out of `buffer` one at a time.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Generate successive bytes chunks of `buffer`, each `chunk_size` at most."""
+        buffer = self._buffer
+        for start in range(0, len(buffer), chunk_size):
+            yield bytes(buffer[start : start + chunk_size])
+
+    @property
+    def size(self):
+        """int byte count of this blob."""
+        return len(self._buffer)
+
+
+class FileBlob(BaseBlob):
+    """Blob of the bytes of the file at `path`.
+
+    The file is opened each time it's read and must still be there when it is.
+    """
+
+    def __init__(self, path):
+        self._path = os.path.abspath(path)
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Generate successive bytes chunks of the file, each `chunk_size` at most."""
+        with open(self._path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                yield chunk
+
+    @property
+    def path(self):
+        """Absolute str path of the file this blob is read from."""
+        return self._path
+
+    @property
+    def size(self):
+        """int byte count of this blob."""
+        return os.path.getsize(self._path)
+
+
+class ZipMemberBlob(BaseBlob):
+    """Blob of the bytes of the zip archive member described by `zipinfo`.
+
+    `pkg_file` is the path of the zip archive or a file-like object containing it. The
+    member is decompressed as it's read.
+    """
+
+    def __init__(self, pkg_file, zipinfo):
+        self._pkg_file = pkg_file
+        self._zipinfo = zipinfo
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Generate successive bytes chunks of the member, each `chunk_size` at most."""
+        with zipfile.ZipFile(self._pkg_file) as zipf:
+            with zipf.open(self._zipinfo) as f:
+                for chunk in iter(lambda: f.read(chunk_size), b""):
+                    yield chunk
+
+    @property
+    def pkg_file(self):
+        """Path or file-like object of the zip archive this blob is read from."""
+        return self._pkg_file
+
+    @property
+    def size(self):
+        """int byte count of this blob, as decompressed."""
+        return self._zipinfo.file_size
+
+
+def blob_from_path(path, min_size=FILE_BLOB_MIN_SIZE):
+    """Return blob of the file at `path`, either bytes or a |FileBlob| object.
+
+    A file of at least `min_size` bytes is not read now; a |FileBlob| reads it when it's
+    needed, so the file must still be there, unchanged, until then. A smaller file is
+    read into memory.
+    """
+    if os.path.getsize(path) >= min_size:
+        return FileBlob(path)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def blob_bytes(blob):
+    """Return bytes of `blob`, which is either bytes or a |BaseBlob| object."""
+    return blob.read() if isinstance(blob, BaseBlob) else blob
+
+
+def blob_sha1(blob):
+    """Return SHA1 hex digest of `blob`, either bytes or a |BaseBlob| object."""
+    if isinstance(blob, BaseBlob):
+        return blob.sha1
+    return hashlib.sha1(blob).hexdigest()
@@ -6,17 +6,65 @@ The :mod:`pptx.packaging` module coheres around the concerns of reading and writ
 presentations to and from a .pptx file.
 """
 
+import bisect
 import collections
+import heapq
+import sys
+import threading
 
 from pptx.compat import is_string, Mapping
-from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM, RELATIONSHIP_TYPE as RT
+from pptx.exc import ReadOnlyPackageError
+from pptx.opc.blob import (
+    BaseBlob,
+    ZipMemberBlob,
+    blob_bytes,
+    blob_from_path,
+    blob_sha1,
+)
+from pptx.opc.constants import (
+    CONTENT_TYPE as CT,
+    RELATIONSHIP_TARGET_MODE as RTM,
+    RELATIONSHIP_TYPE as RT,
+)
 from pptx.opc.oxml import CT_Relationships, serialize_part_xml
 from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
 from pptx.opc.serialized import PackageReader, PackageWriter
 from pptx.opc.shared import CaseInsensitiveDict
 from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsuri
 from pptx.util import lazyproperty
 
+# --- Types of relationship not followed when a package is opened lazily. The part each
+# --- targets, and the parts reached only through it, are loaded on first access.
+_DEFERRED_RELTYPES = frozenset((RT.SLIDE,))
+
+# --- XML content types of parts that can be shared by more than one source part, used
+# --- when parts having identical content are collapsed to one.
+_SHAREABLE_XML_CONTENT_TYPES = frozenset(
+    (CT.OFC_CHART_COLORS, CT.OFC_CHART_STYLE, CT.OFC_THEME_OVERRIDE)
+)
+
+# --- Relationship types needed only while the source part XML refers to the rId, like
+# --- an image referred to by `r:embed` on a picture. A relationship of another type,
+# --- like that of a slide to its slide layout, is implicit and needed regardless.
+_EXPLICIT_RELTYPES = frozenset(
+    (
+        RT.AUDIO,
+        RT.CHART,
+        RT.CHART_USER_SHAPES,
+        RT.DIAGRAM_COLORS,
+        RT.DIAGRAM_DATA,
+        RT.DIAGRAM_LAYOUT,
+        RT.DIAGRAM_QUICK_STYLE,
+        RT.HYPERLINK,
+        RT.IMAGE,
+        RT.MEDIA,
+        RT.OLE_OBJECT,
+        RT.PACKAGE,
+        RT.VIDEO,
+    )
+)
+
 
 class _RelatableMixin(object):
     """Provide relationship methods required by both the package and each part."""
@@ -64,56 +112,134 @@ class OpcPackage(_RelatableMixin):
     to a package file or file-like object containing a package (.pptx file).
     """
 
-    def __init__(self, pkg_file):
+    def __init__(self, pkg_file, read_only=False, lazy=False):
         self._pkg_file = pkg_file
+        self._read_only = read_only
+        self._lazy = lazy
+        self._part_graph_cache = None
+        # --- incremented on each change to a relationships collection of this package,
+        # --- allowing a cached traversal of its rels graph to tell it's not current.
+        self._rels_generation = 0
+        self._rels_generation_lock = threading.Lock()
 
     @classmethod
-    def open(cls, pkg_file):
-        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`."""
-        return cls(pkg_file)._load()
+    def open(cls, pkg_file, read_only=False, lazy=False):
+        """Return an |OpcPackage| instance loaded with the contents of `pkg_file`.
+
+        When `read_only` is True, the package is opened in read-only mode; see
+        :attr:`read_only`. When `lazy` is True, loading some parts is deferred until
+        they're first accessed; see :attr:`lazy`.
+        """
+        return cls(pkg_file, read_only, lazy)._load()
+
+    def copy(self):
+        """Return a new package of this type having a copy of each part in this one.
+
+        A copy is cheap to form because no XML is parsed and no blob is copied. Each
+        part copy shares the bytes of its original and parses them only when its XML
+        is first accessed, so a change to either part is not seen in the other. The new
+        package is read from the same package file as this one and copies unchanged
+        parts from there when it's saved.
+        """
+        package = type(self)(self._pkg_file)
+        parts = self._part_graph[1]
+        part_copies = {part: part._copy_to(package) for part in parts}
+        package._rels.load_from_rels(self._rels, part_copies)
+        for part in parts:
+            part_copies[part]._rels.load_from_rels(part._rels, part_copies)
+        return package
 
     def drop_rel(self, rId):
         """Remove relationship identified by `rId`."""
         self._rels.pop(rId)
 
-    def iter_parts(self):
-        """Generate exactly one reference to each part in the package."""
-        visited = set()
-        for rel in self.iter_rels():
-            if rel.is_external:
-                continue
-            part = rel.target_part
-            if part in visited:
+    def dedupe_parts(self):
+        """Collapse each set of parts having identical content to the first such part.
+
+        Each relationship to a duplicate part is changed to target the first part found
+        having that content, in the order parts are reached in the rels graph, keeping
+        its rId. The duplicates are then no longer in the package and are not saved.
+
+        Only parts that can be shared safely are considered; those having no
+        relationships of their own and being either binary, like an image or embedded
+        workbook, or of a content type in `_SHAREABLE_XML_CONTENT_TYPES`. A part such
+        as a slide layout is never collapsed, even when identical to another, because
+        the parts referring to it depend on it being distinct.
+        """
+        parts_by_content = {}
+        duplicates = {}
+        parts = tuple(self.iter_parts())
+        for part in parts:
+            content_key = _content_key(part)
+            if content_key is None:
                 continue
-            yield part
-            visited.add(part)
+            original = parts_by_content.setdefault(content_key, part)
+            if original is not part:
+                duplicates[part] = original
+
+        if not duplicates:
+            return
+        self._rels.retarget(duplicates)
+        for part in parts:
+            part.rels.retarget(duplicates)
+
+    def drop_unreferenced_rels(self):
+        """Drop each explicit relationship its source part's XML no longer refers to.
+
+        A part that becomes unreachable from the package relationships as a result,
+        along with any parts reachable only through it, is no longer in the package and
+        is not saved. Only parts whose XML has been parsed are examined; the XML of any
+        other part is unchanged since it was loaded.
+        """
+        for part in tuple(self.iter_parts()):
+            part.drop_unreferenced_rels()
 
-    def iter_rels(self):
-        """Generate exactly one reference to each relationship in package.
+    @property
+    def lazy(self):
+        """True when loading some parts of this package is deferred until first access.
+
+        The part reached by each relationship of a type in `_DEFERRED_RELTYPES`, a slide
+        for example, is loaded when first looked up, and its XML is read from the
+        package file and parsed only when needed. The parts reached only through it,
+        like its notes slide and pictures, are loaded when its relationships are first
+        accessed. So opening a large package costs little more than opening a small one.
+        Traversing the package, as saving it does, loads every part. The package file is
+        held open from when the package is opened until it's saved.
+        """
+        return self._lazy
 
-        Performs a depth-first traversal of the rels graph.
+    @property
+    def read_only(self):
+        """True when this package was opened in read-only mode.
+
+        No relationship can be added to or removed from a read-only package and no part
+        renamed or given a new blob; each attempt raises |ReadOnlyPackageError|. Its
+        structures only needed to make such changes, like the rId and partname indexes,
+        are never formed. A binary part is loaded as a blob that reads it from the
+        package file when needed, rather than being held in memory, when the package is
+        opened from a path.
+
+        A read-only package, and the objects reached through it, can be read by any
+        number of threads at once, as long as the XML of its parts is not changed
+        through an element. Use :meth:`copy` to get a package that can be changed.
         """
-        visited = set()
+        return self._read_only
 
-        def walk_rels(rels):
-            for rel in rels.values():
-                yield rel
-                # --- external items can have no relationships ---
-                if rel.is_external:
-                    continue
-                # --- all relationships other than those for the package belong to a
-                # --- part. Once that part has been processed, processing it again
-                # --- would lead to the same relationships appearing more than once.
-                part = rel.target_part
-                if part in visited:
-                    continue
-                visited.add(part)
-                # --- recurse into relationships of each unvisited target-part ---
-                for rel in walk_rels(part.rels):
-                    yield rel
+    def iter_parts(self):
+        """Generate exactly one reference to each part in the package.
+
+        Parts are generated in the order they are first reached in a depth-first
+        traversal of the rels graph.
+        """
+        return iter(self._part_graph[1])
 
-        for rel in walk_rels(self._rels):
-            yield rel
+    def iter_rels(self):
+        """Generate exactly one reference to each relationship in package.
+
+        Performs a depth-first traversal of the rels graph. The traversal is only
+        repeated when a relationship has been added or removed since the last one.
+        """
+        return iter(self._part_graph[0])
 
     @property
     def main_document_part(self):
@@ -130,50 +256,263 @@ class OpcPackage(_RelatableMixin):
         item, a '%d' to be used to insert the integer portion of the partname.
         Example: '/ppt/slides/slide%d.xml'
         """
-        # --- expected next partname is tmpl % n where n is one greater than the number
-        # --- of existing partnames that match tmpl. Speed up finding the next one
-        # --- (maybe) by searching from the end downward rather than from 1 upward.
-        prefix = tmpl[: (tmpl % 42).find("42")]
-        partnames = set(
-            p.partname for p in self.iter_parts() if p.partname.startswith(prefix)
-        )
-        for n in range(len(partnames) + 1, 0, -1):
-            candidate_partname = tmpl % n
-            if candidate_partname not in partnames:
-                return PackURI(candidate_partname)
-        raise Exception(  # pragma: no cover
-            "ProgrammingError: ran out of candidate_partnames"
-        )
+        return PackURI(self._partnames.next_partname(tmpl))
 
-    def save(self, pkg_file):
+    def iter_chunks(self, compression=None, workers=None, prune=False, dedupe=False):
+        """Generate bytes of this package, as it would be saved, in successive chunks.
+
+        This allows the package to be sent to a destination that can't seek, such as a
+        socket or HTTP response, without first being assembled in memory. `compression`,
+        `workers`, `prune` and `dedupe` have the same meaning as they do for
+        :meth:`save`.
+        """
+        self._prepare_to_save(prune, dedupe)
+        try:
+            for chunk in PackageWriter.iter_chunks(
+                self._rels,
+                tuple(self.iter_parts()),
+                pkg_reader=self._package_reader,
+                compression=compression,
+                workers=workers,
+            ):
+                yield chunk
+        finally:
+            self._package_reader.close()
+
+    def save(self, pkg_file, compression=None, workers=None, prune=False, dedupe=False):
         """Save this package to `pkg_file`.
 
-        `file` can be either a path to a file (a string) or a file-like object.
+        `file` can be either a path to a file (a string) or a file-like object. Parts
+        that have not changed since the package was loaded are copied from the package
+        file as they are stored there, without being decompressed and recompressed.
+        `compression` is an optional |CompressionPolicy| object determining how other
+        parts are compressed. `workers` is the optional number of threads used to
+        serialize and compress parts. When `prune` is True, relationships no longer
+        referred to are dropped first (see :meth:`drop_unreferenced_rels`), so parts no
+        longer used, like the image of a deleted picture, are not saved. When `dedupe`
+        is True, parts having identical content are collapsed to one first (see
+        :meth:`dedupe_parts`).
         """
-        PackageWriter.write(pkg_file, self._rels, tuple(self.iter_parts()))
+        self._prepare_to_save(prune, dedupe)
+        try:
+            PackageWriter.write(
+                pkg_file,
+                self._rels,
+                tuple(self.iter_parts()),
+                pkg_reader=self._package_reader,
+                compression=compression,
+                workers=workers,
+            )
+        finally:
+            self._package_reader.close()
+
+    def _prepare_to_save(self, prune, dedupe):
+        """Prune and dedupe the parts of this package as requested, before saving."""
+        if prune:
+            self.drop_unreferenced_rels()
+        if dedupe:
+            self.dedupe_parts()
+        self._reset_part_indexes()
 
     def _load(self):
         """Return the package after loading all parts and relationships."""
-        pkg_xml_rels, parts = _PackageLoader.load(self._pkg_file, self)
+        try:
+            pkg_xml_rels, parts = _PackageLoader.load(self._package_reader, self)
+        finally:
+            # --- don't hold the package file open between load and save, unless it's
+            # --- needed to load deferred parts ---
+            if not self._lazy:
+                self._package_reader.close()
         self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
+        if self._read_only:
+            self._rels.make_read_only()
         return self
 
+    @property
+    def _file_blob_min_size(self):
+        """Optional int byte count a binary part must reach to load as a file blob.
+
+        A part loaded as a file blob is read from the package file when needed, so that
+        file must outlive the package. That's only assumed when the caller opts in by
+        opening the package read-only or lazily, so no part of a package opened
+        otherwise is loaded that way. A lazy package leaves it to the package reader. A
+        read-only package opened from a path loads every binary part as a file blob, so
+        none is held in memory. One opened from a stream loads none that way, because a
+        stream can't be read by more than one thread at a time.
+        """
+        if self._read_only:
+            return 0 if is_string(self._pkg_file) else sys.maxsize
+        return None if self._lazy else sys.maxsize
+
+    @property
+    def _part_graph(self):
+        """(rels, parts) pair of tuples from a depth-first traversal of the rels graph.
+
+        The result of a traversal is cached until any relationship in this package
+        changes.
+        """
+        generation = self._rels_generation
+        cache = self._part_graph_cache
+        if cache is None or cache[0] != generation:
+            cache = self._part_graph_cache = (generation, self._walk_part_graph())
+        return cache[1]
+
+    @lazyproperty
+    def _package_reader(self):
+        """|PackageReader| object providing access to package-items in pkg_file."""
+        return PackageReader(self._pkg_file)
+
+    def _part_added(self, partname):
+        """Note that a part named `partname` was created for this package."""
+        partnames = self.__dict__.get("_partnames")
+        if partnames is not None:
+            partnames.add(partname)
+
+    def _part_dropped(self, part):
+        """Note that the last relationship to `part` was removed from this package.
+
+        `part` is no longer in the package, so its partname is free for another part.
+        Subclasses can extend this for their own indexes.
+        """
+        partnames = self.__dict__.get("_partnames")
+        if partnames is not None:
+            partnames.remove(part.partname)
+
+    def _part_restored(self, part):
+        """Note that `part`, dropped from this package, is the target of a rel again."""
+        partnames = self.__dict__.get("_partnames")
+        if partnames is not None:
+            partnames.add(part.partname)
+
+    def _rels_changed(self, added=(), removed=()):
+        """Note that a relationships collection of this package changed.
+
+        `added` and `removed` are the |_Relationship| objects added to and removed from
+        it, which keep `_referrers` current once formed.
+        """
+        with self._rels_generation_lock:
+            self._rels_generation += 1
+        referrers = self.__dict__.get("_referrers")
+        if referrers is None:
+            return
+        for rel in removed:
+            if rel.is_external:
+                continue
+            part = rel.target_part
+            rels = referrers.get(part)
+            if not rels or rel not in rels:
+                continue
+            rels.remove(rel)
+            if not rels:
+                self._part_dropped(part)
+        for rel in added:
+            if rel.is_external:
+                continue
+            part = rel.target_part
+            rels = referrers.get(part)
+            if rels is None:
+                referrers[part] = set((rel,))
+                continue
+            rels.add(rel)
+            if len(rels) == 1:
+                self._part_restored(part)
+
+    def _part_renamed(self, old_partname, new_partname):
+        """Note that a part of this package was renamed from `old_partname`."""
+        partnames = self.__dict__.get("_partnames")
+        if partnames is not None:
+            partnames.remove(old_partname)
+            partnames.add(new_partname)
+
+    @lazyproperty
+    def _partnames(self):
+        """|_PartnameRegistry| object containing the partname of each part.
+
+        The registry is formed from the parts in the package graph when first needed and
+        is then kept current as parts are added, renamed and dropped. A part is dropped
+        when the last relationship to it is removed; see `_referrers`. A part that is
+        only unreachable, like the image of a slide that was itself dropped, keeps its
+        partname from being reused until the package is next saved, at which point the
+        registry is formed again.
+        """
+        # --- dropped parts are known from `_referrers`, formed from the same graph ---
+        self._referrers
+        return _PartnameRegistry(part.partname for part in self.iter_parts())
+
+    @lazyproperty
+    def _referrers(self):
+        """dict {part: set} of the relationships to each part reached in the package.
+
+        Formed from the package graph when first needed and then kept current as
+        relationships are added and removed, see `_rels_changed()`. A part whose last
+        relationship is removed is mapped to an empty set and is dropped from the
+        package then; see `_part_dropped()`.
+        """
+        referrers = {}
+        for rel in self._part_graph[0]:
+            if rel.is_external:
+                continue
+            referrers.setdefault(rel.target_part, set()).add(rel)
+        return referrers
+
     @lazyproperty
     def _rels(self):
         """|Relationships| object containing relationships of this package."""
-        return _Relationships(PACKAGE_URI.baseURI)
+        return _Relationships(PACKAGE_URI.baseURI, self)
+
+    def _walk_part_graph(self):
+        """Return (rels, parts) pair of tuples in depth-first traversal order.
+
+        `rels` contains each relationship in the package, `parts` each part in the order
+        it is first reached. The traversal uses a stack of iterators rather than
+        recursion so its cost doesn't depend on the depth of the graph.
+        """
+        rels, parts, visited = [], [], set()
+        stack = [iter(self._rels.values())]
+        while stack:
+            for rel in stack[-1]:
+                rels.append(rel)
+                # --- external items can have no relationships ---
+                if rel.is_external:
+                    continue
+                # --- all relationships other than those for the package belong to a
+                # --- part. Once that part has been processed, processing it again
+                # --- would lead to the same relationships appearing more than once.
+                part = rel.target_part
+                if part in visited:
+                    continue
+                visited.add(part)
+                parts.append(part)
+                # --- descend into relationships of each unvisited target-part ---
+                stack.append(iter(part.rels.values()))
+                break
+            else:
+                stack.pop()
+        return tuple(rels), tuple(parts)
+
+    def _reset_part_indexes(self):
+        """Cause indexes formed from the part graph to be formed again when needed.
+
+        Called on save, so parts dropped from the graph since the index was formed
+        are no longer reflected in it. Subclasses can extend this for their own indexes.
+        """
+        self.__dict__.pop("_partnames", None)
+        self.__dict__.pop("_referrers", None)
 
 
 class _PackageLoader(object):
     """Function-object that loads a package from disk (or other store)."""
 
-    def __init__(self, pkg_file, package):
-        self._pkg_file = pkg_file
+    def __init__(self, package_reader, package):
+        self._package_reader = package_reader
         self._package = package
 
     @classmethod
-    def load(cls, pkg_file, package):
-        """Return (pkg_xml_rels, parts) pair resulting from loading `pkg_file`.
+    def load(cls, package_reader, package):
+        """Return (pkg_xml_rels, parts) pair resulting from loading `package_reader`.
+
+        `package_reader` is the |PackageReader| providing access to the items in the
+        package file.
 
         The returned `parts` value is a {partname: part} mapping with each part in the
         package included and constructed complete with its relationships to other parts
@@ -183,17 +522,77 @@ class _PackageLoader(object):
         parsed package relationships. It is the caller's responsibility (the package
         object) to load those relationships into its |_Relationships| object.
         """
-        return cls(pkg_file, package)._load()
+        return cls(package_reader, package)._load()
 
     def _load(self):
-        """Return (pkg_xml_rels, parts) pair resulting from loading pkg_file."""
+        """Return (pkg_xml_rels, parts) pair resulting from loading pkg_file.
+
+        `parts` is a |_DeferredParts| object rather than a dict when loading is lazy.
+        """
         parts, xml_rels = self._parts, self._xml_rels
+        if self._package.lazy:
+            parts = _DeferredParts(self, self._package_reader, parts)
 
-        for partname, part in parts.items():
+        # --- a deferred part can be added to `self._parts` while this iterates ---
+        for partname, part in tuple(self._parts.items()):
             part.load_rels_from_xml(xml_rels[partname], parts)
+            if self._package.read_only:
+                part.rels.make_read_only()
 
         return xml_rels["/"], parts
 
+    def load_deferred_part(self, partname):
+        """Return part `partname`, loaded now with its relationships deferred.
+
+        The XML of an XML part is not read from the package until it's needed.
+        """
+        content_type = self._content_types[partname]
+        blob = (
+            _PackageMemberBlob(self._package_reader, partname)
+            if content_type.endswith("xml")
+            else self._blob_for(partname, content_type)
+        )
+        return PartFactory(partname, content_type, self._package, blob)
+
+    def load_deferred_rels(self, part, src_partname, parts):
+        """Return |_Relationships| object for deferred `part`, loading it if need be.
+
+        `src_partname` is the partname `part` was loaded under, which its relationships
+        are stored by in the package. It can differ from `part.partname` since a slide
+        part is renamed to match its position in the presentation. `parts` is the
+        |_DeferredParts| object used to resolve their targets, which holds its lock
+        while this is called.
+        """
+        rels = part.__dict__.get("_rels")
+        if rels is None:
+            base_uri = part.partname.baseURI
+            rels = _Relationships(base_uri, self._package)
+            rels.load_from_xml(
+                src_partname.baseURI, self._xml_rels_for(src_partname), parts
+            )
+            if self._package.read_only:
+                rels.make_read_only()
+            # --- publish the loaded rels before another thread can look ---
+            part.__dict__["_rels"] = rels
+        return rels
+
+    def _blob_for(self, partname, content_type):
+        """Return blob of part `partname`, either bytes or a |BaseBlob| object.
+
+        When the package is opened read-only or lazily, a large binary part is loaded as
+        a file blob, so it's read from the package file only if and when needed; see
+        `OpcPackage._file_blob_min_size`. Otherwise, and for XML parts always, the part
+        is loaded as bytes, so its package file need not outlive the package.
+        """
+        package_reader = self._package_reader
+        if not content_type.endswith("xml"):
+            file_blob = package_reader.file_blob(
+                partname, self._package._file_blob_min_size
+            )
+            if file_blob is not None:
+                return file_blob
+        return package_reader[partname]
+
     @lazyproperty
     def _content_types(self):
         """|_ContentTypeMap| object providing content-types for items of this package.
@@ -202,11 +601,6 @@ class _PackageLoader(object):
         """
         return _ContentTypeMap.from_xml(self._package_reader[CONTENT_TYPES_URI])
 
-    @lazyproperty
-    def _package_reader(self):
-        """|PackageReader| object providing access to package-items in pkg_file."""
-        return PackageReader(self._pkg_file)
-
     @lazyproperty
     def _parts(self):
         """dict {partname: Part} populated with parts loading from package.
@@ -215,6 +609,9 @@ class _PackageLoader(object):
         so each relationship can resolve a reference to its target part when required.
         This reference can only be reliably carried out once the all parts have been
         loaded.
+
+        Unless the package is opened read-only or lazily, the content of each part is
+        read into memory here, see `_blob_for()`.
         """
         content_types = self._content_types
         package = self._package
@@ -225,7 +622,7 @@ class _PackageLoader(object):
                 partname,
                 content_types[partname],
                 package,
-                blob=package_reader[partname],
+                blob=self._blob_for(partname, content_types[partname]),
             )
             for partname in (p for p in self._xml_rels.keys() if p != "/")
             # --- invalid partnames can arise in some packages; ignore those rather
@@ -238,10 +635,13 @@ class _PackageLoader(object):
         """dict {partname: xml_rels} for package and all package parts.
 
         This is used as the basis for other loading operations such as loading parts and
-        populating their relationships.
+        populating their relationships. When loading is lazy, the traversal doesn't go
+        past a relationship of a type in `_DEFERRED_RELTYPES`, so only parts loaded
+        when the package is opened are included.
         """
         xml_rels = {}
         visited_partnames = set()
+        deferred_reltypes = _DEFERRED_RELTYPES if self._package.lazy else ()
 
         def load_rels(source_partname, rels):
             """Populate `xml_rels` dict by traversing relationships depth-first."""
@@ -253,6 +653,8 @@ class _PackageLoader(object):
             for rel in rels:
                 if rel.targetMode == RTM.EXTERNAL:
                     continue
+                if rel.reltype in deferred_reltypes:
+                    continue
                 target_partname = PackURI.from_rel_ref(base_uri, rel.target_ref)
                 if target_partname in visited_partnames:
                     continue
@@ -272,6 +674,73 @@ class _PackageLoader(object):
         return CT_Relationships.new() if rels_xml is None else parse_xml(rels_xml)
 
 
+class _DeferredParts(object):
+    """Mapping-like {partname: part} of the parts of a package loaded lazily.
+
+    `loader` is the |_PackageLoader| object loading the package from `package_reader`
+    and `parts` the dict of parts loaded when it was opened. A part not yet loaded is
+    loaded, with its relationships deferred, when first looked up, provided it's in the
+    package.
+
+    A part, or its relationships, is loaded only once even when more than one thread
+    first accesses it at the same time. Loading is serialized per package, so threads
+    working on different packages don't wait on each other.
+    """
+
+    def __init__(self, loader, package_reader, parts):
+        self._loader = loader
+        self._package_reader = package_reader
+        self._parts = parts
+        # --- {part: partname} of each part loaded here, its name in the package ---
+        self._src_partnames = {}
+        # --- reentrant since loading relationships loads their target parts ---
+        self._lock = threading.RLock()
+
+    def __contains__(self, partname):
+        return partname in self._parts or partname in self._package_reader
+
+    def __getitem__(self, partname):
+        parts = self._parts
+        with self._lock:
+            part = parts.get(partname)
+            if part is None:
+                part = parts[partname] = self._loader.load_deferred_part(partname)
+                part._deferred_parts = self
+                self._src_partnames[part] = partname
+        return part
+
+    def load_rels(self, part):
+        """Return |_Relationships| object of deferred `part`, loaded on demand."""
+        with self._lock:
+            return self._loader.load_deferred_rels(
+                part, self._src_partnames[part], self
+            )
+
+
+class _PackageMemberBlob(BaseBlob):
+    """Blob of package member `partname`, read by way of `package_reader` when needed.
+
+    Used for the XML of a deferred part, so it's not decompressed until it's parsed.
+    """
+
+    def __init__(self, package_reader, partname):
+        self._package_reader = package_reader
+        self._partname = partname
+
+    def iter_chunks(self, chunk_size=None):
+        """Generate the bytes of the member, as a single chunk."""
+        yield self._package_reader[self._partname]
+
+    def reads_from(self, package_reader):
+        """True when this blob is read by way of `package_reader`."""
+        return self._package_reader is package_reader
+
+    @property
+    def size(self):
+        """int byte count of this blob."""
+        return len(self.read())
+
+
 class Part(_RelatableMixin):
     """Base class for package parts.
 
@@ -286,6 +755,14 @@ class Part(_RelatableMixin):
         self._content_type = content_type
         self._package = package
         self._blob = blob
+        # --- only a part loaded from a package has a source partname; see `.load()` ---
+        self._src_partname = None
+        if package is not None:
+            package._part_added(partname)
+
+    # --- the |_DeferredParts| object of a lazily-loaded package that loaded this part,
+    # --- which loads its relationships on first access; None for any other part ---
+    _deferred_parts = None
 
     @classmethod
     def load(cls, partname, content_type, package, blob):
@@ -294,7 +771,9 @@ class Part(_RelatableMixin):
         This one is a straight pass-through, but subtypes may do some pre-processing,
         see XmlPart for an example.
         """
-        return cls(partname, content_type, package, blob)
+        part = cls(partname, content_type, package, blob)
+        part._src_partname = partname
+        return part
 
     @property
     def blob(self):
@@ -302,32 +781,75 @@ class Part(_RelatableMixin):
 
         May be text (XML generally) or binary. Intended to be overridden by subclasses.
         Default behavior is to return the blob initial loaded during `Package.open()`
-        operation.
+        operation. The bytes of a part backed by a file blob are read into memory on
+        each access.
         """
-        return self._blob
+        return blob_bytes(self._blob)
 
     @blob.setter
     def blob(self, bytes_):
         """Note that not all subclasses use the part blob as their blob source.
 
         In particular, the |XmlPart| subclass uses its `self._element` to serialize a
-        blob on demand. This works fine for binary parts though.
+        blob on demand. This works fine for binary parts though. `bytes_` can also be a
+        |BaseBlob| object, such as a |FileBlob|.
         """
+        self._check_writable()
         self._blob = bytes_
+        self._src_partname = None
 
     @lazyproperty
     def content_type(self):
         """Content-type (MIME-type) of this part."""
         return self._content_type
 
+    @property
+    def file_blob(self):
+        """Optional |BaseBlob| object this part's content is read from.
+
+        |None| when this part holds its content in memory, as most parts do. A large
+        binary part, such as a video, can instead be backed by a file, zip archive
+        member or buffer, and is written to a saved package in chunks.
+        """
+        blob = self._blob
+        return blob if isinstance(blob, BaseBlob) else None
+
+    @property
+    def is_dirty(self):
+        """True when this part's content may differ from that it was loaded with.
+
+        A part created after the package was loaded is always dirty. A clean part can be
+        copied verbatim from the package file on save.
+        """
+        return self._src_partname is None
+
     def drop_rel(self, rId):
         """Remove relationship identified by `rId` if its reference count is under 2.
 
         Relationships with a reference count of 0 are implicit relationships. Note that
-        only XML parts can drop relationships.
+        only XML parts can drop relationships. When the relationship is kept, the caller
+        is expected to remove the reference to `rId` it holds from this part's XML.
+
+        The reference count kept in `_rId_ref_counts` is enough to decide to keep the
+        relationship, but it's confirmed from the XML before the relationship is
+        dropped, since a reference can be added without this part knowing, such as by
+        copying a shape element.
         """
-        if self._rel_ref_count(rId) < 2:
+        rId_ref_counts = self._rId_ref_counts
+        if rId_ref_counts[rId] < 2:
+            rId_ref_counts[rId] = self._rel_ref_count(rId)
+        if rId_ref_counts[rId] < 2:
             self._rels.pop(rId)
+            del rId_ref_counts[rId]
+        else:
+            rId_ref_counts[rId] -= 1
+
+    def drop_unreferenced_rels(self):
+        """Drop relationships the XML of this part no longer refers to.
+
+        A non-XML part can't refer to its relationships, so this does nothing.
+        Overridden by |XmlPart|.
+        """
 
     def load_rels_from_xml(self, xml_rels, parts):
         """load _Relationships for this part from `xml_rels`.
@@ -356,7 +878,10 @@ class Part(_RelatableMixin):
                 "partname must be instance of PackURI, got '%s'"
                 % type(partname).__name__
             )
-        self._partname = partname
+        self._check_writable()
+        old_partname, self._partname = self._partname, partname
+        if self._package is not None:
+            self._package._part_renamed(old_partname, partname)
 
     @lazyproperty
     def rels(self):
@@ -364,12 +889,26 @@ class Part(_RelatableMixin):
         # --- this must be public to allow the part graph to be traversed ---
         return self._rels
 
+    @property
+    def src_partname(self):
+        """Optional |PackURI| partname this part was loaded from.
+
+        |None| when this part was created after the package was loaded or its content
+        has changed since. Unlike `.partname`, this does not change when the part is
+        renamed.
+        """
+        return None if self.is_dirty else self._src_partname
+
     def _blob_from_file(self, file):
-        """Return bytes of `file`, which is either a str path or a file-like object."""
+        """Return blob of `file`, which is either a str path or a file-like object.
+
+        A |FileBlob| object is returned for the path of a large file, so the file is not
+        read until the package is saved; see `blob_from_path()`. Bytes are returned
+        otherwise.
+        """
         # --- a str `file` is assumed to be a path ---
         if is_string(file):
-            with open(file, "rb") as f:
-                return f.read()
+            return blob_from_path(file)
 
         # --- otherwise, assume `file` is a file-like object
         # --- reposition file cursor if it has one
@@ -377,14 +916,77 @@ class Part(_RelatableMixin):
             file.seek(0)
         return file.read()
 
+    def rebase(self, package_reader):
+        """Point this part at the package just saved over the file it was loaded from.
+
+        `package_reader` reads that file, which now holds this part under its current
+        partname. A blob read from the replaced file is replaced by one reading the new
+        file, and a clean part can be copied from there on the next save. This method is
+        only used when saving.
+        """
+        if not self.is_dirty:
+            self._src_partname = self._partname
+        blob = self._blob
+        if isinstance(blob, _PackageMemberBlob) and blob.reads_from(package_reader):
+            self._blob = _PackageMemberBlob(package_reader, self._partname)
+        elif isinstance(blob, ZipMemberBlob) and package_reader.reads_from(
+            blob.pkg_file
+        ):
+            file_blob = package_reader.file_blob(self._partname, 0)
+            self._blob = (
+                package_reader[self._partname] if file_blob is None else file_blob
+            )
+
+    def relate_to(self, target, reltype, is_external=False):
+        """Return rId key of relationship of `reltype` to `target`.
+
+        Extends the base method to count the reference to the rId the caller is
+        expected to add to this part's XML.
+        """
+        rId = super(Part, self).relate_to(target, reltype, is_external)
+        rId_ref_counts = self.__dict__.get("_rId_ref_counts")
+        if rId_ref_counts is not None:
+            rId_ref_counts[rId] += 1
+        return rId
+
+    def _check_writable(self):
+        """Raise |ReadOnlyPackageError| when this part's package is read-only."""
+        package = self._package
+        if package is not None and package.read_only:
+            raise ReadOnlyPackageError("part '%s' is read-only" % self._partname)
+
+    def _copy_to(self, package):
+        """Return a copy of this part belonging to `package`, without relationships.
+
+        The copy shares the blob of this part. A blob is never changed in place, so a
+        change to the content of either part is not seen in the other.
+        """
+        part = self.load(self._partname, self._content_type, package, self._blob)
+        part._src_partname = self._src_partname
+        return part
+
     def _rel_ref_count(self, rId):
         """Return int count of references in this part's XML to `rId`."""
-        return len([r for r in self._element.xpath("//@r:id") if r == rId])
+        return self._element.xpath("//@r:id").count(rId)
+
+    @lazyproperty
+    def _rId_ref_counts(self):
+        """Counter {rId: count} of the `r:id` references to each rId in this part's XML.
+
+        Formed from the XML when first needed and then kept current: |relate_to|
+        counts the reference each caller adds and |drop_rel| the one each removes. A
+        reference added to the XML directly, without a call to |relate_to|, is not
+        counted, so a count can be low; |drop_rel| recounts before relying on one.
+        """
+        return collections.Counter(self._element.xpath("//@r:id"))
 
     @lazyproperty
     def _rels(self):
         """|Relationships| object containing relationships from this part to others."""
-        return _Relationships(self._partname.baseURI)
+        deferred_parts = self._deferred_parts
+        if deferred_parts is not None:
+            return deferred_parts.load_rels(self)
+        return _Relationships(self._partname.baseURI, self._package)
 
 
 class XmlPart(Part):
@@ -392,21 +994,70 @@ class XmlPart(Part):
 
     Provides additional methods to the |Part| base class that take care of parsing and
     reserializing the XML payload and managing relationships to other parts.
+
+    A part loaded from a package keeps the XML bytes it was loaded with and parses them
+    only when its element is first accessed.
     """
 
     def __init__(self, partname, content_type, package, element):
         super(XmlPart, self).__init__(partname, content_type, package)
-        self._element = element
+        self._xml_element = element
+        # --- held while this part's XML is parsed on first access to its element ---
+        self._parse_lock = threading.Lock()
 
     @classmethod
     def load(cls, partname, content_type, package, blob):
-        """Return instance of `cls` loaded with parsed XML from `blob`."""
-        return cls(partname, content_type, package, element=parse_xml(blob))
+        """Return instance of `cls` loaded with the XML in `blob`.
+
+        Parsing `blob` is deferred until the part's element is first accessed.
+        """
+        xml_part = cls(partname, content_type, package, element=None)
+        xml_part._blob = blob
+        xml_part._src_partname = partname
+        return xml_part
 
     @property
     def blob(self):
-        """bytes XML serialization of this part."""
-        return serialize_part_xml(self._element)
+        """bytes XML serialization of this part.
+
+        The bytes this part was loaded with are returned unchanged when its XML has
+        not been parsed.
+        """
+        if self._xml_element is None:
+            return blob_bytes(self._blob)
+        return serialize_part_xml(self._xml_element)
+
+    def drop_unreferenced_rels(self):
+        """Drop each explicit relationship whose rId this part's XML doesn't refer to.
+
+        The explicit relationship types are those in `_EXPLICIT_RELTYPES`. This does
+        nothing when the XML hasn't been parsed, since it can't have changed. The
+        references are found in a single pass over the XML.
+        """
+        if self._xml_element is None:
+            return
+        referenced_rIds = self._referenced_rIds
+        unreferenced_rIds = [
+            rId
+            for rId, rel in self._rels.items()
+            if rel.reltype in _EXPLICIT_RELTYPES and rId not in referenced_rIds
+        ]
+        for rId in unreferenced_rIds:
+            self._rels.pop(rId)
+
+    @property
+    def file_blob(self):
+        """Always |None|; the XML of a part is written from its bytes."""
+        return None
+
+    @property
+    def is_dirty(self):
+        """True when this part's XML may differ from that it was loaded with.
+
+        Changes made through the element cannot be observed, so a part is considered
+        dirty once its XML has been parsed.
+        """
+        return self._xml_element is not None or super(XmlPart, self).is_dirty
 
     @property
     def part(self):
@@ -418,6 +1069,43 @@ class XmlPart(Part):
         """
         return self
 
+    def _copy_to(self, package):
+        """Return a copy of this part belonging to `package`, without relationships.
+
+        The copy is loaded with the XML bytes of this part and parses them only when its
+        element is first accessed, so the two never share an element.
+        """
+        xml_part = self.load(self._partname, self._content_type, package, self.blob)
+        xml_part._src_partname = self.src_partname
+        return xml_part
+
+    @property
+    def _referenced_rIds(self):
+        """set of each str rId referred to by an `r:` attribute in this part's XML.
+
+        This includes `r:id`, `r:embed` and `r:link` among others.
+        """
+        return set(
+            self._element.xpath("//@*[namespace-uri()='%s']" % nsuri("r"))
+        )
+
+    @property
+    def _element(self):
+        """Root element of this part's XML, parsed from its blob on first access.
+
+        The XML is parsed only once even when more than one thread first accesses it at
+        the same time.
+        """
+        element = self._xml_element
+        if element is None:
+            with self._parse_lock:
+                element = self._xml_element
+                if element is None:
+                    element = self._xml_element = parse_xml(blob_bytes(self._blob))
+                    # --- the element is authoritative from here on, bytes are stale ---
+                    self._blob = None
+        return element
+
 
 class PartFactory(object):
     """Constructs a registered subtype of |Part|.
@@ -481,6 +1169,182 @@ class _ContentTypeMap(object):
         return cls(overrides, defaults)
 
 
+class _PartnameRegistry(object):
+    """Set of the partnames in a package, able to find the next available partname.
+
+    The state used to answer a query for a given partname template or prefix is formed
+    on the first such query and updated as each partname is added or removed, so a
+    query does not need to examine each partname in the package.
+    """
+
+    def __init__(self, partnames):
+        # --- a partname can briefly belong to two parts while parts are renamed ---
+        self._partnames = collections.Counter(partnames)
+        self._idx_indexes = {}
+        self._tmpl_indexes = {}
+
+    def __contains__(self, partname):
+        return partname in self._partnames
+
+    def add(self, partname):
+        """Add `partname` to the registry, once for each part having that partname."""
+        partnames = self._partnames
+        if partname in partnames:
+            partnames[partname] += 1
+            return
+        partnames[partname] = 1
+        for tmpl_index in self._tmpl_indexes.values():
+            tmpl_index.add(partname)
+        for idx_index in self._idx_indexes.values():
+            idx_index.add(partname)
+
+    def next_available_idx(self, prefix):
+        """Return the lowest int idx >= 1 not used by a partname starting with `prefix`.
+
+        A partname "uses" an idx when it starts with `prefix` and its `.idx` is that
+        number, like "/ppt/media/image3.png" uses 3 for prefix "/ppt/media/image".
+        Unused numbers are reused.
+        """
+        idx_index = self._idx_indexes.get(prefix)
+        if idx_index is None:
+            idx_index = self._idx_indexes[prefix] = _IdxIndex(prefix, self._partnames)
+        return idx_index.next_available_idx
+
+    def next_partname(self, tmpl):
+        """Return str next available partname matching `tmpl`.
+
+        The next partname is `tmpl % n` for the highest n not in use no greater than one
+        more than the count of partnames starting with the part of `tmpl` before "%d".
+        When no number is skipped, that's the number one greater than that count.
+        """
+        tmpl_index = self._tmpl_indexes.get(tmpl)
+        if tmpl_index is None:
+            tmpl_index = self._tmpl_indexes[tmpl] = _TmplIndex(tmpl, self._partnames)
+        return tmpl % tmpl_index.next_n
+
+    def remove(self, partname):
+        """Remove `partname` from the registry, having no effect if not present."""
+        partnames = self._partnames
+        count = partnames.get(partname, 0)
+        if count > 1:
+            partnames[partname] -= 1
+            return
+        if not count:
+            return
+        del partnames[partname]
+        for tmpl_index in self._tmpl_indexes.values():
+            tmpl_index.remove(partname)
+        for idx_index in self._idx_indexes.values():
+            idx_index.remove(partname)
+
+
+class _IdxIndex(object):
+    """Tracks the idx values used by the partnames in `partnames` starting `prefix`.
+
+    `partnames` contains the partnames in the registry. This object only reads it.
+    """
+
+    def __init__(self, prefix, partnames):
+        self._prefix = prefix
+        self._idx_counts = collections.Counter()
+        # --- every idx below `_lowest` is in use unless it was freed later ---
+        self._lowest = 1
+        self._freed_idxs = []
+        for partname in partnames:
+            self.add(partname)
+
+    def add(self, partname):
+        """Update the idx counts after `partname` is added to the registry."""
+        idx = self._idx(partname)
+        if idx is not None:
+            self._idx_counts[idx] += 1
+
+    @property
+    def next_available_idx(self):
+        """The lowest int idx not in use."""
+        idx_counts, freed_idxs = self._idx_counts, self._freed_idxs
+        while freed_idxs and idx_counts[freed_idxs[0]]:
+            heapq.heappop(freed_idxs)
+        while idx_counts[self._lowest]:
+            self._lowest += 1
+        return min(freed_idxs[0], self._lowest) if freed_idxs else self._lowest
+
+    def remove(self, partname):
+        """Update the idx counts after `partname` is removed from the registry."""
+        idx = self._idx(partname)
+        if idx is None:
+            return
+        idx_counts = self._idx_counts
+        idx_counts[idx] -= 1
+        if not idx_counts[idx] and idx < self._lowest:
+            heapq.heappush(self._freed_idxs, idx)
+
+    def _idx(self, partname):
+        """Optional int idx `partname` uses."""
+        if not partname.startswith(self._prefix):
+            return None
+        return PackURI(partname).idx
+
+
+class _TmplIndex(object):
+    """Tracks the numbers available for partnames formed from template `tmpl`.
+
+    `partnames` contains the partnames in the registry. This object only reads it.
+    """
+
+    def __init__(self, tmpl, partnames):
+        self._tmpl = tmpl
+        prefix_len = (tmpl % 42).find("42")
+        self._prefix = tmpl[:prefix_len]
+        self._suffix = (tmpl % 42)[prefix_len + 2 :]
+        self._partnames = partnames
+        self._count = sum(1 for p in partnames if p.startswith(self._prefix))
+        # --- sorted unused numbers, of those from 1 to count + 1 ---
+        self._free_ns = [
+            n for n in range(1, self._count + 2) if tmpl % n not in partnames
+        ]
+
+    def add(self, partname):
+        """Update available numbers after `partname` is added to the registry."""
+        if not partname.startswith(self._prefix):
+            return
+        free_ns = self._free_ns
+        # --- the range of numbers tracked grows by one, to count + 1 ---
+        self._count += 1
+        n = self._count + 1
+        if self._tmpl % n not in self._partnames:
+            free_ns.append(n)
+        n = self._n(partname)
+        i = bisect.bisect_left(free_ns, n) if n is not None else len(free_ns)
+        if i < len(free_ns) and free_ns[i] == n:
+            del free_ns[i]
+
+    @property
+    def next_n(self):
+        """int number of next available partname."""
+        return self._free_ns[-1]
+
+    def remove(self, partname):
+        """Update available numbers after `partname` is removed from the registry."""
+        if not partname.startswith(self._prefix):
+            return
+        free_ns = self._free_ns
+        # --- the range of numbers tracked shrinks by one, to count + 1 ---
+        if free_ns and free_ns[-1] == self._count + 1:
+            free_ns.pop()
+        self._count -= 1
+        n = self._n(partname)
+        if n is not None and n <= self._count + 1:
+            bisect.insort(free_ns, n)
+
+    def _n(self, partname):
+        """Optional int n where `partname` is `tmpl % n`."""
+        digits = partname[len(self._prefix) : len(partname) - len(self._suffix)]
+        if not digits.isdigit() or self._tmpl % int(digits) != partname:
+            return None
+        return int(digits)
+
+
 class _Relationships(Mapping):
     """Collection of |_Relationship| instances having `dict` semantics.
 
@@ -490,10 +1354,21 @@ class _Relationships(Mapping):
     Iterating this collection has normal mapping semantics, generating the keys (rIds)
     of the mapping. `rels.keys()`, `rels.values()`, and `rels.items() can be used as
     they would be for a `dict`.
+
+    Indexes by reltype, by target, and of unused rIds are maintained as relationships
+    are added and removed, so finding a relationship or the next rId does not require
+    a scan of the collection.
+
+    `package` is the optional |OpcPackage| object these relationships belong to, which
+    is told of each change to them.
     """
 
-    def __init__(self, base_uri):
+    # --- set on the collections of a package opened read-only; see make_read_only() ---
+    _read_only = False
+
+    def __init__(self, base_uri, package=None):
         self._base_uri = base_uri
+        self._package = package
 
     def __contains__(self, rId):
         """Implement 'in' operation, like `"rId7" in relationships`."""
@@ -520,6 +1395,7 @@ class _Relationships(Mapping):
         The rId of an existing matching relationship is used if present. Otherwise, a
         new relationship is added and that rId is returned.
         """
+        self._check_writable()
         existing_rId = self._get_matching(reltype, target_part)
         return (
             self._add_relationship(reltype, target_part)
@@ -533,6 +1409,7 @@ class _Relationships(Mapping):
         The rId of an existing matching relationship is used if present. Otherwise, a
         new relationship is added and that rId is returned.
         """
+        self._check_writable()
         existing_rId = self._get_matching(reltype, target_ref, is_external=True)
         return (
             self._add_relationship(reltype, target_ref, is_external=True)
@@ -540,6 +1417,40 @@ class _Relationships(Mapping):
             else existing_rId
         )
 
+    def make_read_only(self):
+        """Prevent any further change to this collection.
+
+        Any later attempt to add, remove or retarget a relationship raises
+        |ReadOnlyPackageError|.
+        """
+        self._read_only = True
+
+    def load_from_rels(self, rels, part_copies):
+        """Replace any relationships in this collection with copies of those in `rels`.
+
+        `rels` is the |_Relationships| object of the part this collection's part is a
+        copy of. `part_copies` is a dict {part: part_copy} used to resolve the target of
+        each copied relationship. Each copy keeps the rId of its original.
+        """
+        base_uri = self._base_uri
+
+        def iter_rel_copies():
+            for rId, rel in rels.items():
+                if rel.is_external:
+                    yield _Relationship(
+                        base_uri, rId, rel.reltype, RTM.EXTERNAL, rel.target_ref
+                    )
+                else:
+                    yield _Relationship(
+                        base_uri,
+                        rId,
+                        rel.reltype,
+                        RTM.INTERNAL,
+                        part_copies[rel.target_part],
+                    )
+
+        self._load_rels(iter_rel_copies())
+
     def load_from_xml(self, base_uri, xml_rels, parts):
         """Replace any relationships in this collection with those from `xml_rels`."""
 
@@ -556,8 +1467,31 @@ class _Relationships(Mapping):
                         continue
                 yield _Relationship.from_xml(base_uri, rel_elm, parts)
 
-        self._rels.clear()
-        self._rels.update((rel.rId, rel) for rel in iter_valid_rels())
+        self._load_rels(iter_valid_rels())
+
+    def retarget(self, targets):
+        """Change the target of each relationship to a part that is a key in `targets`.
+
+        `targets` is a dict {part: replacement_part}. Each relationship to a part in
+        `targets` is replaced by one to its replacement part having the same rId and
+        reltype.
+        """
+        self._check_writable()
+        for rId, rel in tuple(self._rels.items()):
+            if rel.is_external or rel.target_part not in targets:
+                continue
+            new_rel = _Relationship(
+                self._base_uri,
+                rId,
+                rel.reltype,
+                target_mode=RTM.INTERNAL,
+                target=targets[rel.target_part],
+            )
+            self._unindex(rel)
+            del self._rels[rId]
+            self._index(new_rel)
+            self._rels[rId] = new_rel
+            self._changed(added=(new_rel,), removed=(rel,))
 
     def part_with_reltype(self, reltype):
         """Return target part of relationship with matching `reltype`.
@@ -575,14 +1509,18 @@ class _Relationships(Mapping):
                 "multiple relationships of type '%s' in collection" % reltype
             )
 
-        return rels_of_reltype[0].target_part
+        return next(iter(rels_of_reltype.values())).target_part
 
     def pop(self, rId):
         """Return |Relationship| identified by `rId` after removing it from collection.
 
         The caller is responsible for ensuring it is no longer required.
         """
-        return self._rels.pop(rId)
+        self._check_writable()
+        self._unindex(self._rels[rId])
+        rel = self._rels.pop(rId)
+        self._changed(removed=(rel,))
+        return rel
 
     @property
     def xml(self):
@@ -613,58 +1551,174 @@ class _Relationships(Mapping):
     def _add_relationship(self, reltype, target, is_external=False):
         """Return str rId of |_Relationship| newly added to spec."""
         rId = self._next_rId
-        self._rels[rId] = _Relationship(
+        rel = _Relationship(
             self._base_uri,
             rId,
             reltype,
             target_mode=RTM.EXTERNAL if is_external else RTM.INTERNAL,
             target=target,
         )
+        self._index(rel)
+        self._rels[rId] = rel
+        self._changed(added=(rel,))
         return rId
 
+    def _changed(self, added=(), removed=()):
+        """Tell the package these relationships belong to, if any, that they changed.
+
+        `added` and `removed` are the |_Relationship| objects added and removed.
+        """
+        package = self._package
+        if package is not None:
+            package._rels_changed(added, removed)
+
+    def _check_writable(self):
+        """Raise |ReadOnlyPackageError| when this collection is read-only."""
+        if self._read_only:
+            raise ReadOnlyPackageError(
+                "relationships of '%s' are read-only" % self._base_uri
+            )
+
+    @lazyproperty
+    def _free_rId_nums(self):
+        """Sorted list of each int n where "rId{n}" is unused, for n in 1..len(self)+1.
+
+        The last item is the number of the next rId. There is always at least one item
+        because at most `len(self)` of those rIds can be in use.
+        """
+        rels = self._rels
+        return [n for n in range(1, len(rels) + 2) if "rId%d" % n not in rels]
+
     def _get_matching(self, reltype, target, is_external=False):
         """Return optional str rId of rel of `reltype`, `target`, and `is_external`.
 
         Returns `None` on no matching relationship
         """
-        for rel in self._rels_by_reltype[reltype]:
-            if rel.is_external != is_external:
-                continue
-            rel_target = rel.target_ref if rel.is_external else rel.target_part
-            if rel_target != target:
-                continue
-            return rel.rId
+        rIds = self._rIds_by_target.get((reltype, target, is_external))
+        return rIds[0] if rIds else None
 
-        return None
+    def _load_rels(self, rels):
+        """Replace any relationships in this collection with those in iterable `rels`.
+
+        The indexes are formed again from the loaded relationships on next access.
+        """
+        removed = tuple(self._rels.values())
+        self._rels.clear()
+        self._rels.update((rel.rId, rel) for rel in rels)
+        self._changed(added=tuple(self._rels.values()), removed=removed)
+        for name in ("_free_rId_nums", "_rIds_by_target", "_rels_by_reltype"):
+            self.__dict__.pop(name, None)
+
+    def _index(self, rel):
+        """Add `rel` to the indexes of this collection, just before it's added to it."""
+        self._rels_by_reltype[rel.reltype][rel.rId] = rel
+        self._rIds_by_target[_target_key(rel)].append(rel.rId)
+
+        # --- the range of rId numbers tracked grows by one, to len(self) + 2 ---
+        free_rId_nums = self._free_rId_nums
+        n = len(self._rels) + 2
+        rId = "rId%d" % n
+        if rId not in self._rels and rId != rel.rId:
+            free_rId_nums.append(n)
+        n = _rId_num(rel.rId)
+        i = bisect.bisect_left(free_rId_nums, n) if n is not None else 0
+        if i < len(free_rId_nums) and free_rId_nums[i] == n:
+            del free_rId_nums[i]
 
     @property
     def _next_rId(self):
         """Next str rId available in collection.
 
-        The next rId is the first unused key starting from "rId1" and making use of any
-        gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
+        The next rId is the highest unused rId no greater than "rId%d" % (len(rels)+1),
+        making use of any gaps in numbering, e.g. 'rId2' for rIds ['rId1', 'rId3'].
+        In the common case, all sequential numbers starting at "rId1" are used and the
+        next rId is "rId%d" % (len(rels)+1).
         """
-        # --- The common case is where all sequential numbers starting at "rId1" are
-        # --- used and the next available rId is "rId%d" % (len(rels)+1). So we start
-        # --- there and count down to produce the best performance.
-        for n in range(len(self) + 1, 0, -1):
-            rId_candidate = "rId%d" % n  # like 'rId19'
-            if rId_candidate not in self._rels:
-                return rId_candidate
+        return "rId%d" % self._free_rId_nums[-1]
 
     @lazyproperty
     def _rels(self):
         """dict {rId: _Relationship} containing relationships of this collection."""
         return dict()
 
-    @property
+    @lazyproperty
     def _rels_by_reltype(self):
-        """defaultdict {reltype: [rels]} for all relationships in collection."""
-        D = collections.defaultdict(list)
+        """defaultdict {reltype: {rId: rel}} for all relationships in collection."""
+        D = collections.defaultdict(dict)
         for rel in self.values():
-            D[rel.reltype].append(rel)
+            D[rel.reltype][rel.rId] = rel
         return D
 
+    @lazyproperty
+    def _rIds_by_target(self):
+        """defaultdict {(reltype, target, is_external): [rIds]} of rels in collection.
+
+        The target is the target part for an internal relationship and the target ref
+        (e.g. URL) for an external one. Where more than one relationship matches a key,
+        their rIds are listed in the order they were added, the first being matched.
+        """
+        rIds_by_target = collections.defaultdict(list)
+        for rel in self.values():
+            rIds_by_target[_target_key(rel)].append(rel.rId)
+        return rIds_by_target
+
+    def _unindex(self, rel):
+        """Remove `rel` from the indexes of this collection, just before removal."""
+        rels_of_reltype = self._rels_by_reltype[rel.reltype]
+        rels_of_reltype.pop(rel.rId, None)
+
+        key = _target_key(rel)
+        rIds_by_target = self._rIds_by_target
+        rIds = rIds_by_target.get(key, [])
+        if rel.rId in rIds:
+            rIds.remove(rel.rId)
+        if not rIds:
+            rIds_by_target.pop(key, None)
+
+        # --- the range of rId numbers tracked shrinks by one, to len(self) ---
+        free_rId_nums = self._free_rId_nums
+        n = len(self._rels)
+        if free_rId_nums and free_rId_nums[-1] == n + 1:
+            free_rId_nums.pop()
+        n_removed = _rId_num(rel.rId)
+        if n_removed is not None and n_removed <= n:
+            bisect.insort(free_rId_nums, n_removed)
+
+
+def _content_key(part):
+    """Return (content_type, sha1) key identifying content of `part`, or None.
+
+    None is returned for a part that can't be shared with other source parts, such as
+    one having relationships of its own or containing XML of most content types.
+    """
+    content_type = part.content_type
+    if len(part.rels) > 0:
+        return None
+    is_xml = content_type.endswith("xml")
+    if is_xml and content_type not in _SHAREABLE_XML_CONTENT_TYPES:
+        return None
+    file_blob = part.file_blob
+    return (content_type, blob_sha1(part.blob if file_blob is None else file_blob))
+
+
+def _rId_num(rId):
+    """Return int n when `rId` is like "rId{n}", None otherwise.
+
+    An rId with leading zeros in its number, like "rId07", is not the rId of any
+    number because "rId%d" % 7 is "rId7".
+    """
+    digits = rId[3:]
+    if not rId.startswith("rId") or not digits.isdigit() or digits.startswith("0"):
+        return None
+    return int(digits)
+
+
+def _target_key(rel):
+    """Return (reltype, target, is_external) key of `rel` in the target index."""
+    is_external = rel.is_external
+    target = rel.target_ref if is_external else rel.target_part
+    return (rel.reltype, target, is_external)
+
 
 class _Relationship(object):
     """Value object describing link from a part or package to another part."""
@@ -2,11 +2,22 @@
 
 """API for reading/writing serialized Open Packaging Convention (OPC) package."""
 
+import collections
+import contextlib
+import hashlib
 import os
 import posixpath
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
 import zipfile
+import zlib
 
 from pptx.compat import Container, is_string
+from pptx.opc.blob import BaseBlob, CHUNK_SIZE, FileBlob, ZipMemberBlob, blob_sha1
 from pptx.exceptions import PackageNotFoundError
 from pptx.opc.constants import CONTENT_TYPE as CT
 from pptx.opc.oxml import CT_Types, serialize_part_xml
@@ -15,24 +26,69 @@ from pptx.opc.shared import CaseInsensitiveDict
 from pptx.opc.spec import default_content_types
 from pptx.util import lazyproperty
 
+BadZipfile = zipfile.BadZipfile
+
+# --- signature that begins a zip data descriptor record ---
+_DATA_DESCRIPTOR_SIGNATURE = 0x08074B50
+
+# --- a binary member at least this big is loaded as a file blob, not as bytes ---
+_FILE_BLOB_MIN_SIZE = 1024 * 1024
+
+# --- `ZipFile` internals used to append a member whose bytes are already compressed,
+# --- which `ZipFile` has no public interface for. They're missing from some Python
+# --- versions, Python 2.7 among them.
+_ZIPFILE_WRITE_INTERNALS = (
+    "_didModify",
+    "_lock",
+    "_seekable",
+    "_writecheck",
+    "NameToInfo",
+    "filelist",
+    "fp",
+    "start_dir",
+)
+
+# --- `ZipFile.open()` can open a member for writing from Python 3.6 ---
+_ZIPFILE_OPENS_FOR_WRITING = sys.version_info >= (3, 6)
+
 
 class PackageReader(Container):
     """Provides access to package-parts of an OPC package with dict semantics.
 
     The package may be in zip-format (a .pptx file) or expanded into a directory
     structure, perhaps by unzipping a .pptx file.
+
+    More than one thread can read from it at once; the package file itself is read by
+    one thread at a time.
     """
 
     def __init__(self, pkg_file):
         self._pkg_file = pkg_file
+        # --- held while the package file is read, it's opened on first read ---
+        self._lock = threading.Lock()
 
     def __contains__(self, pack_uri):
         """Return True when part identified by `pack_uri` is present in package."""
-        return pack_uri in self._blob_reader
+        with self._lock:
+            return pack_uri in self._blob_reader
 
     def __getitem__(self, pack_uri):
         """Return bytes for part corresponding to `pack_uri`."""
-        return self._blob_reader[pack_uri]
+        with self._lock:
+            return self._blob_reader[pack_uri]
+
+    def file_blob(self, pack_uri, min_size=None):
+        """Return optional |BaseBlob| object for a large member `pack_uri`.
+
+        A member large enough to be worth it is loaded as a blob object that reads it
+        from the package file only when needed. |None| is returned for other members,
+        which should be read as bytes. `min_size` is the optional byte count a member
+        must reach to be large enough, `_FILE_BLOB_MIN_SIZE` when omitted.
+        """
+        if min_size is None:
+            min_size = _FILE_BLOB_MIN_SIZE
+        with self._lock:
+            return self._blob_reader.file_blob(pack_uri, min_size)
 
     def rels_xml_for(self, partname):
         """Return optional rels item XML for `partname`.
@@ -40,8 +96,50 @@ class PackageReader(Container):
         Returns `None` if no rels item is present for `partname`. `partname` is a
         |PackURI| instance.
         """
-        blob_reader, uri = self._blob_reader, partname.rels_uri
-        return blob_reader[uri] if uri in blob_reader else None
+        with self._lock:
+            blob_reader, uri = self._blob_reader, partname.rels_uri
+            return blob_reader[uri] if uri in blob_reader else None
+
+    def raw_member(self, pack_uri):
+        """Return optional |_RawZipMember| for `pack_uri`, its bytes as stored in zip.
+
+        Returns |None| when the package is not a zip archive or the member cannot be
+        copied verbatim, in which case the caller must fall back to its blob.
+        """
+        return self._blob_reader.raw_member(pack_uri)
+
+    def rebase(self, parts):
+        """Read from the package saved over the package file, pointing `parts` at it.
+
+        The package file now holds each of `parts` under its current partname. Anything
+        read from the replaced file is forgotten, so it's read afresh from the new one.
+        """
+        self.close()
+        self.__dict__.pop("_blob_reader", None)
+        for part in parts:
+            part.rebase(self)
+
+    def reads_from(self, pkg_file):
+        """True when `pkg_file` is or may be the file this package is read from.
+
+        Writing to the package file while it is being read would destroy it.
+        """
+        if not (is_string(pkg_file) and is_string(self._pkg_file)):
+            return pkg_file is self._pkg_file
+        # --- a path is compared by file, the package file may be gone by now ---
+        try:
+            return os.path.samefile(pkg_file, self._pkg_file)
+        except OSError:
+            # --- `pkg_file` does not exist (yet) ---
+            return False
+
+    def close(self):
+        """Release any file handle held open to read the package.
+
+        Reading a part after closing is still possible but may reopen the package
+        file.
+        """
+        self._blob_reader.close()
 
     @lazyproperty
     def _blob_reader(self):
@@ -55,32 +153,149 @@ class PackageWriter(object):
     `pkg_file` can be either a path to a zip file (a string) or a file-like object.
     `pkg_rels` is the |_Relationships| object containing relationships for the package.
     `parts` is a sequence of |Part| subtype instance to be written to the package.
+    `pkg_reader` is the optional |PackageReader| the parts were loaded from. A part
+    that is unchanged since loading is copied from there as-is. `compression` is an
+    optional |CompressionPolicy| object determining how each part is compressed.
+    `workers` is the optional number of threads used to serialize and compress parts;
+    parts are processed one at a time by the calling thread when it is |None| or 1.
+    The package written is the same either way.
 
     Its single API classmethod is :meth:`write`. This class is not intended to be
     instantiated.
     """
 
-    def __init__(self, pkg_file, pkg_rels, parts):
+    def __init__(
+        self,
+        pkg_file,
+        pkg_rels,
+        parts,
+        pkg_reader=None,
+        compression=None,
+        workers=None,
+    ):
         self._pkg_file = pkg_file
         self._pkg_rels = pkg_rels
         self._parts = parts
+        self._pkg_reader = pkg_reader
+        self._compression = compression
+        self._workers = workers
 
     @classmethod
-    def write(cls, pkg_file, pkg_rels, parts):
+    def iter_chunks(
+        cls, pkg_rels, parts, pkg_reader=None, compression=None, workers=None
+    ):
+        """Generate the bytes of a physical package (.pptx file) in successive chunks.
+
+        The package is the same one :meth:`write` would write, but is produced
+        incrementally, such that each chunk can be sent on (to a socket, for example)
+        before later parts are serialized. Each chunk is the bytes of one or a few zip
+        members, except the last, which is the zip central directory.
+        """
+        sink = _ChunkSink()
+        package_writer = cls(sink, pkg_rels, parts, pkg_reader, compression, workers)
+        for _ in package_writer._iter_write():
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+
+    @classmethod
+    def write(
+        cls, pkg_file, pkg_rels, parts, pkg_reader=None, compression=None, workers=None
+    ):
         """Write a physical package (.pptx file) to `pkg_file`.
 
         The serialized package contains `pkg_rels` and `parts`, a content-types stream
         based on the content type of each part, and a .rels file for each part that has
         relationships.
+
+        `pkg_file` can also be a write-only file-like object, such as a pipe or an HTTP
+        response body, that has a `.write()` method but can't seek or tell.
         """
-        cls(pkg_file, pkg_rels, parts)._write()
+        cls(pkg_file, pkg_rels, parts, pkg_reader, compression, workers)._write()
 
-    def _write(self):
-        """Write physical package (.pptx file)."""
-        with _PhysPkgWriter.factory(self._pkg_file) as phys_writer:
+    def _iter_write(self):
+        """Write physical package (.pptx file), yielding after each step.
+
+        Writing is complete when this generator is exhausted.
+        """
+        phys_writer = _PhysPkgWriter.factory(
+            self._pkg_file, self._compression, self._workers
+        )
+        with phys_writer:
             self._write_content_types_stream(phys_writer)
             self._write_pkg_rels(phys_writer)
-            self._write_parts(phys_writer)
+            yield
+            for _ in self._iter_write_parts(phys_writer):
+                yield
+        yield
+
+    def _write(self):
+        """Write physical package (.pptx file)."""
+        if self._overwrites_src:
+            self._write_over_src()
+            return
+        for _ in self._iter_write():
+            pass
+
+    @property
+    def _overwrites_src(self):
+        """True when `pkg_file` is the package file the parts are loaded from.
+
+        Parts can still be read from that file while the package is written, so it
+        can't be written to directly. A directory is not a concern because only a
+        member that's being written is overwritten.
+        """
+        pkg_file, pkg_reader = self._pkg_file, self._pkg_reader
+        if pkg_reader is None or not pkg_reader.reads_from(pkg_file):
+            return False
+        return not (is_string(pkg_file) and os.path.isdir(pkg_file))
+
+    def _write_over_src(self):
+        """Write package to the file it is loaded from, by way of a temporary file.
+
+        A package saved to a path is written to a temporary file in the same directory
+        that then replaces the source file. A package saved to the stream it was loaded
+        from is copied into it once it's complete, replacing what it held. Either way,
+        the package reader and the parts are then pointed at the new package, since
+        what they'd read from the old one is gone.
+        """
+        pkg_file = self._pkg_file
+        if not is_string(pkg_file):
+            with tempfile.TemporaryFile() as tmp_file:
+                self._write_to(tmp_file)
+                tmp_file.seek(0)
+                pkg_file.seek(0)
+                shutil.copyfileobj(tmp_file, pkg_file, CHUNK_SIZE)
+                pkg_file.truncate()
+            self._pkg_reader.rebase(self._parts)
+            return
+
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".tmp", dir=os.path.dirname(os.path.abspath(pkg_file))
+        )
+        os.close(fd)
+        try:
+            self._write_to(tmp_path)
+            # --- a file that is open can't be replaced on Windows ---
+            self._pkg_reader.close()
+            shutil.copymode(pkg_file, tmp_path)
+            _replace_file(tmp_path, pkg_file)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        self._pkg_reader.rebase(self._parts)
+
+    def _write_to(self, pkg_file):
+        """Write package to `pkg_file` rather than the file this writer was given."""
+        package_writer = type(self)(
+            pkg_file,
+            self._pkg_rels,
+            self._parts,
+            self._pkg_reader,
+            self._compression,
+            self._workers,
+        )
+        package_writer._write()
 
     def _write_content_types_stream(self, phys_writer):
         """Write `[Content_Types].xml` part to the physical package.
@@ -91,21 +306,57 @@ class PackageWriter(object):
         phys_writer.write(
             CONTENT_TYPES_URI,
             serialize_part_xml(_ContentTypesItem.xml_for(self._parts)),
+            CT.XML,
         )
 
-    def _write_parts(self, phys_writer):
-        """Write blob of each part in `parts` to the package.
+    def _iter_write_parts(self, phys_writer):
+        """Write blob of each part in `parts` to the package, yielding after each.
 
         A rels item for each part is also written when the part has relationships.
         """
+        return phys_writer.iter_write_members(self._iter_part_members())
+
+    def _iter_part_members(self):
+        """Generate a |_PendingMember| object for each member `parts` are written to.
+
+        Serializing a part is deferred to the pending member, so a writer can do it on
+        a worker thread.
+        """
         for part in self._parts:
-            phys_writer.write(part.partname, part.blob)
+            raw_member = self._raw_member_for(part)
+            if raw_member is not None:
+                yield _PendingMember(part.partname, None, raw_member=raw_member)
+            elif part.file_blob is not None:
+                yield _PendingMember(
+                    part.partname, part.content_type, file_blob=part.file_blob
+                )
+            else:
+                yield _PendingMember(
+                    part.partname, part.content_type, load_blob=_blob_loader(part)
+                )
             if part._rels:
-                phys_writer.write(part.partname.rels_uri, part.rels.xml)
+                yield _PendingMember(
+                    part.partname.rels_uri,
+                    CT.OPC_RELATIONSHIPS,
+                    load_blob=_rels_xml_loader(part),
+                )
 
     def _write_pkg_rels(self, phys_writer):
         """Write the XML rels item for *pkg_rels* ('/_rels/.rels') to the package."""
-        phys_writer.write(PACKAGE_URI.rels_uri, self._pkg_rels.xml)
+        phys_writer.write(
+            PACKAGE_URI.rels_uri, self._pkg_rels.xml, CT.OPC_RELATIONSHIPS
+        )
+
+    def _raw_member_for(self, part):
+        """Return optional |_RawZipMember| `part` can be copied from unchanged.
+
+        Returns |None| when `part` has changed since it was loaded, or when it can't be
+        copied from the package file it was loaded from for whatever reason.
+        """
+        pkg_reader, src_partname = self._pkg_reader, part.src_partname
+        if pkg_reader is None or src_partname is None:
+            return None
+        return pkg_reader.raw_member(src_partname)
 
 
 class _PhysPkgReader(Container):
@@ -117,6 +368,26 @@ class _PhysPkgReader(Container):
             "`%s` must implement `.__contains__()`" % type(self).__name__
         )
 
+    def close(self):
+        """Release any resources held open by this reader.
+
+        Default is a no-op; subclasses that hold a file handle override this.
+        """
+
+    def file_blob(self, pack_uri, min_size):
+        """Return optional |BaseBlob| object for `pack_uri`.
+
+        Default is |None|, meaning the member is read as bytes.
+        """
+        return None
+
+    def raw_member(self, pack_uri):
+        """Return optional |_RawZipMember| for `pack_uri`.
+
+        Only a zip package has compressed members, so default is |None|.
+        """
+        return None
+
     @classmethod
     def factory(cls, pkg_file):
         """Return |_PhysPkgReader| subtype instance appropriage for `pkg_file`."""
@@ -157,51 +428,314 @@ class _DirPkgReader(_PhysPkgReader):
         except IOError:
             raise KeyError("no member '%s' in package" % pack_uri)
 
+    def file_blob(self, pack_uri, min_size):
+        """Return |FileBlob| for file `pack_uri` of at least `min_size` bytes.
+
+        |None| is returned for a smaller file.
+        """
+        path = os.path.join(self._path, pack_uri.membername)
+        try:
+            if os.path.getsize(path) < min_size:
+                return None
+        except OSError:
+            return None
+        return FileBlob(path)
+
 
 class _ZipPkgReader(_PhysPkgReader):
-    """Implements |PhysPkgReader| interface for a zip-file OPC package."""
+    """Implements |PhysPkgReader| interface for a zip-file OPC package.
+
+    Members are decompressed one at a time, only when requested. The zip archive is
+    opened on first access and stays open, so only its central directory is read up
+    front, until :meth:`close` is called. Any access after closing reopens it.
+
+    How much of the archive ends up in memory is up to the caller. A package opened
+    neither read-only nor lazily still requests every member when it's opened.
+    """
 
     def __init__(self, pkg_file):
         self._pkg_file = pkg_file
+        # --- held while a package stream is positioned and read from ---
+        self._stream_lock = threading.Lock()
 
     def __contains__(self, pack_uri):
         """Return True when part identified by `pack_uri` is present in zip archive."""
-        return pack_uri in self._blobs
+        return pack_uri in self._zipinfos
 
     def __getitem__(self, pack_uri):
         """Return bytes for part corresponding to `pack_uri`.
 
         Raises |KeyError| if no matching member is present in zip archive.
         """
-        if pack_uri not in self._blobs:
+        zipinfo = self._zipinfos.get(pack_uri)
+        if zipinfo is None:
             raise KeyError("no member '%s' in package" % pack_uri)
-        return self._blobs[pack_uri]
+        if is_string(self._pkg_file):
+            return self._zipf.read(zipinfo)
+        with self._stream_lock:
+            return self._zipf.read(zipinfo)
+
+    def file_blob(self, pack_uri, min_size):
+        """Return |ZipMemberBlob| for member `pack_uri` of at least `min_size` bytes.
+
+        |None| is returned for a member that is smaller, encrypted or not present.
+        """
+        zipinfo = self._zipinfos.get(pack_uri)
+        if zipinfo is None or zipinfo.flag_bits & 0x1:
+            return None
+        if zipinfo.file_size < min_size:
+            return None
+        return ZipMemberBlob(self._pkg_file, zipinfo)
+
+    def iter_stored(self, offset, size, chunk_size=CHUNK_SIZE):
+        """Generate the `size` bytes at `offset` in the zip archive, in chunks.
+
+        Each chunk is `chunk_size` bytes at most. Raises |BadZipfile| when the archive
+        ends first.
+        """
+        with self._opened_pkg_file() as f:
+            while size > 0:
+                chunk = self._read_at(f, offset, min(chunk_size, size))
+                if not chunk:
+                    raise BadZipfile("zip archive ends within a member")
+                offset += len(chunk)
+                size -= len(chunk)
+                yield chunk
+
+    def raw_member(self, pack_uri):
+        """Return optional |_RawZipMember| for `pack_uri`, its bytes as stored in zip.
+
+        Returns |None| if there is no such member, if it is compressed in a way other
+        than deflate or is encrypted, or when the zip archive cannot be read or has
+        changed since the member was first indexed. Nothing is decompressed, and the
+        stored bytes are read only when the member is copied.
+        """
+        try:
+            zipinfo = self._zipinfos.get(pack_uri)
+            if zipinfo is None or not _RawZipMember.can_copy(zipinfo):
+                return None
+            zipf = self._zipf
+            if _RawZipMember.key(zipf.getinfo(zipinfo.filename)) != (
+                _RawZipMember.key(zipinfo)
+            ):
+                return None
+            return _RawZipMember(zipinfo, self, self._data_offset(zipinfo))
+        except (EnvironmentError, KeyError, ValueError, struct.error, BadZipfile):
+            return None
+
+    def close(self):
+        """Close the zip archive, releasing the file handle it holds (if any)."""
+        zipf = self.__dict__.pop("_zipf", None)
+        if zipf is not None:
+            zipf.close()
+
+    def _data_offset(self, zipinfo):
+        """Return int offset of the stored bytes of member described by `zipinfo`.
+
+        `ZipFile` has no interface for this, so the local file header is read to locate
+        the member data, which follows it.
+        """
+        with self._opened_pkg_file() as f:
+            header = self._read_at(f, zipinfo.header_offset, zipfile.sizeFileHeader)
+        fheader = struct.unpack(zipfile.structFileHeader, header)
+        if fheader[0] != zipfile.stringFileHeader:
+            raise BadZipfile("bad local file header for %s" % zipinfo)
+        return (
+            zipinfo.header_offset + zipfile.sizeFileHeader + fheader[10] + fheader[11]
+        )
+
+    @contextlib.contextmanager
+    def _opened_pkg_file(self):
+        """Context manager providing a file object the zip archive can be read from.
+
+        A package file is opened for the purpose, separately from `_zipf`, so it can be
+        read while `_zipf` is. A package stream is shared, so it's only read by way of
+        `_read_at()`, which holds the stream lock.
+        """
+        if not is_string(self._pkg_file):
+            yield self._pkg_file
+            return
+        with open(self._pkg_file, "rb") as f:
+            yield f
+
+    def _read_at(self, f, offset, size):
+        """Return the `size` bytes at `offset` in file `f`, fewer at its end."""
+        with self._stream_lock:
+            f.seek(offset)
+            return f.read(size)
+
+    @lazyproperty
+    def _zipf(self):
+        """`ZipFile` instance open for reading."""
+        return zipfile.ZipFile(self._pkg_file, "r")
 
     @lazyproperty
-    def _blobs(self):
-        """dict mapping partname to package part binaries."""
-        with zipfile.ZipFile(self._pkg_file, "r") as z:
-            return {PackURI("/%s" % name): z.read(name) for name in z.namelist()}
+    def _zipinfos(self):
+        """dict mapping partname to `ZipInfo` of each member in zip archive.
+
+        Built from the central directory; no member is read to produce it.
+        """
+        return {PackURI("/%s" % zi.filename): zi for zi in self._zipf.infolist()}
 
 
 class _PhysPkgWriter(object):
     """Base class for physical package writer objects."""
 
+    def write(self, pack_uri, blob, content_type=None):
+        """Must be implemented by each subclass."""
+        raise NotImplementedError(  # pragma: no cover
+            "`%s` must implement `.write()`" % type(self).__name__
+        )
+
     @classmethod
-    def factory(cls, pkg_file):
+    def factory(cls, pkg_file, compression=None, workers=None):
         """Return |_PhysPkgWriter| subtype instance appropriage for `pkg_file`.
 
-        Currently the only subtype is `_ZipPkgWriter`, but a `_DirPkgWriter` could be
-        implemented or even a `_StreamPkgWriter`.
+        A `_DirPkgWriter` is returned when `pkg_file` is the path of an existing
+        directory, otherwise a `_ZipPkgWriter`. `compression` is an optional
+        |CompressionPolicy| object and `workers` an optional thread count for writers
+        that compress.
         """
-        return _ZipPkgWriter(pkg_file)
+        if is_string(pkg_file) and os.path.isdir(pkg_file):
+            return _DirPkgWriter(pkg_file)
+        return _ZipPkgWriter(pkg_file, compression, workers)
+
+    def iter_write_members(self, pending_members):
+        """Write each |_PendingMember| in iterable `pending_members`, in order.
+
+        This is a generator that yields (|None|) after writing each member, so a
+        caller can do something with what has been written so far. A subclass can
+        override this to prepare members concurrently.
+        """
+        for pending_member in pending_members:
+            pack_uri = pending_member.pack_uri
+            content_type = pending_member.content_type
+            if pending_member.raw_member is not None:
+                self.write_raw(pack_uri, pending_member.raw_member)
+            elif pending_member.file_blob is not None:
+                self.write_blob(pack_uri, pending_member.file_blob, content_type)
+            else:
+                self.write(pack_uri, pending_member.load_blob(), content_type)
+            yield
+
+    def write_blob(self, pack_uri, file_blob, content_type=None):
+        """Write content of `file_blob` to member corresponding to `pack_uri`.
+
+        `file_blob` is a |BaseBlob| object. A writer that can't write its content in
+        chunks reads it into memory and writes that.
+        """
+        self.write(pack_uri, file_blob.read(), content_type)
+
+    def write_members(self, pending_members):
+        """Write each |_PendingMember| in iterable `pending_members`, in order."""
+        for _ in self.iter_write_members(pending_members):
+            pass
+
+    def write_raw(self, pack_uri, raw_member):
+        """Write `raw_member` to package with membername corresponding to `pack_uri`.
+
+        A writer that can't make use of already-compressed bytes writes the member's
+        blob instead.
+        """
+        self.write(pack_uri, raw_member.blob)
+
+
+class _DirPkgWriter(_PhysPkgWriter):
+    """Implements |PhysPkgWriter| interface for OPC package extracted into directory.
+
+    `path` is the path to an existing directory. Each member is written to the file at
+    the location its membername indicates, creating subdirectories as needed. When
+    `skip_unchanged` is True, a file that already has the content of the member is not
+    rewritten, so its modification time is left as it is. This makes rewriting an
+    expanded package after a small change cheap and friendly to tools like `make` and
+    `rsync`. Files in the directory that are not package members are left in place.
+    """
+
+    def __init__(self, path, skip_unchanged=True):
+        self._path = os.path.abspath(path)
+        self._skip_unchanged = skip_unchanged
+
+    def __enter__(self):
+        """Enable use as a context-manager."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """Nothing is held open between writes, so there is nothing to close."""
+
+    def write(self, pack_uri, blob, content_type=None):
+        """Write `blob` to file corresponding to `pack_uri` in package directory."""
+        path = os.path.join(self._path, pack_uri.membername)
+        if self._skip_unchanged and self._has_content(path, blob):
+            return
+        self._write_file(path, (blob,))
+
+    def write_blob(self, pack_uri, file_blob, content_type=None):
+        """Write content of `file_blob` to file corresponding to `pack_uri`.
+
+        The content is copied in chunks. Nothing is written when `file_blob` is the file
+        at that location, as it can be when saving to the directory a package was
+        loaded from.
+        """
+        path = os.path.join(self._path, pack_uri.membername)
+        if getattr(file_blob, "path", None) == path:
+            return
+        if self._skip_unchanged and self._has_content(path, file_blob):
+            return
+        self._write_file(path, file_blob.iter_chunks())
+
+    @staticmethod
+    def _has_content(path, blob):
+        """True when file at `path` exists and its bytes are the same as `blob`.
+
+        `blob` is either bytes or a |BaseBlob| object. Files are compared by size and
+        then by SHA1 hash, reading the file in chunks.
+        """
+        size = blob.size if isinstance(blob, BaseBlob) else len(blob)
+        try:
+            if os.path.getsize(path) != size:
+                return False
+            sha1 = hashlib.sha1()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    sha1.update(chunk)
+        except (IOError, OSError):
+            return False
+        return sha1.hexdigest() == blob_sha1(blob)
+
+    @staticmethod
+    def _write_file(path, chunks):
+        """Write each bytes chunk in iterable `chunks` to file at `path`.
+
+        Subdirectories leading to `path` are created as needed.
+        """
+        dirpath = os.path.dirname(path)
+        if not os.path.isdir(dirpath):
+            os.makedirs(dirpath)
+        with open(path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
 
 
 class _ZipPkgWriter(_PhysPkgWriter):
-    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package."""
+    """Implements |PhysPkgWriter| interface for a zip-file (.pptx file) OPC package.
 
-    def __init__(self, pkg_file):
+    Each member is compressed as determined by `compression`, a |CompressionPolicy|
+    object, or as determined by `CompressionPolicy.DEFAULT` when that is |None|. When
+    `workers` is greater than 1, members are serialized and compressed on that many
+    threads and written in order as each is ready.
+
+    Members are compressed by this writer and appended by way of `ZipFile` internals.
+    Where those are missing, members are written with the public `ZipFile` interface
+    instead, one at a time; a compression level other than the default and copying a
+    member without decompressing it are not available then.
+    """
+
+    def __init__(self, pkg_file, compression=None, workers=None):
         self._pkg_file = pkg_file
+        self._compression = (
+            CompressionPolicy.DEFAULT if compression is None else compression
+        )
+        self._workers = workers
 
     def __enter__(self):
         """Enable use as a context-manager. Opening zip for writing happens here."""
@@ -215,14 +749,522 @@ class _ZipPkgWriter(_PhysPkgWriter):
         """
         self._zipf.close()
 
-    def write(self, pack_uri, blob):
-        """Write `blob` to zip package with membername corresponding to `pack_uri`."""
-        self._zipf.writestr(pack_uri.membername, blob)
+    def write(self, pack_uri, blob, content_type=None):
+        """Write `blob` to zip package with membername corresponding to `pack_uri`.
+
+        `content_type` determines how `blob` is compressed.
+        """
+        membername = pack_uri.membername
+        if not self._appends_compressed:
+            compress_type, _ = self._compression.zip_settings_for(content_type)
+            self._zipf.writestr(self._new_zipinfo(membername, compress_type), blob)
+            return
+        self._write_member(*self._compress(membername, blob, content_type))
+
+    def write_raw(self, pack_uri, raw_member):
+        """Write `raw_member` to zip package with membername from `pack_uri`.
+
+        The compressed bytes of `raw_member` are copied unchanged, so nothing is
+        decompressed or compressed. They're copied in chunks, so a large member is
+        never in memory all at once.
+        """
+        if not self._appends_compressed:
+            super(_ZipPkgWriter, self).write_raw(pack_uri, raw_member)
+            return
+        self._write_chunks(
+            self._copied_zipinfo(pack_uri.membername, raw_member),
+            raw_member.iter_chunks(),
+        )
+
+    def write_blob(self, pack_uri, file_blob, content_type=None):
+        """Write content of `file_blob` to zip package, compressing it chunk by chunk.
+
+        Only one chunk of `file_blob` is in memory at a time. Its CRC and compressed
+        size aren't known until the last chunk is written, so the member's local header
+        is followed by a data descriptor that records them, rather than being rewritten
+        once they are known. That works for an output that can't seek too.
+        """
+        if not self._appends_compressed:
+            self._write_blob_by_zipfile(pack_uri, file_blob, content_type)
+            return
+        compress_type, level = self._compression.zip_settings_for(content_type)
+        compressor = (
+            None if compress_type == zipfile.ZIP_STORED else self._compressor(level)
+        )
+        zipinfo = self._new_zipinfo(pack_uri.membername, compress_type)
+        zipinfo.flag_bits |= 0x08
+        # --- same margin for compression overhead as `ZipFile.open()` allows ---
+        zip64 = file_blob.size * 1.05 > zipfile.ZIP64_LIMIT
+        zipf = self._zipf
+        with zipf._lock:
+            self._start_member(zipinfo, zip64)
+            crc = compress_size = file_size = 0
+            for chunk in file_blob.iter_chunks():
+                crc = zlib.crc32(chunk, crc)
+                file_size += len(chunk)
+                data = chunk if compressor is None else compressor.compress(chunk)
+                zipf.fp.write(data)
+                compress_size += len(data)
+            if compressor is not None:
+                data = compressor.flush()
+                zipf.fp.write(data)
+                compress_size += len(data)
+            zipinfo.CRC = crc & 0xFFFFFFFF
+            zipinfo.compress_size = compress_size
+            zipinfo.file_size = file_size
+            zipf.fp.write(
+                struct.pack(
+                    "<LLQQ" if zip64 else "<LLLL",
+                    _DATA_DESCRIPTOR_SIGNATURE,
+                    zipinfo.CRC,
+                    compress_size,
+                    file_size,
+                )
+            )
+            self._end_member(zipinfo)
+
+    def iter_write_members(self, pending_members):
+        """Write each |_PendingMember| in iterable `pending_members`, in order.
+
+        Yields after writing each member. When this writer has more than one worker,
+        each member is prepared on a worker thread, while finished members are written
+        in order on this one. Blob serialization and zlib compression both release the
+        GIL, so this scales with available cores. At most a few members per worker are
+        held in memory waiting to be written. A member copied unchanged is not read
+        until it's written, which happens on this thread, in chunks.
+        """
+        workers = self._workers
+        executor_cls = (
+            _thread_pool_executor_cls()
+            if workers and workers > 1 and self._appends_compressed
+            else None
+        )
+        if executor_cls is None:
+            for _ in super(_ZipPkgWriter, self).iter_write_members(pending_members):
+                yield
+            return
+
+        # --- resolve lazy value before threads can race to it ---
+        self._date_time
+        pending = collections.deque()
+        with executor_cls(workers) as executor:
+            for pending_member in pending_members:
+                # --- a file blob is streamed on this thread, after members ahead of it
+                file_blob = pending_member.file_blob
+                if file_blob is not None:
+                    while pending:
+                        self._write_pending(pending.popleft())
+                        yield
+                    self.write_blob(
+                        pending_member.pack_uri, file_blob, pending_member.content_type
+                    )
+                    yield
+                    continue
+                # --- a raw member is copied in chunks on this thread, in its turn ---
+                pending.append(
+                    pending_member
+                    if pending_member.raw_member is not None
+                    else executor.submit(self._prepare, pending_member)
+                )
+                if len(pending) > 2 * workers:
+                    self._write_pending(pending.popleft())
+                    yield
+            while pending:
+                self._write_pending(pending.popleft())
+                yield
+
+    @lazyproperty
+    def _appends_compressed(self):
+        """True when this writer can append a member it has compressed itself.
+
+        That depends on `ZipFile` internals, which are not there in every Python.
+        """
+        zipf = self._zipf
+        return all(hasattr(zipf, name) for name in _ZIPFILE_WRITE_INTERNALS)
+
+    def _copied_zipinfo(self, membername, raw_member):
+        """Return `ZipInfo` object for a new member copied from `raw_member`."""
+        src_zipinfo = raw_member.zipinfo
+        zipinfo = zipfile.ZipInfo(membername, src_zipinfo.date_time)
+        zipinfo.compress_type = src_zipinfo.compress_type
+        zipinfo.external_attr = src_zipinfo.external_attr or 0o600 << 16
+        zipinfo.CRC = src_zipinfo.CRC
+        zipinfo.compress_size = src_zipinfo.compress_size
+        zipinfo.file_size = src_zipinfo.file_size
+        return zipinfo
+
+    def _compress(self, membername, blob, content_type):
+        """Return (zipinfo, data) pair for a new member having `blob` as its content.
+
+        `data` is `blob` compressed as the compression policy determines for
+        `content_type`, and `zipinfo` is the complete `ZipInfo` object describing it.
+        """
+        compress_type, level = self._compression.zip_settings_for(content_type)
+        if compress_type == zipfile.ZIP_STORED:
+            data = blob
+        else:
+            compressor = self._compressor(level)
+            data = compressor.compress(blob) + compressor.flush()
+        zipinfo = self._new_zipinfo(membername, compress_type)
+        zipinfo.CRC = zlib.crc32(blob) & 0xFFFFFFFF
+        zipinfo.compress_size = len(data)
+        zipinfo.file_size = len(blob)
+        return zipinfo, data
+
+    @staticmethod
+    def _compressor(level):
+        """Return zlib compressor producing raw deflate data, as a zip member has.
+
+        `level` is a zlib compression level or |None| for the zlib default level.
+        """
+        level = zlib.Z_DEFAULT_COMPRESSION if level is None else level
+        return zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+
+    def _prepare(self, pending_member):
+        """Return (zipinfo, data) pair for the member `pending_member` describes.
+
+        The member is one this writer compresses, not one copied unchanged.
+        """
+        return self._compress(
+            pending_member.pack_uri.membername,
+            pending_member.load_blob(),
+            pending_member.content_type,
+        )
+
+    def _new_zipinfo(self, membername, compress_type):
+        """Return new `ZipInfo` object for a member this writer compresses.
+
+        CRC and sizes are not set.
+        """
+        zipinfo = zipfile.ZipInfo(membername, self._date_time)
+        zipinfo.compress_type = compress_type
+        zipinfo.external_attr = 0o600 << 16
+        return zipinfo
+
+    @lazyproperty
+    def _date_time(self):
+        """Modification time recorded for each member this writer compresses.
+
+        This is the time of the first write, as a six-tuple like `ZipInfo.date_time`.
+        """
+        return time.localtime(time.time())[:6]
+
+    def _write_blob_by_zipfile(self, pack_uri, file_blob, content_type):
+        """Write content of `file_blob` by way of the public `ZipFile` interface.
+
+        It's written chunk by chunk where `ZipFile.open()` can open a member for
+        writing, and read into memory and written all at once otherwise.
+        """
+        if not _ZIPFILE_OPENS_FOR_WRITING:
+            self.write(pack_uri, file_blob.read(), content_type)
+            return
+        compress_type, _ = self._compression.zip_settings_for(content_type)
+        zipinfo = self._new_zipinfo(pack_uri.membername, compress_type)
+        zipinfo.file_size = file_blob.size
+        with self._zipf.open(zipinfo, "w") as f:
+            for chunk in file_blob.iter_chunks():
+                f.write(chunk)
+
+    def _write_chunks(self, zipinfo, chunks):
+        """Append member described by `zipinfo` having compressed bytes in `chunks`.
+
+        `zipinfo` must be complete, including CRC and sizes. This is what
+        `ZipFile.writestr()` does once the bytes are compressed; because the header is
+        complete when written, there's no need to seek back and rewrite it. `chunks` is
+        an iterable of bytes, written one at a time.
+        """
+        zipf = self._zipf
+        zip64 = max(zipinfo.file_size, zipinfo.compress_size) > zipfile.ZIP64_LIMIT
+        with zipf._lock:
+            self._start_member(zipinfo, zip64)
+            for chunk in chunks:
+                zipf.fp.write(chunk)
+            self._end_member(zipinfo)
+
+    def _write_member(self, zipinfo, data):
+        """Append member described by `zipinfo` having compressed bytes `data`."""
+        self._write_chunks(zipinfo, (data,))
+
+    def _write_pending(self, pending):
+        """Write the member `pending` stands for, as `iter_write_members()` queues it.
+
+        `pending` is either the future of a (zipinfo, data) pair from `_prepare()` or
+        the |_PendingMember| object of a member copied unchanged.
+        """
+        if isinstance(pending, _PendingMember):
+            self.write_raw(pending.pack_uri, pending.raw_member)
+        else:
+            self._write_member(*pending.result())
+
+    def _end_member(self, zipinfo):
+        """Record member described by `zipinfo` once all its bytes are written.
+
+        Must be called while holding the zip file lock, see `_start_member()`.
+        """
+        zipf = self._zipf
+        zipf.start_dir = zipf.fp.tell()
+        zipf.filelist.append(zipinfo)
+        zipf.NameToInfo[zipinfo.filename] = zipinfo
+
+    def _start_member(self, zipinfo, zip64):
+        """Write the local header of a new member described by `zipinfo`.
+
+        The member's bytes are written next, followed by a call to `_end_member()`, all
+        while holding the zip file lock.
+        """
+        zipf = self._zipf
+        if zipf._seekable:
+            zipf.fp.seek(zipf.start_dir)
+        zipinfo.header_offset = zipf.fp.tell()
+        zipf._writecheck(zipinfo)
+        zipf._didModify = True
+        zipf.fp.write(zipinfo.FileHeader(zip64))
 
     @lazyproperty
     def _zipf(self):
-        """`ZipFile` instance open for writing."""
-        return zipfile.ZipFile(self._pkg_file, "w", compression=zipfile.ZIP_DEFLATED)
+        """`ZipFile` instance open for writing.
+
+        A file-like object lacking any of `.flush()`, `.seek()` and `.tell()` is
+        written to by way of a |_WriteOnlyFile| adapter, so one that has only `.write()`
+        works.
+        """
+        pkg_file = self._pkg_file
+        if not is_string(pkg_file) and not all(
+            hasattr(pkg_file, name) for name in ("flush", "seek", "tell")
+        ):
+            pkg_file = _WriteOnlyFile(pkg_file)
+        return zipfile.ZipFile(pkg_file, "w", compression=zipfile.ZIP_DEFLATED)
+
+
+class _ChunkSink(object):
+    """Write-only file-like object that holds what is written to it until drained.
+
+    It can neither seek nor tell, so a `ZipFile` object writing to it does neither.
+    """
+
+    def __init__(self):
+        self._chunks = []
+
+    def drain(self):
+        """Return bytes written since the prior call, clearing them from this sink."""
+        chunk = b"".join(self._chunks)
+        self._chunks = []
+        return chunk
+
+    def flush(self):
+        """Do nothing, there is nowhere to flush written bytes to."""
+
+    def write(self, data):
+        """Hold `data` until the next call to :meth:`drain`."""
+        self._chunks.append(bytes(data))
+        return len(data)
+
+
+class _WriteOnlyFile(object):
+    """Adapts a file-like object that may have only a `.write()` method for `ZipFile`.
+
+    `ZipFile` calls `.flush()` on its output when it closes and calls `.tell()` to
+    learn where each member starts, so this adapter provides both; it counts the bytes
+    written to know its position. It can't seek, so `ZipFile` writes a data descriptor
+    after each member rather than going back to fill in its header.
+    """
+
+    def __init__(self, file):
+        self._file = file
+        self._position = 0
+
+    def flush(self):
+        """Flush the adapted file when it can be, otherwise do nothing."""
+        flush = getattr(self._file, "flush", None)
+        if flush is not None:
+            flush()
+
+    def tell(self):
+        """Return the number of bytes written so far."""
+        return self._position
+
+    def write(self, data):
+        """Write `data` to the adapted file."""
+        self._file.write(data)
+        self._position += len(data)
+        return len(data)
+
+
+class _PendingMember(object):
+    """A member to be written to a physical package, before its bytes are produced.
+
+    `load_blob` is a callable taking no arguments that returns the member's bytes.
+    `raw_member` is a |_RawZipMember| object to be copied when the member is
+    copied unchanged from a source package, and `file_blob` is a |BaseBlob| object to
+    be written in chunks when the member's content is not in memory. `load_blob` is not
+    used in either of those cases.
+    """
+
+    def __init__(
+        self, pack_uri, content_type, load_blob=None, raw_member=None, file_blob=None
+    ):
+        self._pack_uri = pack_uri
+        self._content_type = content_type
+        self._load_blob = load_blob
+        self._raw_member = raw_member
+        self._file_blob = file_blob
+
+    @property
+    def content_type(self):
+        """Content-type str of the member, |None| when it is copied unchanged."""
+        return self._content_type
+
+    @property
+    def file_blob(self):
+        """Optional |BaseBlob| object to write the content of in chunks."""
+        return self._file_blob
+
+    def load_blob(self):
+        """Return bytes of this member, serializing the part it comes from."""
+        return self._load_blob()
+
+    @property
+    def pack_uri(self):
+        """|PackURI| the member is written to."""
+        return self._pack_uri
+
+    @property
+    def raw_member(self):
+        """Optional |_RawZipMember| to be copied unchanged."""
+        return self._raw_member
+
+
+class _RawZipMember(object):
+    """A zip archive member in its compressed form, as stored in the archive.
+
+    `zipinfo` is the `ZipInfo` object describing the member in its source archive. Its
+    compressed bytes, at `data_offset` in that archive, are read by way of
+    `zip_reader`, a |_ZipPkgReader| object, only when needed and in chunks.
+    """
+
+    def __init__(self, zipinfo, zip_reader, data_offset):
+        self._zipinfo = zipinfo
+        self._zip_reader = zip_reader
+        self._data_offset = data_offset
+
+    @property
+    def blob(self):
+        """bytes of this member after decompression."""
+        if self._zipinfo.compress_type == zipfile.ZIP_STORED:
+            return self.data
+        return zlib.decompress(self.data, -zlib.MAX_WBITS)
+
+    @staticmethod
+    def can_copy(zipinfo):
+        """True when member described by `zipinfo` can be copied to another archive.
+
+        Encrypted members and those compressed other than by deflate are excluded.
+        """
+        if zipinfo.flag_bits & 0x1:
+            return False
+        return zipinfo.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+
+    @property
+    def data(self):
+        """bytes of this member exactly as stored in the zip archive, all at once."""
+        return b"".join(self.iter_chunks())
+
+    def iter_chunks(self, chunk_size=CHUNK_SIZE):
+        """Generate the bytes of this member as stored, each chunk `chunk_size` at most.
+
+        Only one chunk is in memory at a time, so even a large member can be copied.
+        """
+        return self._zip_reader.iter_stored(
+            self._data_offset, self._zipinfo.compress_size, chunk_size
+        )
+
+    @staticmethod
+    def key(zipinfo):
+        """Return tuple of `zipinfo` values that identify a zip member's content."""
+        return (
+            zipinfo.filename,
+            zipinfo.header_offset,
+            zipinfo.compress_type,
+            zipinfo.CRC,
+            zipinfo.compress_size,
+            zipinfo.file_size,
+        )
+
+    @property
+    def zipinfo(self):
+        """`ZipInfo` object describing this member in its source archive."""
+        return self._zipinfo
+
+
+class CompressionPolicy(object):
+    """Determines how each part is compressed when a package is saved.
+
+    `level` is the zlib compression level (0-9) used to deflate a part, where 1 is
+    fastest and 9 produces the smallest output. The zlib default level (6) is used when
+    `level` is |None|. `xml_level` is the level used for XML parts, and defaults to
+    `level`. A part having a content type in `stored_content_types` is stored without
+    compression. Compressing content such as a JPEG image or MP4 video, which is already
+    compressed, costs time while gaining nothing in size, and is a typical use.
+
+    A part copied unchanged from the package it was loaded from keeps the compression it
+    has there.
+
+    Some commonly useful policies are available as class attributes::
+
+        CompressionPolicy.DEFAULT  # -- deflate everything at the default level --
+        CompressionPolicy.FAST  # -- store compressed content, deflate the rest at 1 --
+        CompressionPolicy.SMALLEST  # -- deflate everything at level 9 --
+
+    Any of these can be passed to :meth:`.Presentation.save`, as can a custom instance.
+    """
+
+    #: Content types of parts whose content is itself compressed, such that deflating
+    #: it typically gains nothing.
+    COMPRESSED_CONTENT_TYPES = frozenset(
+        (
+            CT.ASF,
+            CT.AVI,
+            CT.GIF,
+            CT.JPEG,
+            CT.MOV,
+            CT.MP4,
+            CT.MPG,
+            CT.MS_PHOTO,
+            CT.MS_VIDEO,
+            CT.PML_PRESENTATION,
+            CT.PNG,
+            CT.SML_SHEET,
+            CT.SWF,
+            CT.WML_DOCUMENT,
+            CT.WMV,
+            CT.X_MS_VIDEO,
+        )
+    )
+
+    def __init__(self, level=None, xml_level=None, stored_content_types=()):
+        self._level = level
+        self._xml_level = level if xml_level is None else xml_level
+        self._stored_content_types = frozenset(stored_content_types)
+
+    def zip_settings_for(self, content_type):
+        """Return (compress_type, compresslevel) pair for a part of `content_type`.
+
+        The returned values are suitable for use with `ZipFile.writestr()`.
+        """
+        if content_type in self._stored_content_types:
+            return zipfile.ZIP_STORED, None
+        if content_type is not None and (
+            content_type == CT.XML or content_type.endswith("+xml")
+        ):
+            return zipfile.ZIP_DEFLATED, self._xml_level
+        return zipfile.ZIP_DEFLATED, self._level
+
+
+CompressionPolicy.DEFAULT = CompressionPolicy()
+CompressionPolicy.FAST = CompressionPolicy(
+    level=1, stored_content_types=CompressionPolicy.COMPRESSED_CONTENT_TYPES
+)
+CompressionPolicy.SMALLEST = CompressionPolicy(level=9)
 
 
 class _ContentTypesItem(object):
@@ -277,3 +1319,35 @@ class _ContentTypesItem(object):
                 overrides[partname] = content_type
 
         return defaults, overrides
+
+
+def _blob_loader(part):
+    """Return callable that returns the blob of `part` when called."""
+    return lambda: part.blob
+
+
+def _rels_xml_loader(part):
+    """Return callable that returns the rels item XML of `part` when called."""
+    return lambda: part.rels.xml
+
+
+def _thread_pool_executor_cls():
+    """Return `concurrent.futures.ThreadPoolExecutor` or |None| when not available.
+
+    `concurrent.futures` is not in the Python 2 standard library.
+    """
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+    except ImportError:  # pragma: no cover
+        return None
+    return ThreadPoolExecutor
+
+
+def _replace_file(src_path, dst_path):
+    """Rename file at `src_path` to `dst_path`, replacing any file already there.
+
+    `os.replace()` is not available on Python 2, where `os.rename()` does the same
+    except on Windows.
+    """
+    replace = getattr(os, "replace", os.rename)
+    replace(src_path, dst_path)
@@ -12,7 +12,12 @@ from pptx.oxml.shapes.connector import CT_Connector
 from pptx.oxml.shapes.graphfrm import CT_GraphicalObjectFrame
 from pptx.oxml.shapes.picture import CT_Picture
 from pptx.oxml.shapes.shared import BaseShapeElement
-from pptx.oxml.xmlchemy import BaseOxmlElement, OneAndOnlyOne, ZeroOrOne
+from pptx.oxml.xmlchemy import (
+    BaseOxmlElement,
+    OneAndOnlyOne,
+    ZeroOrOne,
+    _compiled_xpath,
+)
 from pptx.util import Emu
 
 
@@ -156,7 +161,7 @@ class CT_GroupShape(BaseShapeElement):
         In practice, its minimum value is 1 because the spTree element itself
         is always assigned id="1".
         """
-        id_str_lst = self.xpath("//@id")
+        id_str_lst = self._id_values
         used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
         return max(used_ids) if used_ids else 0
 
@@ -233,6 +238,15 @@ class CT_GroupShape(BaseShapeElement):
 
         return x, y, cx, cy
 
+    @property
+    def _id_values(self):
+        """Every @id value in this document, as plain strings.
+
+        The "smart" strings `.xpath()` returns, which know their parent element, are
+        slow to form by the thousand.
+        """
+        return _compiled_xpath("//@id", smart_strings=False)(self)
+
     @property
     def _next_shape_id(self):
         """Return unique shape id suitable for use with a new shape element.
@@ -242,8 +256,8 @@ class CT_GroupShape(BaseShapeElement):
         numbering. In practice, the minimum id is 2 because the spTree
         element itself is always assigned id="1".
         """
-        id_str_lst = self.xpath("//@id")
-        used_ids = [int(id_str) for id_str in id_str_lst if id_str.isdigit()]
+        id_str_lst = self._id_values
+        used_ids = set(int(id_str) for id_str in id_str_lst if id_str.isdigit())
         for n in range(1, len(used_ids) + 2):
             if n not in used_ids:
                 return n
@@ -8,6 +8,7 @@ classes.
 from __future__ import absolute_import, print_function
 
 import re
+import threading
 
 from lxml import etree
 
@@ -15,6 +16,7 @@ from . import oxml_parser
 from ..compat import Unicode
 from ..exc import InvalidXmlError
 from .ns import NamespacePrefixedTag, _nsmap, qn
+from .simpletypes import BaseSimpleType, BaseStringType
 from ..util import lazyproperty
 
 
@@ -30,6 +32,42 @@ def OxmlElement(nsptag_str, nsmap=None):
     return oxml_parser.makeelement(nsptag.clark_name, nsmap=nsmap)
 
 
+class _CompiledXPaths(threading.local):
+    """Compiled XPath expressions by expression string, a separate cache per thread.
+
+    lxml evaluates an `etree.XPath` object for one thread at a time, so threads sharing
+    one would wait on each other.
+    """
+
+    def __init__(self):
+        self.cache = {}
+
+
+# --- compiled XPath expressions, shared by all elements. A thread's cache is cleared
+# --- when full, which only a stream of expressions formatted with values, like an
+# --- index, can cause.
+_compiled_xpaths = _CompiledXPaths()
+_COMPILED_XPATHS_MAX = 512
+
+
+def _compiled_xpath(xpath_str, smart_strings=True):
+    """Return `etree.XPath` object for `xpath_str`, compiled on its first use.
+
+    Each thread compiles its own, see |_CompiledXPaths|. `smart_strings=False` compiles
+    an expression that returns plain strings, which are faster to form.
+    """
+    cache = _compiled_xpaths.cache
+    key = (xpath_str, smart_strings)
+    xpath = cache.get(key)
+    if xpath is None:
+        if len(cache) >= _COMPILED_XPATHS_MAX:
+            cache.clear()
+        xpath = cache[key] = etree.XPath(
+            xpath_str, namespaces=_nsmap, smart_strings=smart_strings
+        )
+    return xpath
+
+
 def serialize_for_reading(element):
     """
     Serialize *element* to human-readable XML suitable for tests. No XML
@@ -102,6 +140,12 @@ class XmlString(Unicode):
         return front, attrs, close, text
 
 
+# --- functions underlying the `from_xml()` of a simple type that returns the attribute
+# --- string unchanged, recognized so attribute getters can skip calling it.
+_from_xml_func = BaseSimpleType.from_xml.__func__
+_convert_string_from_xml_func = BaseStringType.convert_from_xml.__func__
+
+
 class MetaOxmlElement(type):
     """
     Metaclass for BaseOxmlElement
@@ -152,12 +196,28 @@ class BaseAttribute(object):
         # assign unconditionally to overwrite element name definition
         setattr(self._element_cls, self._prop_name, property_)
 
-    @property
+    @lazyproperty
     def _clark_name(self):
         if ":" in self._attr_name:
             return qn(self._attr_name)
         return self._attr_name
 
+    @lazyproperty
+    def _from_xml(self):
+        """
+        Return the function converting an attribute string to its Python
+        value, or |None| when the simple type returns the string unchanged,
+        as string types do, so the getter can skip the call.
+        """
+        simple_type = self._simple_type
+        from_xml = getattr(simple_type, "from_xml", None)
+        convert_from_xml = getattr(simple_type, "convert_from_xml", None)
+        if getattr(from_xml, "__func__", None) is _from_xml_func and getattr(
+            convert_from_xml, "__func__", None
+        ) is _convert_string_from_xml_func:
+            return None
+        return from_xml
+
 
 class OptionalAttribute(BaseAttribute):
     """
@@ -190,11 +250,15 @@ class OptionalAttribute(BaseAttribute):
         property descriptor.
         """
 
+        clark_name, default, from_xml = self._clark_name, self._default, self._from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
-                return self._default
-            return self._simple_type.from_xml(attr_str_value)
+                return default
+            if from_xml is None:
+                return attr_str_value
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -206,13 +270,19 @@ class OptionalAttribute(BaseAttribute):
         property descriptor.
         """
 
+        clark_name, default, to_xml = (
+            self._clark_name,
+            self._default,
+            self._simple_type.to_xml,
+        )
+
         def set_attr_value(obj, value):
-            if value == self._default:
-                if self._clark_name in obj.attrib:
-                    del obj.attrib[self._clark_name]
+            if value == default:
+                attrib = obj.attrib
+                if clark_name in attrib:
+                    del attrib[clark_name]
                 return
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            obj.set(clark_name, to_xml(value))
 
         return set_attr_value
 
@@ -234,14 +304,18 @@ class RequiredAttribute(BaseAttribute):
         property descriptor.
         """
 
+        clark_name, from_xml = self._clark_name, self._from_xml
+
         def get_attr_value(obj):
-            attr_str_value = obj.get(self._clark_name)
+            attr_str_value = obj.get(clark_name)
             if attr_str_value is None:
                 raise InvalidXmlError(
                     "required '%s' attribute not present on element %s"
                     % (self._attr_name, obj.tag)
                 )
-            return self._simple_type.from_xml(attr_str_value)
+            if from_xml is None:
+                return attr_str_value
+            return from_xml(attr_str_value)
 
         get_attr_value.__doc__ = self._docstring
         return get_attr_value
@@ -264,9 +338,10 @@ class RequiredAttribute(BaseAttribute):
         property descriptor.
         """
 
+        clark_name, to_xml = self._clark_name, self._simple_type.to_xml
+
         def set_attr_value(obj, value):
-            str_value = self._simple_type.to_xml(value)
-            obj.set(self._clark_name, str_value)
+            obj.set(clark_name, to_xml(value))
 
         return set_attr_value
 
@@ -296,13 +371,14 @@ class _BaseChildElement(object):
         element.
         """
 
+        new_method_name = self._new_method_name
+        insert_method_name = self._insert_method_name
+
         def _add_child(obj, **attrs):
-            new_method = getattr(obj, self._new_method_name)
-            child = new_method()
+            child = getattr(obj, new_method_name)()
             for key, value in attrs.items():
                 setattr(child, key, value)
-            insert_method = getattr(obj, self._insert_method_name)
-            insert_method(child)
+            getattr(obj, insert_method_name)(child)
             return child
 
         _add_child.__doc__ = (
@@ -338,8 +414,15 @@ class _BaseChildElement(object):
         element.
         """
 
+        successor_clark_names = self._successor_clark_names
+
         def _insert_child(obj, child):
-            obj.insert_element_before(child, *self._successors)
+            for clark_name in successor_clark_names:
+                successor = next(obj.iterchildren(clark_name), None)
+                if successor is not None:
+                    successor.addprevious(child)
+                    return child
+            obj.append(child)
             return child
 
         _insert_child.__doc__ = (
@@ -370,15 +453,26 @@ class _BaseChildElement(object):
             return
         setattr(self._element_cls, name, method)
 
+    @lazyproperty
+    def _clark_name(self):
+        """
+        Clark-notation qualified tag name of this child element, like
+        ``'{http://schemas.../main}txBody'``, computed once rather than on
+        each access.
+        """
+        return qn(self._nsptagname)
+
     @property
     def _creator(self):
         """
         Return a function object that creates a new, empty element of the
         right type, having no attributes.
         """
+        nsptag = NamespacePrefixedTag(self._nsptagname)
+        clark_name, nsmap = nsptag.clark_name, nsptag.nsmap
 
         def new_child_element(obj):
-            return OxmlElement(self._nsptagname)
+            return oxml_parser.makeelement(clark_name, nsmap=nsmap)
 
         return new_child_element
 
@@ -390,8 +484,10 @@ class _BaseChildElement(object):
         matching tag name or |None| if not present.
         """
 
+        clark_name = self._clark_name
+
         def get_child_element(obj):
-            return obj.find(qn(self._nsptagname))
+            return next(obj.iterchildren(clark_name), None)
 
         get_child_element.__doc__ = (
             "``<%s>`` child element or |None| if not present." % self._nsptagname
@@ -409,8 +505,10 @@ class _BaseChildElement(object):
         property descriptor.
         """
 
+        clark_name = self._clark_name
+
         def get_child_element_list(obj):
-            return obj.findall(qn(self._nsptagname))
+            return list(obj.iterchildren(clark_name))
 
         get_child_element_list.__doc__ = (
             "A list containing each of the ``<%s>`` child elements, in the o"
@@ -426,6 +524,14 @@ class _BaseChildElement(object):
     def _new_method_name(self):
         return "_new_%s" % self._prop_name
 
+    @lazyproperty
+    def _successor_clark_names(self):
+        """
+        Tuple of the Clark-notation tag names of the elements this child
+        element is inserted before, in the order they are searched for.
+        """
+        return tuple(qn(tagname) for tagname in self._successors)
+
 
 class Choice(_BaseChildElement):
     """
@@ -457,15 +563,16 @@ class Choice(_BaseChildElement):
         child element.
         """
 
+        prop_name = self._prop_name
+        remove_group_method_name = self._remove_group_method_name
+        add_method_name = self._add_method_name
+
         def get_or_change_to_child(obj):
-            child = getattr(obj, self._prop_name)
+            child = getattr(obj, prop_name)
             if child is not None:
                 return child
-            remove_group_method = getattr(obj, self._remove_group_method_name)
-            remove_group_method()
-            add_method = getattr(obj, self._add_method_name)
-            child = add_method()
-            return child
+            getattr(obj, remove_group_method_name)()
+            return getattr(obj, add_method_name)()
 
         get_or_change_to_child.__doc__ = (
             "Return the ``<%s>`` child, replacing any other group element if" " found."
@@ -514,8 +621,10 @@ class OneAndOnlyOne(_BaseChildElement):
         descriptor.
         """
 
+        clark_name = self._clark_name
+
         def get_child_element(obj):
-            child = obj.find(qn(self._nsptagname))
+            child = next(obj.iterchildren(clark_name), None)
             if child is None:
                 raise InvalidXmlError(
                     "required ``<%s>`` child element not present" % self._nsptagname
@@ -551,10 +660,10 @@ class OneOrMore(_BaseChildElement):
         Add a public ``add_x()`` method to the parent element class.
         """
 
+        add_method_name = self._add_method_name
+
         def add_child(obj):
-            private_add_method = getattr(obj, self._add_method_name)
-            child = private_add_method()
-            return child
+            return getattr(obj, add_method_name)()
 
         add_child.__doc__ = (
             "Add a new ``<%s>`` child element unconditionally, inserted in t"
@@ -613,11 +722,12 @@ class ZeroOrOne(_BaseChildElement):
         child element.
         """
 
+        prop_name, add_method_name = self._prop_name, self._add_method_name
+
         def get_or_add_child(obj):
-            child = getattr(obj, self._prop_name)
+            child = getattr(obj, prop_name)
             if child is None:
-                add_method = getattr(obj, self._add_method_name)
-                child = add_method()
+                child = getattr(obj, add_method_name)()
             return child
 
         get_or_add_child.__doc__ = (
@@ -631,8 +741,11 @@ class ZeroOrOne(_BaseChildElement):
         element.
         """
 
+        clark_name = self._clark_name
+
         def _remove_child(obj):
-            obj.remove_all(self._nsptagname)
+            for child in list(obj.iterchildren(clark_name)):
+                obj.remove(child)
 
         _remove_child.__doc__ = (
             "Remove all ``<%s>`` child elements."
@@ -682,9 +795,11 @@ class ZeroOrOneChoice(_BaseChildElement):
         group.
         """
 
+        member_clark_names = self._member_clark_names
+
         def _remove_choice_group(obj):
-            for tagname in self._member_nsptagnames:
-                obj.remove_all(tagname)
+            for child in list(obj.iterchildren(*member_clark_names)):
+                obj.remove(child)
 
         _remove_choice_group.__doc__ = (
             "Remove the current choice group child element if present."
@@ -698,8 +813,14 @@ class ZeroOrOneChoice(_BaseChildElement):
         descriptor.
         """
 
+        member_clark_names = self._member_clark_names
+
         def get_group_member_element(obj):
-            return obj.first_child_found_in(*self._member_nsptagnames)
+            for clark_name in member_clark_names:
+                child = next(obj.iterchildren(clark_name), None)
+                if child is not None:
+                    return child
+            return None
 
         get_group_member_element.__doc__ = (
             "Return the child element belonging to this element group, or "
@@ -715,6 +836,14 @@ class ZeroOrOneChoice(_BaseChildElement):
         """
         return [choice.nsptagname for choice in self._choices]
 
+    @lazyproperty
+    def _member_clark_names(self):
+        """
+        Tuple of the Clark-notation tag names of the member elements of this
+        choice group, in the order of `_member_nsptagnames`.
+        """
+        return tuple(qn(tagname) for tagname in self._member_nsptagnames)
+
     @lazyproperty
     def _remove_choice_group_method_name(self):
         return "_remove_%s" % self._prop_name
@@ -787,9 +916,10 @@ class _OxmlElementBase(etree.ElementBase):
     def xpath(self, xpath_str):
         """
         Override of ``lxml`` _Element.xpath() method to provide standard Open
-        XML namespace mapping in centralized location.
+        XML namespace mapping in centralized location. The expression is
+        compiled only the first time it's evaluated; see `_compiled_xpath()`.
         """
-        return super(BaseOxmlElement, self).xpath(xpath_str, namespaces=_nsmap)
+        return _compiled_xpath(xpath_str)(self)
 
 
 BaseOxmlElement = MetaOxmlElement(
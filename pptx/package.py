@@ -49,25 +49,7 @@ class Package(OpcPackage):
         partname, by sequence number. *ext* is used as the extention on the
         returned partname.
         """
-
-        def first_available_image_idx():
-            image_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if (
-                        part.partname.startswith("/ppt/media/image")
-                        and part.partname.idx is not None
-                    )
-                ]
-            )
-            for i, image_idx in enumerate(image_idxs):
-                idx = i + 1
-                if idx < image_idx:
-                    return idx
-            return len(image_idxs) + 1
-
-        idx = first_available_image_idx()
+        idx = self._partnames.next_available_idx("/ppt/media/image")
         return PackURI("/ppt/media/image%d.%s" % (idx, ext))
 
     def next_media_partname(self, ext):
@@ -77,22 +59,7 @@ class Package(OpcPackage):
         sequence numbers are reused. *ext* is used as the extension on the
         returned partname.
         """
-
-        def first_available_media_idx():
-            media_idxs = sorted(
-                [
-                    part.partname.idx
-                    for part in self.iter_parts()
-                    if part.partname.startswith("/ppt/media/media")
-                ]
-            )
-            for i, media_idx in enumerate(media_idxs):
-                idx = i + 1
-                if idx < media_idx:
-                    return idx
-            return len(media_idxs) + 1
-
-        idx = first_available_media_idx()
+        idx = self._partnames.next_available_idx("/ppt/media/media")
         return PackURI("/ppt/media/media%d.%s" % (idx, ext))
 
     @property
@@ -108,8 +75,32 @@ class Package(OpcPackage):
         |_ImageParts| object providing access to the image parts in this
         package.
         """
+        # --- dropped parts are known from `_referrers`, formed from the same graph ---
+        self._referrers
         return _ImageParts(self)
 
+    def _part_dropped(self, part):
+        """Extends the base method to also drop `part` from its SHA1 index."""
+        super(Package, self)._part_dropped(part)
+        for parts_name in ("_image_parts", "_media_parts"):
+            parts = self.__dict__.get(parts_name)
+            if parts is not None:
+                parts.part_dropped(part)
+
+    def _part_restored(self, part):
+        """Extends the base method to also restore `part` to its SHA1 index."""
+        super(Package, self)._part_restored(part)
+        for parts_name in ("_image_parts", "_media_parts"):
+            parts = self.__dict__.get(parts_name)
+            if parts is not None:
+                parts.part_restored(part)
+
+    def _reset_part_indexes(self):
+        """Extends the base method to also reset the image and media SHA1 indexes."""
+        super(Package, self)._reset_part_indexes()
+        self.__dict__.pop("_image_parts", None)
+        self.__dict__.pop("_media_parts", None)
+
     @lazyproperty
     def _media_parts(self):
         """Return |_MediaParts| object for this package.
@@ -117,6 +108,8 @@ class Package(OpcPackage):
         The media parts object provides access to all the media parts in this
         package.
         """
+        # --- dropped parts are known from `_referrers`, formed from the same graph ---
+        self._referrers
         return _MediaParts(self)
 
 
@@ -152,7 +145,10 @@ class _ImageParts(object):
         """
         image = Image.from_file(image_file)
         image_part = self._find_by_sha1(image.sha1)
-        return ImagePart.new(self._package, image) if image_part is None else image_part
+        if image_part is None:
+            image_part = ImagePart.new(self._package, image)
+            self._image_parts_by_sha1[image.sha1] = image_part
+        return image_part
 
     def _find_by_sha1(self, sha1):
         """
@@ -160,13 +156,38 @@ class _ImageParts(object):
         no matching image part is found. The image part is identified by the
         SHA1 hash digest of the image binary it contains.
         """
+        return self._image_parts_by_sha1.get(sha1)
+
+    def part_dropped(self, part):
+        """Remove `part` from the SHA1 index when indexed, it's no longer in package."""
+        image_parts_by_sha1 = self.__dict__.get("_image_parts_by_sha1")
+        if image_parts_by_sha1 is None or not isinstance(part, ImagePart):
+            return
+        if image_parts_by_sha1.get(part.sha1) is part:
+            del image_parts_by_sha1[part.sha1]
+
+    def part_restored(self, part):
+        """Index `part`, dropped from the package earlier, by SHA1 again."""
+        image_parts_by_sha1 = self.__dict__.get("_image_parts_by_sha1")
+        if image_parts_by_sha1 is None or not isinstance(part, ImagePart):
+            return
+        image_parts_by_sha1.setdefault(part.sha1, part)
+
+    @lazyproperty
+    def _image_parts_by_sha1(self):
+        """dict {sha1: image_part} of the image parts in the package.
+
+        Formed from the package on first use and kept current as image parts are
+        created and dropped from the package. Where two image parts contain the same
+        image, the first is indexed.
+        """
+        image_parts_by_sha1 = {}
         for image_part in self:
             # ---skip unknown/unsupported image types, like SVG---
             if not hasattr(image_part, "sha1"):
                 continue
-            if image_part.sha1 == sha1:
-                return image_part
-        return None
+            image_parts_by_sha1.setdefault(image_part.sha1, image_part)
+        return image_parts_by_sha1
 
 
 class _MediaParts(object):
@@ -207,6 +228,7 @@ class _MediaParts(object):
         media_part = self._find_by_sha1(media.sha1)
         if media_part is None:
             media_part = MediaPart.new(self._package, media)
+            self._media_parts_by_sha1[media.sha1] = media_part
         return media_part
 
     def _find_by_sha1(self, sha1):
@@ -216,7 +238,35 @@ class _MediaParts(object):
         part is identified by the SHA1 hash digest of its bytestream
         ("file").
         """
+        return self._media_parts_by_sha1.get(sha1)
+
+    def part_dropped(self, part):
+        """Remove `part` from the SHA1 index when indexed, it's no longer in package."""
+        media_parts_by_sha1 = self.__dict__.get("_media_parts_by_sha1")
+        if media_parts_by_sha1 is None or not isinstance(part, MediaPart):
+            return
+        if media_parts_by_sha1.get(part.sha1) is part:
+            del media_parts_by_sha1[part.sha1]
+
+    def part_restored(self, part):
+        """Index `part`, dropped from the package earlier, by SHA1 again."""
+        media_parts_by_sha1 = self.__dict__.get("_media_parts_by_sha1")
+        if media_parts_by_sha1 is None or not isinstance(part, MediaPart):
+            return
+        media_parts_by_sha1.setdefault(part.sha1, part)
+
+    @lazyproperty
+    def _media_parts_by_sha1(self):
+        """dict {sha1: media_part} of the media parts in the package.
+
+        Formed from the package on first use and kept current as media parts are
+        created and dropped from the package. Where two media parts contain the same
+        media, the first is indexed.
+        """
+        media_parts_by_sha1 = {}
         for media_part in self:
-            if media_part.sha1 == sha1:
-                return media_part
-        return None
+            # ---skip a part of unrecognized media type, having no `.sha1`---
+            if not hasattr(media_part, "sha1"):
+                continue
+            media_parts_by_sha1.setdefault(media_part.sha1, media_part)
+        return media_parts_by_sha1
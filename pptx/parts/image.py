@@ -7,12 +7,8 @@ from __future__ import division
 import hashlib
 import os
 
-try:
-    from PIL import Image as PIL_Image
-except ImportError:
-    import Image as PIL_Image
-
 from pptx.compat import BytesIO, is_string
+from pptx.opc.blob import blob_sha1
 from pptx.opc.package import Part
 from pptx.opc.spec import image_content_types
 from pptx.util import lazyproperty
@@ -101,7 +97,7 @@ class ImagePart(Part):
         The SHA1 hash digest for the image binary of this image part, like:
         ``'1be010ea47803b00e140b852765cdf84f491da47'``.
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        return blob_sha1(self._blob)
 
     @property
     def _dpi(self):
@@ -280,6 +276,12 @@ class Image(object):
         A tuple containing useful image properties extracted from this image
         using Pillow (Python Imaging Library, or 'PIL').
         """
+        # ---deferred so `import pptx` doesn't load Pillow---
+        try:
+            from PIL import Image as PIL_Image
+        except ImportError:
+            import Image as PIL_Image
+
         stream = BytesIO(self._blob)
         pil_image = PIL_Image.open(stream)
         format = pil_image.format
@@ -2,8 +2,7 @@
 
 """MediaPart and related objects."""
 
-import hashlib
-
+from pptx.opc.blob import blob_sha1
 from pptx.opc.package import Part
 from pptx.util import lazyproperty
 
@@ -19,13 +18,15 @@ class MediaPart(Part):
     def new(cls, package, media):
         """Return new |MediaPart| instance containing `media`.
 
-        `media` must be a |Media| object.
+        `media` must be a |Media| object. A media object backed by a file blob is not
+        read into memory; the new part is backed by the same file blob.
         """
+        file_blob = media.file_blob
         return cls(
             package.next_media_partname(media.ext),
             media.content_type,
             package,
-            media.blob,
+            media.blob if file_blob is None else file_blob,
         )
 
     @lazyproperty
@@ -34,4 +35,4 @@ class MediaPart(Part):
 
         Example: `'1be010ea47803b00e140b852765cdf84f491da47'`
         """
-        return hashlib.sha1(self._blob).hexdigest()
+        return blob_sha1(self._blob)
@@ -92,19 +92,31 @@ class PresentationPart(XmlPart):
         Partnames are like `/ppt/slides/slide9.xml` and are assigned in the order their
         id appears in the `rIds` sequence. The name portion is always ``slide``. The
         number part forms a continuous sequence starting at 1 (e.g. 1, 2, ... 10, ...).
-        The extension is always ``.xml``.
+        The extension is always ``.xml``. The slide parts of a read-only package keep
+        the partnames they were loaded with.
         """
+        if self.package.read_only:
+            return
         for idx, rId in enumerate(rIds):
             slide_part = self.related_part(rId)
             slide_part.partname = PackURI("/ppt/slides/slide%d.xml" % (idx + 1))
 
-    def save(self, path_or_stream):
+    def iter_chunks(self, compression=None, workers=None, prune=False, dedupe=False):
+        """Generate bytes of this presentation package in successive chunks."""
+        return self.package.iter_chunks(compression, workers, prune, dedupe)
+
+    def save(
+        self, path_or_stream, compression=None, workers=None, prune=False, dedupe=False
+    ):
         """Save this presentation package to `path_or_stream`.
 
         `path_or_stream` can be either a path to a filesystem location (a string) or a
-        file-like object.
+        file-like object. `compression` is an optional |CompressionPolicy| object and
+        `workers` an optional number of threads to compress parts with. Parts no longer
+        referred to are left out when `prune` is True and parts having identical content
+        are saved only once when `dedupe` is True.
         """
-        self.package.save(path_or_stream)
+        self.package.save(path_or_stream, compression, workers, prune, dedupe)
 
     def slide_id(self, slide_part):
         """Return the slide-id associated with `slide_part`."""
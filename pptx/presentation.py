@@ -31,12 +31,73 @@ class Presentation(PartElementProxy):
         """
         return self.part.notes_master
 
-    def save(self, file):
+    def iter_chunks(
+        self, compression=None, workers=None, prune=False, dedupe=False
+    ):
         """
-        Save this presentation to *file*, where *file* can be either a path
-        to a file (a string) or a file-like object.
+        Generate the bytes of this presentation, as :meth:`save` would write
+        them, in successive chunks. This allows a presentation to be sent,
+        to an HTTP client for example, as it is serialized rather than being
+        assembled in memory first. *compression*, *workers*, *prune* and
+        *dedupe* are as described for :meth:`save`.
+        """
+        return self.part.iter_chunks(compression, workers, prune, dedupe)
+
+    def save(self, file, compression=None, workers=None, prune=False, dedupe=False):
         """
-        self.part.save(file)
+        Save this presentation to *file*, where *file* can be either a path
+        to a file (a string) or a file-like object. A file-like object need
+        only have a ``write()`` method, so a pipe or a socket file works.
+        When *file* is the path of an existing directory, the presentation is
+        saved as an expanded (unzipped) package in that directory, and files
+        whose content hasn't changed are not rewritten.
+
+        *compression* is an optional |CompressionPolicy| object determining
+        how each part is compressed, such as ``CompressionPolicy.FAST``,
+        which stores already-compressed media like JPEG images without
+        deflating them again. The zlib default level is used for all parts
+        when it is omitted.
+
+        *workers* is the optional number of threads used to serialize and
+        compress parts, which can make saving a large presentation faster on
+        a multi-core machine. The file produced is the same regardless.
+
+        When *prune* is |True|, parts no longer used are left out of the
+        saved file, such as the image of a picture shape or the chart of a
+        graphic frame that has been removed from its slide. A relationship
+        to an image, chart, media, embedded object or hyperlink is dropped
+        when the XML of its slide (or other part) no longer refers to it.
+
+        When *dedupe* is |True|, parts having identical content, such as the
+        same image inserted on several slides from different files, are
+        saved only once and shared. Only images, media, embedded objects and
+        similar self-contained parts are collapsed this way; slides, layouts,
+        masters and themes are always saved as they are.
+        """
+        self.part.save(file, compression, workers, prune, dedupe)
+
+    def save_async(
+        self,
+        file,
+        compression=None,
+        workers=None,
+        prune=False,
+        dedupe=False,
+        executor=None,
+    ):
+        """
+        Return a coroutine that saves this presentation to *file* without
+        blocking the running asyncio event loop, for use as ``await
+        prs.save_async(file)``. The package is serialized in *executor*, the
+        loop's default executor when |None|, one part at a time and each
+        chunk is written to *file* before the next part is serialized. *file*
+        can also be an asyncio-style stream, such as an
+        ``asyncio.StreamWriter`` or an aiohttp response. Other arguments are
+        as described for :meth:`save`. Requires Python 3.5 or later.
+        """
+        from pptx.aio import save_async
+
+        return save_async(self, file, compression, workers, prune, dedupe, executor)
 
     @property
     def slide_height(self):
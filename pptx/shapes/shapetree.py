@@ -300,7 +300,8 @@ class _BaseGroupShapes(_BaseShapes):
 
         `object_file` may either be a str path to a file or file-like object (such as
         `io.BytesIO`) containing the bytes of the object to be embedded (such as an
-        Excel file).
+        Excel file). A file at a path of 16 MB or more is read only when the
+        presentation is saved, so it must stay in place, unchanged, until then.
 
         `prog_id` can be either a member of `pptx.enum.shapes.PROG_ID` or a str value
         like `"Adobe.Exchange.7"` determined by inspecting the XML generated by
@@ -539,6 +540,9 @@ class SlideShapes(_BaseGroupShapes):
         *top*), having size (*width*, *height*), and containing *movie_file*.
         Before the video is started, *poster_frame_image* is displayed as
         a placeholder for the video.
+
+        A video file at a path of 16 MB or more is read only when the
+        presentation is saved, so it must stay in place, unchanged, until then.
         """
         movie_pic = _MoviePicElementCreator.new_movie_pic(
             self,
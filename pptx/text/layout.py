@@ -2,8 +2,6 @@
 
 """Objects related to layout of rendered text, such as TextFitter."""
 
-from PIL import ImageFont
-
 
 class TextFitter(tuple):
     """
@@ -293,6 +291,9 @@ class _Fonts(object):
 
     @classmethod
     def font(cls, font_path, point_size):
+        # imported here, only text fitting needs it
+        from PIL import ImageFont
+
         if (font_path, point_size) not in cls.fonts:
             cls.fonts[(font_path, point_size)] = ImageFont.truetype(
                 font_path, point_size
@@ -0,0 +1,111 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.opc.blob` module."""
+
+import hashlib
+import mmap
+import zipfile
+
+import pytest
+
+from pptx.compat import BytesIO
+from pptx.opc.blob import (
+    BufferBlob,
+    FileBlob,
+    ZipMemberBlob,
+    blob_bytes,
+    blob_from_path,
+    blob_sha1,
+)
+
+from ..unitutil.file import absjoin, test_file_dir
+
+
+test_video_path = absjoin(test_file_dir, "dummy.mp4")
+
+
+class DescribeBufferBlob(object):
+    """Unit-test suite for `pptx.opc.blob.BufferBlob` objects."""
+
+    def it_can_read_its_buffer_in_chunks(self):
+        blob = BufferBlob(bytearray(b"0123456789"))
+
+        assert list(blob.iter_chunks(4)) == [b"0123", b"4567", b"89"]
+        assert blob.read() == b"0123456789"
+        assert blob.size == 10
+
+    def it_can_read_an_mmap(self):
+        with open(test_video_path, "rb") as f:
+            expected_bytes = f.read()
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        blob = BufferBlob(buffer)
+
+        assert blob.read() == expected_bytes
+        assert blob.size == len(expected_bytes)
+        assert blob.sha1 == hashlib.sha1(expected_bytes).hexdigest()
+        buffer.close()
+
+
+class DescribeFileBlob(object):
+    """Unit-test suite for `pptx.opc.blob.FileBlob` objects."""
+
+    def it_can_read_its_file_in_chunks(self, tmpdir):
+        path = tmpdir.join("foo.bin")
+        path.write_binary(b"0123456789")
+
+        blob = FileBlob(str(path))
+
+        assert list(blob.iter_chunks(4)) == [b"0123", b"4567", b"89"]
+        assert blob.read() == b"0123456789"
+        assert blob.size == 10
+        assert blob.path == str(path)
+
+    def it_knows_the_sha1_hash_of_its_file(self):
+        with open(test_video_path, "rb") as f:
+            expected_value = hashlib.sha1(f.read()).hexdigest()
+
+        assert FileBlob(test_video_path).sha1 == expected_value
+
+
+class DescribeZipMemberBlob(object):
+    """Unit-test suite for `pptx.opc.blob.ZipMemberBlob` objects."""
+
+    @pytest.mark.parametrize(
+        "compress_type", (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+    )
+    def it_can_read_its_member_in_chunks(self, compress_type):
+        stream = BytesIO()
+        with zipfile.ZipFile(stream, "w", compress_type) as zipf:
+            zipf.writestr("ppt/media/media1.mp4", b"0123456789")
+        zipinfo = zipfile.ZipFile(stream).getinfo("ppt/media/media1.mp4")
+
+        blob = ZipMemberBlob(stream, zipinfo)
+
+        assert list(blob.iter_chunks(4)) == [b"0123", b"4567", b"89"]
+        assert blob.read() == b"0123456789"
+        assert blob.size == 10
+
+
+class Describe_blob_functions(object):
+    """Unit-test suite for `pptx.opc.blob` module-level functions."""
+
+    @pytest.mark.parametrize("is_blob_object", (True, False))
+    def it_can_get_the_bytes_of_a_blob(self, is_blob_object):
+        blob = BufferBlob(b"foobar") if is_blob_object else b"foobar"
+        assert blob_bytes(blob) == b"foobar"
+
+    @pytest.mark.parametrize("min_size, is_file_blob", ((0, True), (1 << 30, False)))
+    def it_can_get_the_blob_of_the_file_at_a_path(self, min_size, is_file_blob):
+        with open(test_video_path, "rb") as f:
+            video_bytes = f.read()
+
+        blob = blob_from_path(test_video_path, min_size)
+
+        assert isinstance(blob, FileBlob) is is_file_blob
+        assert blob_bytes(blob) == video_bytes
+
+    @pytest.mark.parametrize("is_blob_object", (True, False))
+    def it_can_get_the_sha1_hash_of_a_blob(self, is_blob_object):
+        blob = BufferBlob(b"foobar") if is_blob_object else b"foobar"
+        assert blob_sha1(blob) == "8843d7f92416211de9ebb963ff4ce28125932878"
@@ -3,30 +3,46 @@
 """Unit-test suite for `pptx.opc.package` module."""
 
 import collections
+import copy
 import io
 import itertools
+import os
+import random
+import sys
+import threading
+import time
+import zipfile
 
 import pytest
 
+from pptx.api import Presentation
 from pptx.opc.constants import (
     CONTENT_TYPE as CT,
     RELATIONSHIP_TARGET_MODE as RTM,
     RELATIONSHIP_TYPE as RT,
 )
-from pptx.opc.oxml import CT_Relationship, CT_Relationships
+from pptx.exc import ReadOnlyPackageError
+from pptx.opc.blob import FileBlob, ZipMemberBlob
+from pptx.opc.oxml import CT_Relationship, CT_Relationships, serialize_part_xml
 from pptx.opc.package import (
     OpcPackage,
     Part,
     PartFactory,
     XmlPart,
     _ContentTypeMap,
+    _DeferredParts,
     _PackageLoader,
+    _PackageMemberBlob,
+    _PartnameRegistry,
     _RelatableMixin,
     _Relationship,
     _Relationships,
+    _content_key,
 )
 from pptx.opc.packuri import PACKAGE_URI, PackURI
+from pptx.opc.serialized import PackageReader
 from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
 from pptx.parts.presentation import PresentationPart
 
 from ..unitutil.cxml import element
@@ -134,17 +150,39 @@ class Describe_RelatableMixin(object):
 class DescribeOpcPackage(object):
     """Unit-test suite for `pptx.opc.package.OpcPackage` objects."""
 
-    def it_can_open_a_pkg_file(self, request):
+    @pytest.mark.parametrize("read_only", (True, False))
+    def it_can_open_a_pkg_file(self, request, read_only):
         package_ = instance_mock(request, OpcPackage)
         _init_ = initializer_mock(request, OpcPackage)
         _load_ = method_mock(request, OpcPackage, "_load", return_value=package_)
 
-        package = OpcPackage.open("package.pptx")
+        package = OpcPackage.open("package.pptx", read_only)
 
-        _init_.assert_called_once_with(ANY, "package.pptx")
+        _init_.assert_called_once_with(ANY, "package.pptx", read_only, False)
         _load_.assert_called_once_with(ANY)
         assert package is package_
 
+    def it_can_make_a_copy_of_itself(self):
+        package = OpcPackage("prs.pptx")
+        slide = XmlPart.load(
+            PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, package, b"<p:sld/>"
+        )
+        image = Part.load(PackURI("/ppt/media/image1.png"), CT.PNG, package, b"png")
+        package.relate_to(slide, RT.SLIDE)
+        slide.relate_to(image, RT.IMAGE)
+        slide.relate_to("http://url", RT.HYPERLINK, is_external=True)
+
+        package_copy = package.copy()
+
+        slide_copy, image_copy = package_copy.iter_parts()
+        assert package_copy._pkg_file == "prs.pptx"
+        assert slide_copy.partname == slide.partname
+        assert slide_copy.package is package_copy
+        assert slide_copy is not slide
+        assert slide_copy.related_part("rId1") is image_copy
+        assert slide_copy.target_ref("rId2") == "http://url"
+        assert image_copy.blob == b"png"
+
     def it_can_drop_a_relationship(self, _rels_prop_, relationships_):
         _rels_prop_.return_value = relationships_
 
@@ -152,29 +190,23 @@ class DescribeOpcPackage(object):
 
         relationships_.pop.assert_called_once_with("rId42")
 
-    def it_can_iterate_over_its_parts(self, request):
+    def it_can_iterate_over_its_parts(self, request, _part_graph_prop_):
         part_, part_2_ = [
             instance_mock(request, Part, name="part_%d" % i) for i in range(2)
         ]
-        rels_iter = (
-            instance_mock(
-                request, _Relationship, is_external=is_external, target_part=target
-            )
-            for is_external, target in (
-                (True, "http://some/url/"),
-                (False, part_),
-                (False, part_),
-                (False, part_2_),
-                (False, part_),
-                (False, part_2_),
-            )
-        )
-        method_mock(request, OpcPackage, "iter_rels", return_value=rels_iter)
+        _part_graph_prop_.return_value = ((), (part_, part_2_))
         package = OpcPackage(None)
 
         assert list(package.iter_parts()) == [part_, part_2_]
 
-    def it_can_iterate_over_its_relationships(self, request, _rels_prop_):
+    def it_can_iterate_over_its_relationships(self, request, _part_graph_prop_):
+        rels_ = tuple(instance_mock(request, _Relationship) for _ in range(3))
+        _part_graph_prop_.return_value = (rels_, ())
+        package = OpcPackage(None)
+
+        assert list(package.iter_rels()) == list(rels_)
+
+    def it_walks_the_rels_graph_depth_first_to_help(self, request, _rels_prop_):
         """
         +----------+          +--------+
         | pkg_rels |-- r0 --> | part_0 |
@@ -213,10 +245,87 @@ class DescribeOpcPackage(object):
         part_1_.rels = {r.rId: r for r in all_rels[4:]}
         package = OpcPackage(None)
 
-        rels = set(package.iter_rels())
+        rels, parts = package._walk_part_graph()
+
+        r0, r1, r2, r3, r4 = all_rels
+        assert rels == (r0, r3, r4, r1, r2)
+        assert parts == (part_0_, part_1_)
+
+    def it_caches_the_rels_graph_walk_until_a_relationship_changes(self, request):
+        _walk_part_graph_ = method_mock(
+            request, OpcPackage, "_walk_part_graph", return_value=((), ())
+        )
+        package = OpcPackage(None)
+
+        package._part_graph
+        package._part_graph
+        assert _walk_part_graph_.call_count == 1
+
+        _Relationships(None, package)._add_relationship(RT.HYPERLINK, "http://", True)
+        assert package._part_graph == ((), ())
+        assert _walk_part_graph_.call_count == 2
+
+    def but_not_when_a_relationship_of_another_package_changes(self, request):
+        _walk_part_graph_ = method_mock(
+            request, OpcPackage, "_walk_part_graph", return_value=((), ())
+        )
+        package = OpcPackage(None)
+        package._part_graph
+
+        _Relationships(None, OpcPackage(None))._add_relationship(
+            RT.HYPERLINK, "http://url", True
+        )
+        package._part_graph
+
+        assert _walk_part_graph_.call_count == 1
+
+    def it_frees_the_partname_of_a_part_when_its_last_rel_is_removed(self):
+        package = OpcPackage(None)
+        part = Part(PackURI("/ppt/media/image1.png"), None, package)
+        slide = Part(PackURI("/ppt/slides/slide1.xml"), None, package)
+        package.relate_to(slide, RT.SLIDE)
+        slide_rId = slide.relate_to(part, RT.IMAGE)
+        package_rId = package.relate_to(part, RT.THUMBNAIL)
+        partnames = package._partnames
 
-        # -- sequence is not guaranteed, but count (len) and uniqueness are --
-        assert rels == set(all_rels)
+        package.drop_rel(package_rId)
+        assert "/ppt/media/image1.png" in partnames
+
+        slide._rels.pop(slide_rId)
+        assert "/ppt/media/image1.png" not in partnames
+
+        slide._rels.get_or_add(RT.IMAGE, part)
+        assert "/ppt/media/image1.png" in partnames
+
+    def but_an_unreachable_part_keeps_its_partname_until_the_indexes_reset(self):
+        package = OpcPackage(None)
+        part = Part(PackURI("/ppt/media/image1.png"), None, package)
+        slide = Part(PackURI("/ppt/slides/slide1.xml"), None, package)
+        rId = package.relate_to(slide, RT.SLIDE)
+        slide.relate_to(part, RT.IMAGE)
+        package._partnames
+
+        package.drop_rel(rId)
+
+        assert "/ppt/slides/slide1.xml" not in package._partnames
+        assert "/ppt/media/image1.png" in package._partnames
+        package._reset_part_indexes()
+        assert "/ppt/media/image1.png" not in package._partnames
+
+    def it_counts_the_changes_to_its_relationships_across_threads(self):
+        package = OpcPackage(None)
+
+        def change_rels():
+            for _ in range(1000):
+                package._rels_changed()
+
+        threads = [threading.Thread(target=change_rels) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert package._rels_generation == 4000
 
     def it_provides_access_to_the_main_document_part(self, request):
         presentation_part_ = instance_mock(request, PresentationPart)
@@ -252,18 +361,333 @@ class DescribeOpcPackage(object):
         PackURI_.assert_called_once_with(next_partname)
         assert partname == next_partname
 
-    def it_can_save_to_a_pkg_file(self, request, _rels_prop_, relationships_):
+    def it_keeps_its_partname_registry_current_once_it_is_formed(self, request):
+        method_mock(
+            request,
+            OpcPackage,
+            "iter_parts",
+            return_value=iter((instance_mock(request, Part, partname="/x1.xml"),)),
+        )
+        package = OpcPackage(None)
+        package._part_added("/x9.xml")
+        assert "_partnames" not in package.__dict__
+
+        assert package.next_partname("/x%d.xml") == "/x2.xml"
+        package._part_added("/x2.xml")
+        assert package.next_partname("/x%d.xml") == "/x3.xml"
+        package._part_renamed("/x2.xml", "/x3.xml")
+        assert package.next_partname("/x%d.xml") == "/x2.xml"
+
+    def it_can_generate_its_package_in_chunks(
+        self, request, _rels_prop_, relationships_, package_reader_
+    ):
+        _rels_prop_.return_value = relationships_
+        parts_ = tuple(instance_mock(request, Part) for _ in range(3))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
+        PackageWriter_.iter_chunks.return_value = iter((b"foo", b"bar"))
+        package = OpcPackage(None)
+
+        chunks = list(package.iter_chunks("compression", 4))
+
+        PackageWriter_.iter_chunks.assert_called_once_with(
+            relationships_,
+            parts_,
+            pkg_reader=package_reader_,
+            compression="compression",
+            workers=4,
+        )
+        assert chunks == [b"foo", b"bar"]
+        package_reader_.close.assert_called_once_with()
+
+    def it_can_save_to_a_pkg_file(
+        self, request, _rels_prop_, relationships_, package_reader_
+    ):
         _rels_prop_.return_value = relationships_
         parts_ = tuple(instance_mock(request, Part) for _ in range(3))
         method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
         PackageWriter_ = class_mock(request, "pptx.opc.package.PackageWriter")
         package = OpcPackage(None)
 
-        package.save("prs.pptx")
+        package.save("prs.pptx", "compression", 4)
+
+        PackageWriter_.write.assert_called_once_with(
+            "prs.pptx",
+            relationships_,
+            parts_,
+            pkg_reader=package_reader_,
+            compression="compression",
+            workers=4,
+        )
+        package_reader_.close.assert_called_once_with()
+
+    @pytest.mark.parametrize("prune", (True, False))
+    def it_can_drop_unreferenced_rels_before_it_saves(self, request, prune):
+        drop_unreferenced_rels_ = method_mock(
+            request, OpcPackage, "drop_unreferenced_rels"
+        )
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(()))
+        class_mock(request, "pptx.opc.package.PackageWriter")
+        property_mock(request, OpcPackage, "_package_reader")
+        package = OpcPackage(None)
+
+        package.save("prs.pptx", prune=prune)
+
+        assert drop_unreferenced_rels_.call_count == (1 if prune else 0)
+
+    def it_can_drop_the_unreferenced_rels_of_each_part(self, request):
+        parts_ = tuple(instance_mock(request, Part) for _ in range(3))
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(parts_))
+        package = OpcPackage(None)
+
+        package.drop_unreferenced_rels()
+
+        for part_ in parts_:
+            part_.drop_unreferenced_rels.assert_called_once_with()
+
+    @pytest.mark.parametrize("dedupe", (True, False))
+    def it_can_dedupe_its_parts_before_it_saves(self, request, dedupe):
+        dedupe_parts_ = method_mock(request, OpcPackage, "dedupe_parts")
+        method_mock(request, OpcPackage, "iter_parts", return_value=iter(()))
+        class_mock(request, "pptx.opc.package.PackageWriter")
+        property_mock(request, OpcPackage, "_package_reader")
+        package = OpcPackage(None)
+
+        package.save("prs.pptx", dedupe=dedupe)
+
+        assert dedupe_parts_.call_count == (1 if dedupe else 0)
+
+    def it_can_collapse_parts_having_identical_content(self):
+        package = OpcPackage(None)
+        slides = [
+            Part(PackURI("/ppt/slides/slide%d.xml" % n), CT.PML_SLIDE, package, b"")
+            for n in (1, 2)
+        ]
+        images = [
+            Part(PackURI("/ppt/media/image%d.png" % n), CT.PNG, package, b"foo")
+            for n in (1, 2)
+        ]
+        other_image = Part(PackURI("/ppt/media/image3.png"), CT.PNG, package, b"bar")
+        for slide, image in zip(slides, images):
+            package.relate_to(slide, RT.SLIDE)
+            slide.relate_to(image, RT.IMAGE)
+        slides[1].relate_to(other_image, RT.IMAGE)
+
+        package.dedupe_parts()
+
+        assert slides[1].related_part("rId1") is images[0]
+        assert slides[1].related_part("rId2") is other_image
+        assert list(package.iter_parts()) == slides[:1] + images[:1] + slides[1:] + [
+            other_image
+        ]
+
+    @pytest.mark.parametrize(
+        "content_type, has_rels, expected_value",
+        (
+            (CT.PNG, False, (CT.PNG, "0beec7b5ea3f0fdbc95d0dd47f3c5bc275da8a33")),
+            (CT.PNG, True, None),
+            (CT.PML_SLIDE_LAYOUT, False, None),
+            (
+                CT.OFC_CHART_STYLE,
+                False,
+                (CT.OFC_CHART_STYLE, "0beec7b5ea3f0fdbc95d0dd47f3c5bc275da8a33"),
+            ),
+        ),
+    )
+    def it_keys_the_content_of_a_part_that_can_be_shared_to_help(
+        self, content_type, has_rels, expected_value
+    ):
+        package = OpcPackage(None)
+        part = Part(PackURI("/ppt/foo1.bin"), content_type, package, b"foo")
+        if has_rels:
+            part.relate_to("http://url", RT.HYPERLINK, is_external=True)
+
+        assert _content_key(part) == expected_value
+
+    def it_can_open_a_package_read_only(self):
+        package = OpcPackage.open(absjoin(test_file_dir, "test.pptx"), read_only=True)
+        parts = list(package.iter_parts())
+        image = next(p for p in parts if p.content_type == CT.JPEG)
+        slide = next(p for p in parts if p.content_type == CT.PML_SLIDE)
+
+        assert package.read_only is True
+        assert isinstance(image.file_blob, ZipMemberBlob)
+        assert image.blob.startswith(b"\xff\xd8")
+        with pytest.raises(ReadOnlyPackageError):
+            slide.relate_to(image, RT.IMAGE)
+        with pytest.raises(ReadOnlyPackageError):
+            package.drop_rel("rId1")
+        with pytest.raises(ReadOnlyPackageError):
+            image.blob = b"foobar"
+        with pytest.raises(ReadOnlyPackageError):
+            slide.partname = PackURI("/ppt/slides/slide42.xml")
+        assert "_rIds_by_target" not in slide.rels.__dict__
+        assert package.copy().read_only is False
+
+    def it_can_be_read_by_many_threads_at_once_when_read_only(self):
+        def texts(package):
+            return [
+                part._element.xml
+                for part in package.iter_parts()
+                if part.content_type == CT.PML_SLIDE
+            ]
+
+        path = absjoin(test_file_dir, "test_slides.pptx")
+        expected_texts = texts(OpcPackage.open(path))
+        package = OpcPackage.open(path, read_only=True)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(texts(package)))
+            for _ in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [expected_texts] * 8
+
+    def it_can_open_a_package_lazily(self, tmpdir):
+        """Integrates with Presentation to load only the slides accessed."""
+        prs = Presentation()
+        for idx in range(3):
+            slide = prs.slides.add_slide(prs.slide_layouts[6])
+            slide.shapes.add_textbox(0, 0, 0, 0).text = "slide %d" % idx
+        image_path = absjoin(test_file_dir, "monty-truth.png")
+        prs.slides[1].shapes.add_picture(image_path, 0, 0)
+        path = str(tmpdir.join("prs.pptx"))
+        prs.save(path)
+
+        prs = Presentation(path, lazy=True)
+        slide = prs.slides[1]
+        slide_parts = [
+            prs.part.related_part(sldId.rId) for sldId in prs.part._element.sldIdLst
+        ]
+
+        assert prs.part.package.lazy is True
+        assert slide.shapes[0].text == "slide 1"
+        assert slide.shapes[1].image.content_type == CT.PNG
+        assert slide.slide_layout.name == "Blank"
+        assert ["_rels" in part.__dict__ for part in slide_parts] == [
+            False,
+            True,
+            False,
+        ]
+        saved_path = str(tmpdir.join("saved.pptx"))
+        prs.save(saved_path)
+        saved = Presentation(saved_path)
+        assert [s.shapes[0].text for s in saved.slides] == [
+            "slide 0",
+            "slide 1",
+            "slide 2",
+        ]
+        assert len(saved.slides[1].shapes) == 2
+
+    def it_loads_the_rels_of_a_slide_renamed_on_a_lazy_open(self, tmpdir):
+        """Slide parts are renamed to presentation order before their rels load."""
+        prs = Presentation()
+        for layout_idx, image_name in ((0, "monty-truth.png"), (5, "python-icon.jpeg")):
+            slide = prs.slides.add_slide(prs.slide_layouts[layout_idx])
+            image_path = absjoin(test_file_dir, image_name)
+            slide.shapes.add_picture(image_path, 0, 0)
+        path = str(tmpdir.join("prs.pptx"))
+        prs.save(path)
+        # --- move the last slide to the front without renaming the slide parts ---
+        reordered_path = str(tmpdir.join("reordered.pptx"))
+        with zipfile.ZipFile(path) as src, zipfile.ZipFile(reordered_path, "w") as dst:
+            for name in src.namelist():
+                blob = src.read(name)
+                if name == "ppt/presentation.xml":
+                    presentation = parse_xml(blob)
+                    sldIdLst = presentation.sldIdLst
+                    sldIdLst.insert(0, sldIdLst[-1])
+                    blob = serialize_part_xml(presentation)
+                dst.writestr(name, blob)
+
+        def rels_of(prs):
+            return [
+                (slide.slide_layout.name, slide.shapes[-1].image.content_type)
+                for slide in prs.slides
+            ]
+
+        expected = rels_of(Presentation(reordered_path))
+        assert expected == [("Title Only", CT.JPEG), ("Title Slide", CT.PNG)]
+        assert rels_of(Presentation(reordered_path, lazy=True)) == expected
 
-        PackageWriter_.write.assert_called_once_with("prs.pptx", relationships_, parts_)
+    def it_can_save_after_the_stream_it_was_opened_from_is_closed(
+        self, movie_deck, tmpdir
+    ):
+        path, movie_blob = movie_deck
+        with open(path, "rb") as f:
+            prs = Presentation(f)
+        saved_path = str(tmpdir.join("saved.pptx"))
+
+        prs.save(saved_path)
+
+        assert _movie_blob_of(Presentation(saved_path)) == movie_blob
+
+    def it_can_save_after_the_file_it_was_opened_from_is_removed(self, movie_deck):
+        path, movie_blob = movie_deck
+        prs = Presentation(path)
+        os.remove(path)
+
+        prs.save(path)
 
-    def it_loads_the_pkg_file_to_help(self, request, _rels_prop_, relationships_):
+        assert _movie_blob_of(Presentation(path)) == movie_blob
+
+    def it_can_save_after_a_file_inserted_from_a_path_is_removed(self, tmpdir):
+        movie_path = str(tmpdir.join("movie.mp4"))
+        movie_blob = os.urandom(1024)
+        with open(movie_path, "wb") as f:
+            f.write(movie_blob)
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_movie(movie_path, 0, 0, 100, 100)
+        os.remove(movie_path)
+        stream = io.BytesIO()
+
+        prs.save(stream)
+
+        assert _movie_blob_of(Presentation(stream)) == movie_blob
+
+    @pytest.mark.parametrize("lazy", (False, True))
+    def it_can_save_over_the_file_it_was_opened_from_more_than_once(
+        self, movie_deck, lazy
+    ):
+        path, movie_blob = movie_deck
+        prs = Presentation(path, lazy=lazy)
+        slide = prs.slides[0]
+
+        prs.save(path)
+        slide.shapes.add_textbox(0, 0, 0, 0).text = "foobar"
+        prs.save(path)
+        prs.save(path)
+
+        saved = Presentation(path)
+        assert _movie_blob_of(saved) == movie_blob
+        assert saved.slides[0].shapes[-1].text == "foobar"
+
+    def it_leaves_parts_no_longer_referenced_out_when_pruned(self, tmpdir):
+        """Integrates with Presentation to remove a picture and prune its image."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        shapes = slide.shapes
+        picture = shapes.add_picture(absjoin(test_file_dir, "monty-truth.png"), 0, 0)
+        shapes.add_picture(absjoin(test_file_dir, "python-icon.jpeg"), 0, 0)
+        picture._element.getparent().remove(picture._element)
+        path = str(tmpdir.join("pruned.pptx"))
+
+        prs.save(path, prune=True)
+
+        partnames = set(p.partname for p in OpcPackage.open(path).iter_parts())
+        assert "/ppt/media/image1.png" not in partnames
+        assert "/ppt/media/image2.jpg" in partnames
+        assert "/ppt/slideLayouts/slideLayout7.xml" in partnames
+
+    def it_loads_the_pkg_file_to_help(
+        self, request, _rels_prop_, relationships_, package_reader_
+    ):
         _PackageLoader_ = class_mock(request, "pptx.opc.package._PackageLoader")
         _PackageLoader_.load.return_value = "pkg-rels-xml", {"partname": "part"}
         _rels_prop_.return_value = relationships_
@@ -271,12 +695,38 @@ class DescribeOpcPackage(object):
 
         return_value = package._load()
 
-        _PackageLoader_.load.assert_called_once_with("prs.pptx", package)
+        _PackageLoader_.load.assert_called_once_with(package_reader_, package)
+        package_reader_.close.assert_called_once_with()
         relationships_.load_from_xml.assert_called_once_with(
             PACKAGE_URI, "pkg-rels-xml", {"partname": "part"}
         )
         assert return_value is package
 
+    @pytest.mark.parametrize(
+        "read_only, lazy, pkg_file, expected_value",
+        (
+            (False, False, "prs.pptx", sys.maxsize),
+            (False, True, "prs.pptx", None),
+            (True, False, "prs.pptx", 0),
+            (True, True, "prs.pptx", 0),
+            (True, False, io.BytesIO(), sys.maxsize),
+        ),
+    )
+    def it_knows_how_big_a_part_loaded_as_a_file_blob_must_be_to_help(
+        self, read_only, lazy, pkg_file, expected_value
+    ):
+        package = OpcPackage(pkg_file, read_only, lazy)
+        assert package._file_blob_min_size == expected_value
+
+    def it_constructs_its_package_reader_to_help(self, request):
+        PackageReader_ = class_mock(request, "pptx.opc.package.PackageReader")
+        package = OpcPackage("prs.pptx")
+
+        package_reader = package._package_reader
+
+        PackageReader_.assert_called_once_with("prs.pptx")
+        assert package_reader is PackageReader_.return_value
+
     def it_constructs_its_relationships_object_to_help(self, request, relationships_):
         _Relationships_ = class_mock(
             request, "pptx.opc.package._Relationships", return_value=relationships_
@@ -285,20 +735,127 @@ class DescribeOpcPackage(object):
 
         rels = package._rels
 
-        _Relationships_.assert_called_once_with(PACKAGE_URI.baseURI)
+        _Relationships_.assert_called_once_with(PACKAGE_URI.baseURI, package)
         assert rels is relationships_
 
+    # fixtures ---------------------------------------------
+
+    @pytest.fixture
+    def movie_deck(self, tmpdir):
+        """(path, movie_blob) pair of a saved deck having a movie of over 1 MB."""
+        movie_blob = os.urandom(1024 * 1024 + 1)
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        slide.shapes.add_movie(io.BytesIO(movie_blob), 0, 0, 0, 0)
+        path = str(tmpdir.join("movie.pptx"))
+        prs.save(path)
+        return path, movie_blob
+
     # fixture components -----------------------------------
 
+    @pytest.fixture
+    def package_reader_(self, request):
+        package_reader_ = instance_mock(request, PackageReader)
+        property_mock(
+            request, OpcPackage, "_package_reader", return_value=package_reader_
+        )
+        return package_reader_
+
     @pytest.fixture
     def relationships_(self, request):
         return instance_mock(request, _Relationships)
 
+    @pytest.fixture
+    def _part_graph_prop_(self, request):
+        return property_mock(request, OpcPackage, "_part_graph")
+
     @pytest.fixture
     def _rels_prop_(self, request):
         return property_mock(request, OpcPackage, "_rels")
 
 
+class Describe_PartnameRegistry(object):
+    """Unit-test suite for `pptx.opc.package._PartnameRegistry` objects."""
+
+    @pytest.mark.parametrize(
+        "partnames, tmpl, expected_value",
+        (
+            ((), "/x%d.xml", "/x1.xml"),
+            (("/x1.xml", "/x2.xml"), "/x%d.xml", "/x3.xml"),
+            (("/x1.xml", "/x4.xml"), "/x%d.xml", "/x3.xml"),
+            (("/x1.xml", "/x4.xml", "/x6.xml"), "/x%d.xml", "/x3.xml"),
+            (("/x1.xml", "/x2.xml", "/x6.xml"), "/x%d.xml", "/x4.xml"),
+            (("/x1.xml", "/x2.bin", "/y1.xml"), "/x%d.xml", "/x3.xml"),
+        ),
+    )
+    def it_can_find_the_next_partname_for_a_template(
+        self, partnames, tmpl, expected_value
+    ):
+        assert _PartnameRegistry(partnames).next_partname(tmpl) == expected_value
+
+    @pytest.mark.parametrize(
+        "partnames, expected_value",
+        (
+            ((), 1),
+            (("/ppt/media/image1.png", "/ppt/media/image2.png"), 3),
+            (("/ppt/media/image1.png", "/ppt/media/image3.png"), 2),
+            (("/ppt/media/image2.png", "/ppt/media/image2.jpeg"), 1),
+            (("/ppt/media/image1.png", "/ppt/media/media2.mp4"), 2),
+            (("/ppt/media/image.png", "/ppt/media/image1.png"), 2),
+        ),
+    )
+    def it_can_find_the_next_available_idx_for_a_prefix(
+        self, partnames, expected_value
+    ):
+        registry = _PartnameRegistry(partnames)
+        assert registry.next_available_idx("/ppt/media/image") == expected_value
+
+    def it_keeps_its_answers_current_as_partnames_are_added_and_removed(self):
+        """Compares against finding each answer by examining every partname."""
+        rand = random.Random(42)
+        tmpl, prefix = "/ppt/slides/slide%d.xml", "/ppt/slides/slide"
+        partnames = set()
+        registry = _PartnameRegistry(())
+
+        def expected_next_partname():
+            count = sum(1 for p in partnames if p.startswith(prefix))
+            return next(
+                tmpl % n
+                for n in range(count + 1, 0, -1)
+                if tmpl % n not in partnames
+            )
+
+        def expected_next_idx():
+            idxs = set(
+                PackURI(p).idx for p in partnames if p.startswith(prefix)
+            )
+            return next(n for n in itertools.count(1) if n not in idxs)
+
+        for _ in range(2000):
+            n = rand.randint(1, 40)
+            partname = rand.choice((tmpl % n, "/ppt/slides/slide%d.bin" % n))
+            if partname in partnames:
+                partnames.remove(partname)
+                registry.remove(partname)
+            else:
+                partnames.add(partname)
+                registry.add(partname)
+            assert registry.next_partname(tmpl) == expected_next_partname()
+            assert registry.next_available_idx(prefix) == expected_next_idx()
+
+    def it_counts_a_partname_once_for_each_part_having_it(self):
+        registry = _PartnameRegistry(("/x1.xml", "/x2.xml"))
+        registry.add("/x1.xml")
+
+        registry.remove("/x1.xml")
+
+        assert "/x1.xml" in registry
+        assert registry.next_partname("/x%d.xml") == "/x3.xml"
+        registry.remove("/x1.xml")
+        assert "/x1.xml" not in registry
+        assert registry.next_partname("/x%d.xml") == "/x1.xml"
+
+
 class Describe_PackageLoader(object):
     """Unit-test suite for `pptx.opc.package._PackageLoader` objects."""
 
@@ -335,7 +892,8 @@ class Describe_PackageLoader(object):
             )
         )
         _xml_rels_prop_.return_value = rels_
-        package_loader = _PackageLoader(None, None)
+        package_ = instance_mock(request, OpcPackage, lazy=False, read_only=False)
+        package_loader = _PackageLoader(None, package_)
 
         pkg_xml_rels, parts = package_loader._load()
 
@@ -346,6 +904,96 @@ class Describe_PackageLoader(object):
         assert pkg_xml_rels is rels_["/"]
         assert parts is parts_
 
+    def it_defers_the_relationships_of_the_parts_it_loads_lazily(
+        self, request, _xml_rels_prop_
+    ):
+        part_ = instance_mock(request, Part, partname="partname")
+        property_mock(
+            request, _PackageLoader, "_parts", return_value={"partname": part_}
+        )
+        rels_ = {"/": "pkg-rels", "partname": "part-rels"}
+        _xml_rels_prop_.return_value = rels_
+        package_ = instance_mock(request, OpcPackage, lazy=True, read_only=True)
+        package_loader = _PackageLoader("package-reader", package_)
+
+        pkg_xml_rels, parts = package_loader._load()
+
+        assert isinstance(parts, _DeferredParts)
+        assert parts._package_reader == "package-reader"
+        part_.load_rels_from_xml.assert_called_once_with("part-rels", parts)
+        part_.rels.make_read_only.assert_called_once_with()
+        assert pkg_xml_rels == "pkg-rels"
+
+    @pytest.mark.parametrize("content_type", (CT.PML_SLIDE, CT.PNG))
+    def it_can_load_a_deferred_part(self, request, package_, content_type):
+        partname = PackURI("/ppt/foo")
+        property_mock(
+            request,
+            _PackageLoader,
+            "_content_types",
+            return_value={partname: content_type},
+        )
+        method_mock(request, _PackageLoader, "_blob_for", return_value=b"blob")
+        PartFactory_ = class_mock(
+            request, "pptx.opc.package.PartFactory", return_value="part"
+        )
+        package_loader = _PackageLoader("package-reader", package_)
+
+        part = package_loader.load_deferred_part(partname)
+
+        blob = PartFactory_.call_args[0][3]
+        PartFactory_.assert_called_once_with(partname, content_type, package_, blob)
+        if content_type == CT.PNG:
+            assert blob == b"blob"
+        else:
+            assert isinstance(blob, _PackageMemberBlob)
+            assert blob._package_reader == "package-reader"
+        assert part == "part"
+
+    @pytest.mark.parametrize("read_only", (True, False))
+    def it_loads_the_relationships_of_a_deferred_part_once(self, request, read_only):
+        xml_rels = parse_xml(snippet_bytes("presentation-rels-xml"))
+        _xml_rels_for_ = method_mock(
+            request, _PackageLoader, "_xml_rels_for", return_value=xml_rels
+        )
+        package_ = instance_mock(request, OpcPackage, read_only=read_only)
+        package_loader = _PackageLoader(None, package_)
+        parts_ = {PackURI("/docProps/thumbnail.jpeg"): instance_mock(request, Part)}
+        part = Part(PackURI("/ppt/presentation2.xml"), None, None)
+        src_partname = PackURI("/ppt/presentation.xml")
+
+        rels = package_loader.load_deferred_rels(part, src_partname, parts_)
+
+        _xml_rels_for_.assert_called_once_with(package_loader, "/ppt/presentation.xml")
+        assert list(rels.keys()) == ["rId2", "rId3"]
+        assert rels._read_only is read_only
+        assert part._rels is rels
+        assert package_loader.load_deferred_rels(part, src_partname, parts_) is rels
+        assert _xml_rels_for_.call_count == 1
+
+    @pytest.mark.parametrize(
+        "content_type, file_blob, expected_blob",
+        (
+            (CT.MP4, "file-blob", "file-blob"),
+            (CT.MP4, None, b"blob"),
+            (CT.PML_SLIDE, "file-blob", b"blob"),
+        ),
+    )
+    def it_loads_a_large_binary_part_as_a_file_blob_to_help(
+        self, request, content_type, file_blob, expected_blob
+    ):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.file_blob.return_value = file_blob
+        package_reader_.__getitem__.return_value = b"blob"
+        package_ = instance_mock(request, OpcPackage, _file_blob_min_size=42)
+        package_loader = _PackageLoader(package_reader_, package_)
+
+        blob = package_loader._blob_for(PackURI("/ppt/foo"), content_type)
+
+        if content_type == CT.MP4:
+            package_reader_.file_blob.assert_called_once_with("/ppt/foo", 42)
+        assert blob == expected_blob
+
     def it_loads_the_xml_relationships_from_the_package_to_help(self, request):
         pkg_xml_rels = parse_xml(snippet_bytes("package-rels-xml"))
         prs_xml_rels = parse_xml(snippet_bytes("presentation-rels-xml"))
@@ -366,7 +1014,8 @@ class Describe_PackageLoader(object):
                 )
             ),
         )
-        package_loader = _PackageLoader(None, None)
+        package_ = instance_mock(request, OpcPackage, lazy=False)
+        package_loader = _PackageLoader(None, package_)
 
         xml_rels = package_loader._xml_rels
 
@@ -386,6 +1035,35 @@ class Describe_PackageLoader(object):
             "/docProps/core.xml": core_xml_rels,
         }
 
+    def but_it_does_not_follow_a_deferred_relationship_when_lazy(self, request):
+        pkg_xml_rels = parse_xml(snippet_bytes("package-rels-xml"))
+        prs_xml_rels = parse_xml(snippet_bytes("presentation-rels-xml"))
+        _xml_rels_for_ = method_mock(
+            request,
+            _PackageLoader,
+            "_xml_rels_for",
+            side_effect=iter(
+                (
+                    pkg_xml_rels,
+                    prs_xml_rels,
+                    CT_Relationships.new(),
+                    CT_Relationships.new(),
+                )
+            ),
+        )
+        package_ = instance_mock(request, OpcPackage, lazy=True)
+        package_loader = _PackageLoader(None, package_)
+
+        xml_rels = package_loader._xml_rels
+
+        assert _xml_rels_for_.call_args_list == [
+            call(package_loader, "/"),
+            call(package_loader, "/ppt/presentation.xml"),
+            call(package_loader, "/docProps/thumbnail.jpeg"),
+            call(package_loader, "/docProps/core.xml"),
+        ]
+        assert "/ppt/slides/slide1.xml" not in xml_rels
+
     # fixture components -----------------------------------
 
     @pytest.fixture
@@ -397,6 +1075,76 @@ class Describe_PackageLoader(object):
         return property_mock(request, _PackageLoader, "_xml_rels")
 
 
+class Describe_DeferredParts(object):
+    """Unit-test suite for `pptx.opc.package._DeferredParts` objects."""
+
+    @pytest.mark.parametrize(
+        "partname, expected_value",
+        (("/loaded", True), ("/member", True), ("/x", False)),
+    )
+    def it_knows_which_parts_are_in_the_package(
+        self, request, partname, expected_value
+    ):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__contains__.side_effect = lambda key: key == "/member"
+        deferred_parts = _DeferredParts(None, package_reader_, {"/loaded": "part"})
+
+        assert (partname in deferred_parts) is expected_value
+
+    def it_loads_a_part_on_first_lookup(self, request, loader_):
+        part = Part(PackURI("/ppt/slides/slide1.xml"), None, None)
+        loader_.load_deferred_part.return_value = part
+        parts = {"/loaded": "part"}
+        deferred_parts = _DeferredParts(loader_, None, parts)
+
+        looked_up = deferred_parts["/ppt/slides/slide1.xml"], deferred_parts["/loaded"]
+
+        loader_.load_deferred_part.assert_called_once_with("/ppt/slides/slide1.xml")
+        assert looked_up == (part, "part")
+        assert part._deferred_parts is deferred_parts
+        assert parts["/ppt/slides/slide1.xml"] is part
+        assert deferred_parts["/ppt/slides/slide1.xml"] is part
+
+    def it_loads_the_relationships_of_a_deferred_part(self, loader_):
+        part = Part(PackURI("/ppt/slides/slide1.xml"), None, None)
+        loader_.load_deferred_part.return_value = part
+        loader_.load_deferred_rels.return_value = "rels"
+        deferred_parts = _DeferredParts(loader_, None, {})
+        deferred_parts["/ppt/slides/slide2.xml"]
+
+        rels = deferred_parts.load_rels(part)
+
+        loader_.load_deferred_rels.assert_called_once_with(
+            part, "/ppt/slides/slide2.xml", deferred_parts
+        )
+        assert rels == "rels"
+
+    def it_loads_under_a_lock_of_its_own(self, loader_):
+        deferred_parts = _DeferredParts(loader_, None, {})
+        other_deferred_parts = _DeferredParts(loader_, None, {})
+
+        assert deferred_parts._lock is not other_deferred_parts._lock
+
+    # fixture components -----------------------------------
+
+    @pytest.fixture
+    def loader_(self, request):
+        return instance_mock(request, _PackageLoader)
+
+
+class Describe_PackageMemberBlob(object):
+    """Unit-test suite for `pptx.opc.package._PackageMemberBlob` objects."""
+
+    def it_reads_the_package_member_when_needed(self, request):
+        package_reader_ = instance_mock(request, PackageReader)
+        package_reader_.__getitem__.return_value = b"<p:sld/>"
+        blob = _PackageMemberBlob(package_reader_, "/ppt/slides/slide1.xml")
+
+        assert blob.read() == b"<p:sld/>"
+        assert blob.size == 8
+        package_reader_.__getitem__.assert_called_with("/ppt/slides/slide1.xml")
+
+
 class DescribePart(object):
     """Unit-test suite for `pptx.opc.package.Part` objects."""
 
@@ -408,40 +1156,187 @@ class DescribePart(object):
 
         _init_.assert_called_once_with(part, partname_, CT.PML_SLIDE, package_, b"blob")
         assert isinstance(part, Part)
+        assert part._src_partname is partname_
 
     def it_uses_the_load_blob_as_its_blob(self):
         assert Part(None, None, None, b"blob").blob == b"blob"
 
     def it_can_change_its_blob(self):
-        part = Part(None, None, None, b"old-blob")
+        part = Part.load(PackURI("/ppt/media/image1.png"), None, None, b"old-blob")
         part.blob = b"new-blob"
         assert part.blob == b"new-blob"
+        assert part.is_dirty is True
+
+    @pytest.mark.parametrize(
+        "src_partname, expected_value", ((None, True), (PackURI("/x.png"), False))
+    )
+    def it_knows_whether_it_is_dirty(self, src_partname, expected_value):
+        part = Part(None, None, None, b"blob")
+        part._src_partname = src_partname
+
+        assert part.is_dirty is expected_value
+
+    @pytest.mark.parametrize("is_dirty, expected_value", ((True, None), (False, "/x")))
+    def it_knows_the_partname_it_was_loaded_from(
+        self, request, is_dirty, expected_value
+    ):
+        property_mock(request, Part, "is_dirty", return_value=is_dirty)
+        part = Part(PackURI("/y"), None, None)
+        part._src_partname = PackURI("/x")
+
+        assert part.src_partname == expected_value
 
     def it_knows_its_content_type(self):
         assert Part(None, CT.PML_SLIDE, None).content_type == CT.PML_SLIDE
 
-    @pytest.mark.parametrize("ref_count, calls", ((2, []), (1, [call("rId42")])))
-    def it_can_drop_a_relationship(self, request, relationships_, ref_count, calls):
+    @pytest.mark.parametrize("src_partname", (None, PackURI("/ppt/media/image1.png")))
+    def it_can_copy_itself_to_another_package(self, request, src_partname):
+        blob = FileBlob(absjoin(test_file_dir, "dummy.mp4"))
+        package_ = instance_mock(request, OpcPackage)
+        part = Part(PackURI("/ppt/media/image1.png"), CT.PNG, None, blob)
+        part._src_partname = src_partname
+
+        part_copy = part._copy_to(package_)
+
+        assert type(part_copy) is Part
+        assert part_copy.partname == "/ppt/media/image1.png"
+        assert part_copy.content_type == CT.PNG
+        assert part_copy.package is package_
+        assert part_copy.file_blob is blob
+        assert part_copy.src_partname == src_partname
+
+    @pytest.mark.parametrize(
+        "ref_count, xml_ref_count, calls, expected_count",
+        (
+            (3, None, [], 2),
+            (2, None, [], 1),
+            (1, 1, [call("rId42")], 0),
+            (0, 0, [call("rId42")], 0),
+            (1, 3, [], 2),
+        ),
+    )
+    def it_can_drop_a_relationship(
+        self, request, relationships_, ref_count, xml_ref_count, calls, expected_count
+    ):
+        rId_ref_counts = collections.Counter({"rId42": ref_count, "rId6": 1})
+        property_mock(request, Part, "_rId_ref_counts", return_value=rId_ref_counts)
+        property_mock(request, Part, "_rels", return_value=relationships_)
         _rel_ref_count_ = method_mock(
-            request, Part, "_rel_ref_count", return_value=ref_count
+            request, Part, "_rel_ref_count", return_value=xml_ref_count
         )
-        property_mock(request, Part, "_rels", return_value=relationships_)
         part = Part(None, None, None)
 
         part.drop_rel("rId42")
 
-        _rel_ref_count_.assert_called_once_with(part, "rId42")
+        if xml_ref_count is None:
+            _rel_ref_count_.assert_not_called()
+        else:
+            _rel_ref_count_.assert_called_once_with(part, "rId42")
         assert relationships_.pop.call_args_list == calls
+        assert rId_ref_counts["rId42"] == expected_count
+        assert rId_ref_counts["rId6"] == 1
+
+    @pytest.mark.parametrize("counts_formed", (True, False))
+    def it_counts_the_reference_to_the_rId_it_relates_to(
+        self, request, relationships_, counts_formed
+    ):
+        relationships_.get_or_add.return_value = "rId3"
+        property_mock(request, Part, "_rels", return_value=relationships_)
+        part = Part(None, None, None)
+        if counts_formed:
+            part.__dict__["_rId_ref_counts"] = collections.Counter({"rId3": 1})
+
+        rId = part.relate_to("part", RT.IMAGE)
+
+        assert rId == "rId3"
+        assert part.__dict__.get("_rId_ref_counts") == (
+            collections.Counter({"rId3": 2}) if counts_formed else None
+        )
+
+    def it_counts_the_references_to_each_rId_in_its_xml_to_help(self):
+        xml_part = XmlPart(
+            None,
+            None,
+            None,
+            element(
+                "p:sld/(p:sp/a:hlinkClick{r:id=rId1},p:sp/a:hlinkClick{r:id=rId2},"
+                "p:sp/a:hlinkHover{r:id=rId1},p:pic/a:blip{r:embed=rId3})"
+            ),
+        )
+
+        assert xml_part._rId_ref_counts == {"rId1": 2, "rId2": 1}
+
+    def it_keeps_its_reference_counts_current_as_references_change(self, request):
+        """Integrates with XmlPart and _Relationships."""
+        xml_part = XmlPart(
+            PackURI("/ppt/slides/slide1.xml"),
+            CT.PML_SLIDE,
+            None,
+            element(
+                "p:sld/(p:sp/a:hlinkClick{r:id=rId1},p:sp/a:hlinkClick{r:id=rId1})"
+            ),
+        )
+        xml_part._rels._rels["rId1"] = _Relationship(
+            None, "rId1", RT.HYPERLINK, RTM.EXTERNAL, "http://foo"
+        )
+        hlinkClicks = xml_part._element.xpath("//a:hlinkClick")
+        xml_part.drop_rel("rId1")
+        assert "rId1" in xml_part._rels
+
+        rId = xml_part.relate_to("http://bar", RT.HYPERLINK, is_external=True)
+        hlinkClicks[0].set(qn("r:id"), rId)
+        assert xml_part._rId_ref_counts == {"rId1": 1, rId: 1}
+
+        xml_part.drop_rel("rId1")
+        xml_part.drop_rel(rId)
+        assert len(xml_part._rels) == 0
+
+    def it_counts_the_references_to_an_rId_in_its_xml_to_help(self):
+        xml_part = XmlPart(
+            None,
+            None,
+            None,
+            element(
+                "p:sld/(p:sp/a:hlinkClick{r:id=rId1},p:sp/a:hlinkClick{r:id=rId2},"
+                "p:sp/a:hlinkHover{r:id=rId1})"
+            ),
+        )
+
+        assert xml_part._rel_ref_count("rId1") == 2
+        assert xml_part._rel_ref_count("rId9") == 0
+
+    def it_keeps_a_relationship_referred_to_by_a_copied_shape(self):
+        """Integrates with the API."""
+        prs = Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        textbox = slide.shapes.add_textbox(0, 0, 100, 100)
+        textbox.text_frame.text = "foo"
+        textbox.text_frame.paragraphs[0].runs[0].hyperlink.address = "http://foo"
+        slide.part._rId_ref_counts
+        sp_copy = copy.deepcopy(textbox._element)
+        slide.shapes._spTree.append(sp_copy)
+
+        textbox.text_frame.paragraphs[0].runs[0].hyperlink.address = None
+
+        rId = sp_copy.xpath(".//a:hlinkClick/@r:id")[0]
+        assert slide.part.target_ref(rId) == "http://foo"
 
     def it_knows_the_package_it_belongs_to(self, package_):
         assert Part(None, None, package_).package is package_
 
+    def it_adds_its_partname_to_its_package_when_created(self, package_):
+        Part(PackURI("/ppt/media/image1.png"), None, package_)
+        package_._part_added.assert_called_once_with("/ppt/media/image1.png")
+
     def it_knows_its_partname(self):
         assert Part(PackURI("/part/name"), None, None).partname == PackURI("/part/name")
 
-    def it_can_change_its_partname(self):
-        part = Part(PackURI("/old/part/name"), None, None)
+    def it_can_change_its_partname(self, package_):
+        part = Part(PackURI("/old/part/name"), None, package_)
         part.partname = PackURI("/new/part/name")
+        package_._part_renamed.assert_called_once_with(
+            "/old/part/name", "/new/part/name"
+        )
         assert part.partname == PackURI("/new/part/name")
 
     def it_provides_access_to_its_relationships_for_traversal(
@@ -450,13 +1345,26 @@ class DescribePart(object):
         property_mock(request, Part, "_rels", return_value=relationships_)
         assert Part(None, None, None).rels is relationships_
 
+    def it_reads_the_blob_of_a_file_backed_part(self, request):
+        file_blob_ = instance_mock(request, FileBlob)
+        file_blob_.read.return_value = b"bytes"
+        part = Part(None, None, None, file_blob_)
+
+        assert part.blob == b"bytes"
+        assert part.file_blob is file_blob_
+
+    def but_it_has_no_file_blob_when_its_blob_is_in_memory(self):
+        assert Part(None, None, None, b"bytes").file_blob is None
+
     def it_can_load_a_blob_from_a_file_path_to_help(self):
         path = absjoin(test_file_dir, "minimal.pptx")
         with open(path, "rb") as f:
             file_bytes = f.read()
         part = Part(None, None, None, None)
 
-        assert part._blob_from_file(path) == file_bytes
+        blob = part._blob_from_file(path)
+
+        assert blob == file_bytes
 
     def it_can_load_a_blob_from_a_file_like_object_to_help(self):
         part = Part(None, None, None, None)
@@ -466,18 +1374,32 @@ class DescribePart(object):
         _Relationships_ = class_mock(
             request, "pptx.opc.package._Relationships", return_value=relationships_
         )
+        package_ = instance_mock(request, OpcPackage)
+        part = Part(PackURI("/ppt/slides/slide1.xml"), None, package_)
+
+        rels = part._rels
+
+        _Relationships_.assert_called_once_with("/ppt/slides", package_)
+        assert rels is relationships_
+
+    def but_its_deferred_parts_load_them_when_it_was_loaded_lazily(
+        self, request, relationships_
+    ):
+        deferred_parts_ = instance_mock(request, _DeferredParts)
+        deferred_parts_.load_rels.return_value = relationships_
         part = Part(PackURI("/ppt/slides/slide1.xml"), None, None)
+        part._deferred_parts = deferred_parts_
 
         rels = part._rels
 
-        _Relationships_.assert_called_once_with("/ppt/slides")
+        deferred_parts_.load_rels.assert_called_once_with(part)
         assert rels is relationships_
 
     # fixture components ---------------------------------------------
 
     @pytest.fixture
     def package_(self, request):
-        return instance_mock(request, OpcPackage)
+        return instance_mock(request, OpcPackage, read_only=False)
 
     @pytest.fixture
     def relationships_(self, request):
@@ -489,18 +1411,110 @@ class DescribeXmlPart(object):
 
     def it_can_be_constructed_by_PartFactory(self, request):
         partname = PackURI("/ppt/slides/slide1.xml")
-        element_ = element("p:sld")
         package_ = instance_mock(request, OpcPackage)
+        parse_xml_ = function_mock(request, "pptx.opc.package.parse_xml")
+        _init_ = initializer_mock(request, XmlPart)
+
+        part = XmlPart.load(partname, CT.PML_SLIDE, package_, b"blob")
+
+        _init_.assert_called_once_with(
+            part, partname, CT.PML_SLIDE, package_, element=None
+        )
+        assert isinstance(part, XmlPart)
+        assert part._blob == b"blob"
+        assert part._src_partname == partname
+        parse_xml_.assert_not_called()
+
+    def it_parses_its_blob_on_first_access_to_its_element(self, request):
+        element_ = element("p:sld")
         parse_xml_ = function_mock(
             request, "pptx.opc.package.parse_xml", return_value=element_
         )
-        _init_ = initializer_mock(request, XmlPart)
+        xml_part = XmlPart.load(None, None, None, b"blob")
 
-        part = XmlPart.load(partname, CT.PML_SLIDE, package_, b"blob")
+        elements = (xml_part._element, xml_part._element)
 
         parse_xml_.assert_called_once_with(b"blob")
-        _init_.assert_called_once_with(part, partname, CT.PML_SLIDE, package_, element_)
-        assert isinstance(part, XmlPart)
+        assert elements == (element_, element_)
+        assert xml_part._blob is None
+
+    def and_it_parses_it_only_once_when_threads_first_access_it_together(
+        self, request
+    ):
+        parse_xml_ = function_mock(
+            request,
+            "pptx.opc.package.parse_xml",
+            side_effect=lambda blob: time.sleep(0.01) or element("p:sld"),
+        )
+        xml_part = XmlPart.load(None, None, None, b"blob")
+        elements = []
+        threads = [
+            threading.Thread(target=lambda: elements.append(xml_part._element))
+            for _ in range(8)
+        ]
+
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        parse_xml_.assert_called_once_with(b"blob")
+        assert len(elements) == 8
+        assert all(e is elements[0] for e in elements)
+
+    def and_it_does_not_wait_on_another_part_being_parsed(self):
+        xml_part = XmlPart(None, None, None, None)
+        other_xml_part = XmlPart(None, None, None, None)
+
+        assert xml_part._parse_lock is not other_xml_part._parse_lock
+
+    def it_can_be_loaded_with_a_blob_read_when_needed(self, request):
+        blob_ = instance_mock(request, _PackageMemberBlob)
+        blob_.read.return_value = b'<a:p xmlns:a="urn:a"/>'
+        xml_part = XmlPart.load(None, None, None, blob_)
+
+        assert xml_part.file_blob is None
+        assert xml_part.blob == b'<a:p xmlns:a="urn:a"/>'
+        assert xml_part._element.tag == "{urn:a}p"
+
+    def it_can_drop_the_explicit_rels_its_xml_no_longer_refers_to(self, request):
+        rels = {
+            rId: instance_mock(request, _Relationship, rId=rId, reltype=reltype)
+            for rId, reltype in (
+                ("rId1", RT.SLIDE_LAYOUT),
+                ("rId2", RT.IMAGE),
+                ("rId3", RT.IMAGE),
+                ("rId4", RT.HYPERLINK),
+                ("rId5", RT.CHART),
+                ("rId6", RT.MEDIA),
+            )
+        }
+        relationships = _Relationships(None)
+        relationships._rels.update(rels)
+        property_mock(request, XmlPart, "_rels", return_value=relationships)
+        xml_part = XmlPart(
+            None,
+            None,
+            None,
+            element(
+                "p:sld/p:cSld/p:spTree/(p:pic/p:blipFill/a:blip{r:embed=rId3},p:sp/p:t"
+                "xBody/a:p/a:r/a:rPr/a:hlinkClick{r:id=rId4},p:pic/p:nvPicPr/p:nvPr/a:"
+                "videoFile{r:link=rId6})"
+            ),
+        )
+
+        xml_part.drop_unreferenced_rels()
+
+        assert sorted(relationships.keys()) == ["rId1", "rId3", "rId4", "rId6"]
+
+    def but_not_when_its_xml_has_not_been_parsed(self, request):
+        _rels_prop_ = property_mock(request, XmlPart, "_rels")
+        xml_part = XmlPart.load(None, None, None, b"blob")
+
+        xml_part.drop_unreferenced_rels()
+
+        _rels_prop_.assert_not_called()
+        assert xml_part._blob == b"blob"
 
     def it_can_serialize_to_xml(self, request):
         element_ = element("p:sld")
@@ -514,6 +1528,55 @@ class DescribeXmlPart(object):
         serialize_part_xml_.assert_called_once_with(element_)
         assert blob is serialize_part_xml_.return_value
 
+    def but_it_provides_its_load_blob_unchanged_when_never_parsed(self, request):
+        serialize_part_xml_ = function_mock(
+            request, "pptx.opc.package.serialize_part_xml"
+        )
+        xml_part = XmlPart.load(None, None, None, b"<p:sld/>")
+
+        blob = xml_part.blob
+
+        serialize_part_xml_.assert_not_called()
+        assert blob == b"<p:sld/>"
+
+    @pytest.mark.parametrize(
+        "element_, src_partname, expected_value",
+        (
+            (None, PackURI("/ppt/slides/slide1.xml"), False),
+            (element("p:sld"), PackURI("/ppt/slides/slide1.xml"), True),
+            (element("p:sld"), None, True),
+        ),
+    )
+    def it_knows_whether_it_is_dirty(self, element_, src_partname, expected_value):
+        xml_part = XmlPart(None, None, None, element_)
+        xml_part._src_partname = src_partname
+
+        assert xml_part.is_dirty is expected_value
+
+    def it_can_copy_itself_to_another_package(self, request):
+        package_ = instance_mock(request, OpcPackage)
+        partname = PackURI("/ppt/slides/slide1.xml")
+        xml_part = XmlPart.load(partname, CT.PML_SLIDE, None, b"<p:sld/>")
+
+        xml_part_copy = xml_part._copy_to(package_)
+
+        assert xml_part_copy.package is package_
+        assert xml_part_copy._xml_element is None
+        assert xml_part_copy.blob == b"<p:sld/>"
+        assert xml_part_copy.src_partname == partname
+
+    def but_its_copy_is_dirty_when_its_xml_has_been_parsed(self, request):
+        xml_part = XmlPart.load(
+            PackURI("/ppt/slides/slide1.xml"), CT.PML_SLIDE, None, b"<p:sld/>"
+        )
+        xml_part._xml_element = element("p:sld/p:cSld")
+
+        xml_part_copy = xml_part._copy_to(None)
+
+        assert xml_part_copy._element is not xml_part._element
+        assert xml_part_copy._element.xml == xml_part._element.xml
+        assert xml_part_copy.src_partname is None
+
     def it_knows_it_is_the_part_for_its_child_objects(self):
         xml_part = XmlPart(None, None, None, None)
         assert xml_part.part is xml_part
@@ -523,12 +1586,12 @@ class DescribePartFactory(object):
     """Unit-test suite for `pptx.opc.package.PartFactory` objects."""
 
     def it_constructs_custom_part_type_for_registered_content_types(
-        self, request, package_, part_
+        self, request, monkeypatch, package_, part_
     ):
         SlidePart_ = class_mock(request, "pptx.opc.package.XmlPart")
         SlidePart_.load.return_value = part_
         partname = PackURI("/ppt/slides/slide7.xml")
-        PartFactory.part_type_for[CT.PML_SLIDE] = SlidePart_
+        monkeypatch.setitem(PartFactory.part_type_for, CT.PML_SLIDE, SlidePart_)
 
         part = PartFactory(partname, CT.PML_SLIDE, package_, b"blob")
 
@@ -743,19 +1806,34 @@ class Describe_Relationships(object):
         ]
         assert relationships._rels == {"rId1": rels_[0], "rId2": rels_[1]}
 
+    def it_can_load_copies_of_the_relationships_of_another_part(self, request):
+        parts_ = tuple(instance_mock(request, Part) for _ in range(2))
+        rels = _Relationships("/ppt/slides")
+        rels.get_or_add(RT.SLIDE_LAYOUT, parts_[0])
+        rels.get_or_add_ext_rel(RT.HYPERLINK, "http://url")
+        relationships = _Relationships("/ppt/slides")
+
+        relationships.load_from_rels(rels, {parts_[0]: parts_[1]})
+
+        assert sorted(relationships.keys()) == ["rId1", "rId2"]
+        assert relationships["rId1"].target_part is parts_[1]
+        assert relationships["rId2"].target_ref == "http://url"
+        assert relationships.get_or_add(RT.SLIDE_LAYOUT, parts_[1]) == "rId1"
+        assert relationships["rId1"] is not rels["rId1"]
+
     def it_can_find_a_part_with_reltype(
         self, _rels_by_reltype_prop_, relationship_, part_
     ):
         relationship_.target_part = part_
         _rels_by_reltype_prop_.return_value = collections.defaultdict(
-            list, ((RT.SLIDE_LAYOUT, [relationship_]),)
+            dict, ((RT.SLIDE_LAYOUT, {"rId1": relationship_}),)
         )
         relationships = _Relationships(None)
 
         assert relationships.part_with_reltype(RT.SLIDE_LAYOUT) is part_
 
     def but_it_raises_KeyError_when_there_is_no_such_part(self, _rels_by_reltype_prop_):
-        _rels_by_reltype_prop_.return_value = collections.defaultdict(list)
+        _rels_by_reltype_prop_.return_value = collections.defaultdict(dict)
         relationships = _Relationships(None)
 
         with pytest.raises(KeyError) as e:
@@ -770,7 +1848,7 @@ class Describe_Relationships(object):
     ):
         relationship_.target_part = part_
         _rels_by_reltype_prop_.return_value = collections.defaultdict(
-            list, ((RT.SLIDE_LAYOUT, [relationship_, relationship_]),)
+            dict, ((RT.SLIDE_LAYOUT, {"rId1": relationship_, "rId2": relationship_}),)
         )
         relationships = _Relationships(None)
 
@@ -782,15 +1860,49 @@ class Describe_Relationships(object):
         )
 
     def it_can_pop_a_relationship_to_remove_it_from_the_collection(
-        self, _rels_prop_, relationship_
+        self, _rels_prop_, relationship_, _unindex_
     ):
         _rels_prop_.return_value = {"rId22": relationship_}
         relationships = _Relationships(None)
 
         relationships.pop("rId22")
 
+        _unindex_.assert_called_once_with(relationships, relationship_)
         assert relationships._rels == {}
 
+    def it_can_retarget_its_relationships_to_replacement_parts(self, request):
+        parts_ = tuple(instance_mock(request, Part) for _ in range(3))
+        relationships = _Relationships("/ppt/slides")
+        relationships.get_or_add(RT.IMAGE, parts_[0])
+        relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url")
+        relationships.get_or_add(RT.IMAGE, parts_[1])
+
+        relationships.retarget({parts_[0]: parts_[2]})
+
+        rel = relationships["rId1"]
+        assert (rel.reltype, rel.target_part) == (RT.IMAGE, parts_[2])
+        assert relationships["rId3"].target_part is parts_[1]
+        assert relationships.get_or_add(RT.IMAGE, parts_[2]) == "rId1"
+        assert relationships.get_or_add(RT.IMAGE, parts_[0]) == "rId4"
+
+    def it_can_be_made_read_only(self, request):
+        part_ = instance_mock(request, Part)
+        relationships = _Relationships("/ppt/slides")
+        relationships.get_or_add(RT.SLIDE_LAYOUT, part_)
+
+        relationships.make_read_only()
+
+        for change in (
+            lambda: relationships.get_or_add(RT.IMAGE, part_),
+            lambda: relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url"),
+            lambda: relationships.pop("rId1"),
+            lambda: relationships.retarget({part_: part_}),
+        ):
+            with pytest.raises(ReadOnlyPackageError) as e:
+                change()
+            assert str(e.value) == "relationships of '/ppt/slides' are read-only"
+        assert relationships["rId1"].target_part is part_
+
     def it_can_serialize_itself_to_XML(self, request, _rels_prop_):
         _rels_prop_.return_value = {
             "rId11": instance_mock(
@@ -834,6 +1946,7 @@ class Describe_Relationships(object):
         _next_rId_prop_.return_value = "rId8"
         _Relationship_.return_value = relationship_
         _rels_prop_.return_value = {}
+        _index_ = method_mock(request, _Relationships, "_index")
         relationships = _Relationships("/ppt")
 
         rId = relationships._add_relationship(RT.SLIDE, part_)
@@ -841,6 +1954,7 @@ class Describe_Relationships(object):
         _Relationship_.assert_called_once_with(
             "/ppt", "rId8", RT.SLIDE, target_mode=RTM.INTERNAL, target=part_
         )
+        _index_.assert_called_once_with(relationships, relationship_)
         assert relationships._rels == {"rId8": relationship_}
         assert rId == "rId8"
 
@@ -850,6 +1964,7 @@ class Describe_Relationships(object):
         _next_rId_prop_.return_value = "rId9"
         _Relationship_.return_value = relationship_
         _rels_prop_.return_value = {}
+        method_mock(request, _Relationships, "_index")
         relationships = _Relationships("/ppt")
 
         rId = relationships._add_relationship(
@@ -873,26 +1988,25 @@ class Describe_Relationships(object):
         ),
     )
     def it_can_get_a_matching_relationship_to_help(
-        self, request, _rels_by_reltype_prop_, target_ref, is_external, expected_value
+        self, request, _rels_prop_, target_ref, is_external, expected_value
     ):
         part_1, part_2 = (instance_mock(request, Part) for _ in range(2))
-        _rels_by_reltype_prop_.return_value = {
-            RT.SLIDE: [
-                instance_mock(
-                    request,
-                    _Relationship,
-                    rId=rId,
-                    target_part=target_part,
-                    target_ref=ref,
-                    is_external=external,
-                )
-                for rId, target_part, ref, external in (
-                    ("rId1", None, "http://url", True),
-                    ("rId2", part_1, "/ppt/foo.bar", False),
-                    ("rId3", None, "http://foo", True),
-                    ("rId4", part_2, "/ppt/bar.foo", False),
-                )
-            ]
+        _rels_prop_.return_value = {
+            rId: instance_mock(
+                request,
+                _Relationship,
+                rId=rId,
+                reltype=RT.SLIDE,
+                target_part=target_part,
+                target_ref=ref,
+                is_external=external,
+            )
+            for rId, target_part, ref, external in (
+                ("rId1", None, "http://url", True),
+                ("rId2", part_1, "/ppt/foo.bar", False),
+                ("rId3", None, "http://foo", True),
+                ("rId4", part_2, "/ppt/bar.foo", False),
+            )
         }
         target = (
             target_ref if is_external else part_1 if target_ref == "part_1" else part_2
@@ -904,9 +2018,9 @@ class Describe_Relationships(object):
         assert matching == expected_value
 
     def but_it_returns_None_when_there_is_no_matching_relationship(
-        self, _rels_by_reltype_prop_
+        self, _rels_prop_
     ):
-        _rels_by_reltype_prop_.return_value = collections.defaultdict(list)
+        _rels_prop_.return_value = {}
         relationships = _Relationships(None)
 
         assert relationships._get_matching(RT.HYPERLINK, "http://url", True) is None
@@ -930,19 +2044,78 @@ class Describe_Relationships(object):
 
     def it_collects_relationships_by_reltype_to_help(self, request, _rels_prop_):
         rels = {
-            "rId%d" % (i + 1): instance_mock(request, _Relationship, reltype=reltype)
-            for i, reltype in enumerate((RT.SLIDE, RT.IMAGE, RT.SLIDE, RT.HYPERLINK))
+            rId: instance_mock(request, _Relationship, rId=rId, reltype=reltype)
+            for rId, reltype in (
+                ("rId1", RT.SLIDE),
+                ("rId2", RT.IMAGE),
+                ("rId3", RT.SLIDE),
+                ("rId4", RT.HYPERLINK),
+            )
         }
         _rels_prop_.return_value = rels
         relationships = _Relationships(None)
 
         rels_by_reltype = relationships._rels_by_reltype
 
-        assert rels["rId1"] in rels_by_reltype[RT.SLIDE]
-        assert rels["rId2"] in rels_by_reltype[RT.IMAGE]
-        assert rels["rId3"] in rels_by_reltype[RT.SLIDE]
-        assert rels["rId4"] in rels_by_reltype[RT.HYPERLINK]
-        assert rels_by_reltype[RT.CHART] == []
+        assert rels_by_reltype[RT.SLIDE] == {"rId1": rels["rId1"], "rId3": rels["rId3"]}
+        assert rels_by_reltype[RT.IMAGE] == {"rId2": rels["rId2"]}
+        assert rels_by_reltype[RT.HYPERLINK] == {"rId4": rels["rId4"]}
+        assert rels_by_reltype[RT.CHART] == {}
+
+    def it_keeps_its_indexes_current_as_relationships_are_added_and_removed(
+        self, request
+    ):
+        part_1, part_2 = (instance_mock(request, Part) for _ in range(2))
+        relationships = _Relationships("/ppt/slides")
+        relationships._rels.update(
+            (rId, _Relationship("/ppt/slides", rId, RT.IMAGE, RTM.INTERNAL, target))
+            for rId, target in (("rId1", part_1), ("rId2", part_2), ("rId3", part_1))
+        )
+        assert relationships._get_matching(RT.IMAGE, part_1) == "rId1"
+        assert relationships._next_rId == "rId4"
+
+        relationships.pop("rId1")
+        assert relationships._get_matching(RT.IMAGE, part_1) == "rId3"
+        assert relationships._next_rId == "rId1"
+
+        assert relationships.get_or_add(RT.IMAGE, part_2) == "rId2"
+        assert relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url") == "rId1"
+        assert relationships.get_or_add_ext_rel(RT.HYPERLINK, "http://url") == "rId1"
+        assert relationships._next_rId == "rId4"
+        assert list(relationships._rels_by_reltype[RT.IMAGE]) == ["rId2", "rId3"]
+
+        relationships.pop("rId3")
+        relationships.pop("rId2")
+        assert relationships._get_matching(RT.IMAGE, part_1) is None
+        assert relationships._next_rId == "rId2"
+        with pytest.raises(KeyError):
+            relationships.part_with_reltype(RT.IMAGE)
+        assert list(relationships._rels_by_reltype[RT.HYPERLINK]) == ["rId1"]
+
+    @pytest.mark.parametrize(
+        "rIds, popped_rId, expected_value",
+        (
+            (("rId1", "rId2", "rId3"), "rId2", "rId2"),
+            (("rId1", "rId2", "rId3"), "rId3", "rId3"),
+            (("rId1", "rId4", "rId6"), "rId6", "rId3"),
+            (("rId1", "rId4", "rId6"), "rId1", "rId3"),
+            (("rId1", "foo", "rId7"), "foo", "rId3"),
+            (("rId2", "rId01"), "rId01", "rId1"),
+        ),
+    )
+    def it_finds_the_next_rId_after_a_relationship_is_removed(
+        self, request, rIds, popped_rId, expected_value
+    ):
+        relationships = _Relationships(None)
+        relationships._rels.update(
+            (rId, instance_mock(request, _Relationship, rId=rId, is_external=True))
+            for rId in rIds
+        )
+        relationships._next_rId
+
+        relationships.pop(popped_rId)
+
+        assert relationships._next_rId == expected_value
 
     # fixture components -----------------------------------
 
@@ -958,6 +2131,10 @@ class Describe_Relationships(object):
     def _next_rId_prop_(self, request):
         return property_mock(request, _Relationships, "_next_rId")
 
+    @pytest.fixture
+    def _unindex_(self, request):
+        return method_mock(request, _Relationships, "_unindex")
+
     @pytest.fixture
     def part_(self, request):
         return instance_mock(request, Part)
@@ -1072,3 +2249,9 @@ class Describe_Relationship(object):
     @pytest.fixture
     def part_(self, request):
         return instance_mock(request, Part)
+
+
+def _movie_blob_of(prs):
+    """Return bytes of the movie part of `prs`."""
+    parts = prs.part.package.iter_parts()
+    return next(p for p in parts if p.content_type == CT.VIDEO).blob
@@ -8,16 +8,23 @@ import zipfile
 
 from pptx.compat import BytesIO
 from pptx.exceptions import PackageNotFoundError
+from pptx.opc.blob import CHUNK_SIZE, BufferBlob, FileBlob, ZipMemberBlob
 from pptx.opc.constants import CONTENT_TYPE as CT
-from pptx.opc.package import Part, _Relationships
+from pptx.opc.package import OpcPackage, Part, _Relationships
 from pptx.opc.packuri import CONTENT_TYPES_URI, PackURI
 from pptx.opc.serialized import (
+    CompressionPolicy,
     PackageReader,
     PackageWriter,
+    _ChunkSink,
     _ContentTypesItem,
+    _DirPkgWriter,
     _DirPkgReader,
     _PhysPkgReader,
+    _PendingMember,
     _PhysPkgWriter,
+    _RawZipMember,
+    _WriteOnlyFile,
     _ZipPkgReader,
     _ZipPkgWriter,
 )
@@ -32,6 +39,7 @@ from ..unitutil.mock import (
     instance_mock,
     method_mock,
     property_mock,
+    var_mock,
 )
 
 
@@ -68,6 +76,78 @@ class DescribePackageReader(object):
 
         assert package_reader.rels_xml_for(PackURI("/ppt/slides.slide1.xml")) is None
 
+    @pytest.mark.parametrize(
+        "min_size, expected_min_size", ((None, 1024 * 1024), (0, 0), (42, 42))
+    )
+    def it_can_get_a_file_blob_by_partname(
+        self, request, _blob_reader_prop_, min_size, expected_min_size
+    ):
+        phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
+        phys_pkg_reader_.file_blob.return_value = "file-blob"
+        _blob_reader_prop_.return_value = phys_pkg_reader_
+        package_reader = PackageReader(None)
+
+        file_blob = package_reader.file_blob(
+            PackURI("/ppt/media/media1.mp4"), min_size
+        )
+
+        phys_pkg_reader_.file_blob.assert_called_once_with(
+            "/ppt/media/media1.mp4", expected_min_size
+        )
+        assert file_blob == "file-blob"
+
+    def it_can_get_a_raw_member_by_partname(self, request, _blob_reader_prop_):
+        phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
+        phys_pkg_reader_.raw_member.return_value = "raw-member"
+        _blob_reader_prop_.return_value = phys_pkg_reader_
+        package_reader = PackageReader(None)
+
+        raw_member = package_reader.raw_member(PackURI("/ppt/media/image1.png"))
+
+        phys_pkg_reader_.raw_member.assert_called_once_with("/ppt/media/image1.png")
+        assert raw_member == "raw-member"
+
+    @pytest.mark.parametrize(
+        "src_file, pkg_file, expected_value",
+        (
+            (zip_pkg_path, zip_pkg_path, True),
+            (zip_pkg_path, absjoin(test_file_dir, "..", "test_files/test.pptx"), True),
+            (zip_pkg_path, absjoin(test_file_dir, "minimal.pptx"), False),
+            (zip_pkg_path, absjoin(test_file_dir, "not-there.pptx"), False),
+            (zip_pkg_path, BytesIO(), False),
+        ),
+    )
+    def it_knows_whether_it_reads_from_a_pkg_file(
+        self, src_file, pkg_file, expected_value
+    ):
+        assert PackageReader(src_file).reads_from(pkg_file) is expected_value
+
+    def and_it_knows_it_reads_from_the_stream_it_was_opened_with(self):
+        stream = BytesIO()
+        assert PackageReader(stream).reads_from(stream) is True
+
+    def it_can_close_the_package_file(self, request, _blob_reader_prop_):
+        phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
+        _blob_reader_prop_.return_value = phys_pkg_reader_
+        package_reader = PackageReader(None)
+
+        package_reader.close()
+
+        phys_pkg_reader_.close.assert_called_once_with()
+
+    def it_can_rebase_on_the_package_saved_over_its_package_file(self, request):
+        phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
+        parts_ = [instance_mock(request, Part), instance_mock(request, Part)]
+        package_reader = PackageReader("prs.pptx")
+        package_reader.__dict__["_blob_reader"] = phys_pkg_reader_
+
+        package_reader.rebase(parts_)
+
+        phys_pkg_reader_.close.assert_called_once_with()
+        assert "_blob_reader" not in package_reader.__dict__
+        for part_ in parts_:
+            part_.rebase.assert_called_once_with(package_reader)
+
     def it_constructs_its_blob_reader_to_help(self, request):
         phys_pkg_reader_ = instance_mock(request, _PhysPkgReader)
         _PhysPkgReader_ = class_mock(request, "pptx.opc.serialized._PhysPkgReader")
@@ -96,7 +176,7 @@ class DescribePackageWriter(object):
         PackageWriter.write("prs.pptx", relationships_, ("part_1", "part_2"))
 
         _init_.assert_called_once_with(
-            ANY, "prs.pptx", relationships_, ("part_1", "part_2")
+            ANY, "prs.pptx", relationships_, ("part_1", "part_2"), None, None, None
         )
         _write_.assert_called_once_with(ANY)
 
@@ -108,17 +188,33 @@ class DescribePackageWriter(object):
             request, PackageWriter, "_write_content_types_stream"
         )
         _write_pkg_rels_ = method_mock(request, PackageWriter, "_write_pkg_rels")
-        _write_parts_ = method_mock(request, PackageWriter, "_write_parts")
-        package_writer = PackageWriter("prs.pptx", None, None)
+        _iter_write_parts_ = method_mock(
+            request, PackageWriter, "_iter_write_parts", return_value=iter((None,))
+        )
+        compression_ = instance_mock(request, CompressionPolicy)
+        package_writer = PackageWriter("prs.pptx", None, None, None, compression_, 4)
 
         package_writer._write()
 
-        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx")
+        _PhysPkgWriter_.factory.assert_called_once_with("prs.pptx", compression_, 4)
         _write_content_types_stream_.assert_called_once_with(
             package_writer, phys_writer_
         )
         _write_pkg_rels_.assert_called_once_with(package_writer, phys_writer_)
-        _write_parts_.assert_called_once_with(package_writer, phys_writer_)
+        _iter_write_parts_.assert_called_once_with(package_writer, phys_writer_)
+        phys_writer_.__exit__.assert_called_once_with(None, None, None)
+
+    def it_can_generate_a_package_in_chunks(self, request):
+        def _iter_write(self):
+            for chunk in (b"foo", b"", b"bar", b"baz"):
+                self._pkg_file.write(chunk)
+                yield
+
+        method_mock(request, PackageWriter, "_iter_write", side_effect=_iter_write)
+
+        chunks = PackageWriter.iter_chunks(None, ("part_1", "part_2"))
+
+        assert list(chunks) == [b"foo", b"bar", b"baz"]
 
     def it_can_write_a_content_types_stream(self, request, phys_writer_):
         _ContentTypesItem_ = class_mock(
@@ -134,31 +230,67 @@ class DescribePackageWriter(object):
 
         _ContentTypesItem_.xml_for.assert_called_once_with(("part_1", "part_2"))
         serialize_part_xml_.assert_called_once_with("part_xml")
-        phys_writer_.write.assert_called_once_with(CONTENT_TYPES_URI, b"xml")
+        phys_writer_.write.assert_called_once_with(CONTENT_TYPES_URI, b"xml", CT.XML)
+
+    def it_writes_a_file_backed_part_from_its_file_blob(self, request):
+        file_blob_ = instance_mock(request, FileBlob)
+        part_ = instance_mock(
+            request,
+            Part,
+            partname=PackURI("/ppt/media/media1.mp4"),
+            content_type=CT.MP4,
+            file_blob=file_blob_,
+            _rels=None,
+        )
+        method_mock(request, PackageWriter, "_raw_member_for", return_value=None)
+        package_writer = PackageWriter(None, None, (part_,))
+
+        pending_members = list(package_writer._iter_part_members())
+
+        assert len(pending_members) == 1
+        pending_member = pending_members[0]
+        assert pending_member.pack_uri == "/ppt/media/media1.mp4"
+        assert pending_member.content_type == CT.MP4
+        assert pending_member.file_blob is file_blob_
 
     def it_can_write_a_sequence_of_parts(self, request, phys_writer_):
-        parts_ = (
+        parts_ = tuple(
             instance_mock(
                 request,
                 Part,
                 partname=PackURI("/ppt/%s.xml" % x),
                 blob="blob_%s" % x,
+                content_type=CT.PML_SLIDE,
+                file_blob=None,
                 rels=instance_mock(request, _Relationships, xml="rels_xml_%s" % x),
             )
             for x in ("a", "b", "c")
         )
+        raw_member_ = instance_mock(request, _RawZipMember)
+        _raw_member_for_ = method_mock(
+            request,
+            PackageWriter,
+            "_raw_member_for",
+            side_effect=iter((None, raw_member_, None)),
+        )
+        write_ = method_mock(request, _PhysPkgWriter, "write", autospec=False)
+        write_raw_ = method_mock(request, _PhysPkgWriter, "write_raw", autospec=False)
         package_writer = PackageWriter(None, None, parts_)
 
-        package_writer._write_parts(phys_writer_)
+        for _ in package_writer._iter_write_parts(_PhysPkgWriter()):
+            pass
 
-        assert phys_writer_.write.call_args_list == [
-            call("/ppt/a.xml", "blob_a"),
-            call("/ppt/_rels/a.xml.rels", "rels_xml_a"),
-            call("/ppt/b.xml", "blob_b"),
-            call("/ppt/_rels/b.xml.rels", "rels_xml_b"),
-            call("/ppt/c.xml", "blob_c"),
-            call("/ppt/_rels/c.xml.rels", "rels_xml_c"),
+        assert _raw_member_for_.call_args_list == [
+            call(package_writer, part_) for part_ in parts_
         ]
+        assert write_.call_args_list == [
+            call("/ppt/a.xml", "blob_a", CT.PML_SLIDE),
+            call("/ppt/_rels/a.xml.rels", "rels_xml_a", CT.OPC_RELATIONSHIPS),
+            call("/ppt/_rels/b.xml.rels", "rels_xml_b", CT.OPC_RELATIONSHIPS),
+            call("/ppt/c.xml", "blob_c", CT.PML_SLIDE),
+            call("/ppt/_rels/c.xml.rels", "rels_xml_c", CT.OPC_RELATIONSHIPS),
+        ]
+        write_raw_.assert_called_once_with("/ppt/b.xml", raw_member_)
 
     def it_can_write_a_pkg_rels_item(self, request, phys_writer_, relationships_):
         relationships_.xml = b"pkg-rels-xml"
@@ -166,10 +298,90 @@ class DescribePackageWriter(object):
 
         package_writer._write_pkg_rels(phys_writer_)
 
-        phys_writer_.write.assert_called_once_with("/_rels/.rels", b"pkg-rels-xml")
+        phys_writer_.write.assert_called_once_with(
+            "/_rels/.rels", b"pkg-rels-xml", CT.OPC_RELATIONSHIPS
+        )
+
+    @pytest.mark.parametrize(
+        "has_pkg_reader, src_partname, expected_calls",
+        (
+            (True, "/ppt/a.xml", [call("/ppt/a.xml")]),
+            (True, None, []),
+            (False, "/ppt/a.xml", []),
+        ),
+    )
+    def it_finds_the_raw_member_to_copy_a_clean_part_from_to_help(
+        self, request, package_reader_, has_pkg_reader, src_partname, expected_calls
+    ):
+        package_reader_.raw_member.return_value = "raw-member"
+        part_ = instance_mock(request, Part, src_partname=src_partname)
+        package_writer = PackageWriter(
+            None, None, None, package_reader_ if has_pkg_reader else None
+        )
+
+        raw_member = package_writer._raw_member_for(part_)
+
+        assert package_reader_.raw_member.call_args_list == expected_calls
+        assert raw_member == ("raw-member" if expected_calls else None)
+
+    @pytest.mark.parametrize(
+        "has_pkg_reader, reads_from, is_dir, expected_value",
+        (
+            (False, False, False, False),
+            (True, False, False, False),
+            (True, True, False, True),
+            (True, True, True, False),
+        ),
+    )
+    def it_knows_when_it_would_overwrite_the_source_package_to_help(
+        self, package_reader_, has_pkg_reader, reads_from, is_dir, expected_value
+    ):
+        package_reader_.reads_from.return_value = reads_from
+        pkg_file = dir_pkg_path if is_dir else zip_pkg_path
+        package_writer = PackageWriter(
+            pkg_file, None, None, package_reader_ if has_pkg_reader else None
+        )
+
+        assert package_writer._overwrites_src is expected_value
+
+    def it_saves_over_its_source_package_file_by_way_of_a_temp_file(self, tmpdir):
+        """Integrates with OpcPackage."""
+        path = str(tmpdir.join("prs.pptx"))
+        with open(zip_pkg_path, "rb") as f:
+            src_bytes = f.read()
+        with open(path, "wb") as f:
+            f.write(src_bytes)
+        package = OpcPackage.open(path)
+
+        package.save(path)
+
+        assert tmpdir.listdir() == [tmpdir.join("prs.pptx")]
+        assert zipfile.ZipFile(path).testzip() is None
+        assert len(list(OpcPackage.open(path).iter_parts())) == len(
+            list(package.iter_parts())
+        )
+
+    def it_saves_over_its_source_package_stream_once_complete(self):
+        """Integrates with OpcPackage."""
+        with open(zip_pkg_path, "rb") as f:
+            stream = BytesIO(f.read())
+        package = OpcPackage.open(stream)
+        stream.seek(0)
+
+        package.save(stream)
+
+        stream.seek(0)
+        assert zipfile.ZipFile(stream).testzip() is None
+        assert len(list(OpcPackage.open(stream).iter_parts())) == len(
+            list(package.iter_parts())
+        )
 
     # fixture components -----------------------------------
 
+    @pytest.fixture
+    def package_reader_(self, request):
+        return instance_mock(request, PackageReader)
+
     @pytest.fixture
     def phys_writer_(self, request):
         return instance_mock(request, _ZipPkgWriter)
@@ -251,6 +463,25 @@ class Describe_DirPkgReader(object):
             dir_pkg_reader[PackURI("/ppt/foobar.xml")]
         assert str(e.value) == "\"no member '/ppt/foobar.xml' in package\""
 
+    @pytest.mark.parametrize(
+        "membername, min_size, expected_value",
+        (
+            ("ppt/presentation.xml", 1024, True),
+            ("ppt/presentation.xml", 1024 * 1024, False),
+            ("ppt/foobar.xml", 0, False),
+        ),
+    )
+    def it_provides_a_file_blob_for_a_large_member(
+        self, dir_pkg_reader, membername, min_size, expected_value
+    ):
+        file_blob = dir_pkg_reader.file_blob(PackURI("/%s" % membername), min_size)
+
+        if expected_value:
+            assert isinstance(file_blob, FileBlob)
+            assert file_blob.read() == dir_pkg_reader[PackURI("/%s" % membername)]
+        else:
+            assert file_blob is None
+
     # --- fixture components -------------------------------
 
     @pytest.fixture(scope="class")
@@ -278,11 +509,126 @@ class Describe_ZipPkgReader(object):
             zip_pkg_reader[PackURI("/ppt/foobar.xml")]
         assert str(e.value) == "\"no member '/ppt/foobar.xml' in package\""
 
-    def it_loads_the_package_blobs_on_first_access_to_help(self, zip_pkg_reader):
-        blobs = zip_pkg_reader._blobs
-        assert len(blobs) == 38
-        assert "/ppt/presentation.xml" in blobs
-        assert "/ppt/_rels/presentation.xml.rels" in blobs
+    def it_indexes_the_members_on_first_access_to_help(self, zip_pkg_reader):
+        zipinfos = zip_pkg_reader._zipinfos
+        assert len(zipinfos) == 38
+        assert "/ppt/presentation.xml" in zipinfos
+        assert "/ppt/_rels/presentation.xml.rels" in zipinfos
+
+    def it_reads_a_member_only_when_it_is_requested(self, request):
+        zipf_ = instance_mock(request, zipfile.ZipFile)
+        zipf_.read.return_value = b"blob"
+        zipinfo = zipfile.ZipInfo("ppt/presentation.xml")
+        property_mock(request, _ZipPkgReader, "_zipf", return_value=zipf_)
+        property_mock(
+            request,
+            _ZipPkgReader,
+            "_zipinfos",
+            return_value={PackURI("/ppt/presentation.xml"): zipinfo},
+        )
+        zip_pkg_reader = _ZipPkgReader(None)
+
+        blob = zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+
+        zipf_.read.assert_called_once_with(zipinfo)
+        assert blob == b"blob"
+
+    @pytest.mark.parametrize(
+        "membername, min_size, expected_value",
+        (
+            ("ppt/presentation.xml", 1024, True),
+            ("ppt/presentation.xml", 1024 * 1024, False),
+            ("ppt/foobar.xml", 0, False),
+        ),
+    )
+    def it_provides_a_file_blob_for_a_large_member(
+        self, membername, min_size, expected_value
+    ):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+
+        file_blob = zip_pkg_reader.file_blob(PackURI("/%s" % membername), min_size)
+
+        if expected_value:
+            assert isinstance(file_blob, ZipMemberBlob)
+            assert file_blob.read() == zip_pkg_reader[PackURI("/%s" % membername)]
+        else:
+            assert file_blob is None
+        zip_pkg_reader.close()
+
+    def it_can_get_a_member_as_stored_in_the_zip_archive(self):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+
+        raw_member = zip_pkg_reader.raw_member(PackURI("/ppt/presentation.xml"))
+
+        assert raw_member.zipinfo.filename == "ppt/presentation.xml"
+        assert len(raw_member.data) == raw_member.zipinfo.compress_size
+        assert hashlib.sha1(raw_member.blob).hexdigest() == (
+            "efa7bee0ac72464903a67a6744c1169035d52a54"
+        )
+        zip_pkg_reader.close()
+
+    @pytest.mark.parametrize("from_path", (True, False))
+    def it_reads_the_stored_bytes_of_a_member_in_chunks(self, tmpdir, from_path):
+        path = str(tmpdir.join("foo.zip"))
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as zipf:
+            zipf.writestr("foo.bin", b"0123456789")
+        stream = open(path, "rb")
+        zip_pkg_reader = _ZipPkgReader(path if from_path else stream)
+
+        raw_member = zip_pkg_reader.raw_member(PackURI("/foo.bin"))
+        chunks = list(raw_member.iter_chunks(4))
+
+        assert chunks == [b"0123", b"4567", b"89"]
+        zip_pkg_reader.close()
+        stream.close()
+
+    def but_it_returns_None_when_the_member_is_not_present(self, zip_pkg_reader):
+        assert zip_pkg_reader.raw_member(PackURI("/ppt/foobar.xml")) is None
+
+    def and_it_returns_None_when_the_zip_archive_has_changed(self):
+        stream = BytesIO()
+        with zipfile.ZipFile(stream, "w") as zipf:
+            zipf.writestr("ppt/presentation.xml", b"foo")
+        zip_pkg_reader = _ZipPkgReader(stream)
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+        zip_pkg_reader.close()
+        stream.seek(0)
+        stream.truncate()
+        with zipfile.ZipFile(stream, "w") as zipf:
+            zipf.writestr("ppt/presentation.xml", b"foobar")
+
+        assert zip_pkg_reader.raw_member(PackURI("/ppt/presentation.xml")) is None
+
+    def and_it_returns_None_when_the_zip_archive_cannot_be_read(self):
+        stream = BytesIO()
+        with zipfile.ZipFile(stream, "w") as zipf:
+            zipf.writestr("ppt/presentation.xml", b"foo")
+        zip_pkg_reader = _ZipPkgReader(stream)
+        assert PackURI("/ppt/presentation.xml") in zip_pkg_reader
+        zip_pkg_reader.close()
+        stream.close()
+
+        assert zip_pkg_reader.raw_member(PackURI("/ppt/presentation.xml")) is None
+
+    def it_can_close_the_zip_archive(self):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+        zipf = zip_pkg_reader._zipf
+
+        zip_pkg_reader.close()
+
+        assert zipf.fp is None
+        assert "_zipf" not in zip_pkg_reader.__dict__
+
+    def and_it_reopens_the_zip_archive_on_access_after_close(self):
+        zip_pkg_reader = _ZipPkgReader(zip_pkg_path)
+        zip_pkg_reader.close()
+
+        blob = zip_pkg_reader[PackURI("/ppt/presentation.xml")]
+
+        assert hashlib.sha1(blob).hexdigest() == (
+            "efa7bee0ac72464903a67a6744c1169035d52a54"
+        )
+        zip_pkg_reader.close()
 
     # --- fixture components -------------------------------
 
@@ -294,17 +640,124 @@ class Describe_ZipPkgReader(object):
 class Describe_PhysPkgWriter(object):
     """Unit-test suite for `pptx.opc.serialized._PhysPkgWriter` objects."""
 
-    def it_constructs_ZipPkgWriter_unconditionally(self, request):
+    def it_constructs_DirPkgWriter_when_pkg_file_is_a_directory(self, request):
+        dir_pkg_writer_ = instance_mock(request, _DirPkgWriter)
+        _DirPkgWriter_ = class_mock(
+            request, "pptx.opc.serialized._DirPkgWriter", return_value=dir_pkg_writer_
+        )
+
+        phys_writer = _PhysPkgWriter.factory(dir_pkg_path)
+
+        _DirPkgWriter_.assert_called_once_with(dir_pkg_path)
+        assert phys_writer is dir_pkg_writer_
+
+    def it_constructs_ZipPkgWriter_otherwise(self, request):
         zip_pkg_writer_ = instance_mock(request, _ZipPkgWriter)
         _ZipPkgWriter_ = class_mock(
             request, "pptx.opc.serialized._ZipPkgWriter", return_value=zip_pkg_writer_
         )
 
-        phys_writer = _PhysPkgWriter.factory("prs.pptx")
+        phys_writer = _PhysPkgWriter.factory("prs.pptx", "compression", 4)
 
-        _ZipPkgWriter_.assert_called_once_with("prs.pptx")
+        _ZipPkgWriter_.assert_called_once_with("prs.pptx", "compression", 4)
         assert phys_writer is zip_pkg_writer_
 
+    def it_reads_a_file_blob_into_memory_to_write_it_by_default(self, request):
+        write_ = method_mock(request, _PhysPkgWriter, "write")
+        file_blob_ = instance_mock(request, FileBlob)
+        file_blob_.read.return_value = b"blob"
+        phys_writer = _PhysPkgWriter()
+
+        phys_writer.write_blob(PackURI("/ppt/media/media1.mp4"), file_blob_, CT.MP4)
+
+        write_.assert_called_once_with(
+            phys_writer, "/ppt/media/media1.mp4", b"blob", CT.MP4
+        )
+
+    def it_writes_the_blob_of_a_raw_member_by_default(self, request):
+        write_ = method_mock(request, _PhysPkgWriter, "write")
+        raw_member_ = instance_mock(request, _RawZipMember, blob=b"blob")
+        phys_writer = _PhysPkgWriter()
+
+        phys_writer.write_raw(PackURI("/ppt/media/image1.png"), raw_member_)
+
+        write_.assert_called_once_with(phys_writer, "/ppt/media/image1.png", b"blob")
+
+
+class Describe_DirPkgWriter(object):
+    """Unit-test suite for `pptx.opc.serialized._DirPkgWriter` objects."""
+
+    def it_has_an__enter__method_for_context_management(self):
+        pkg_writer = _DirPkgWriter("")
+        assert pkg_writer.__enter__() is pkg_writer
+        assert pkg_writer.__exit__(None, None, None) is None
+
+    def it_can_write_a_blob(self, tmpdir):
+        pkg_writer = _DirPkgWriter(str(tmpdir))
+
+        pkg_writer.write(PackURI("/ppt/slides/slide1.xml"), b"blob")
+        pkg_writer.write(PackURI("/[Content_Types].xml"), b"types")
+
+        assert tmpdir.join("ppt", "slides", "slide1.xml").read_binary() == b"blob"
+        assert tmpdir.join("[Content_Types].xml").read_binary() == b"types"
+
+    @pytest.mark.parametrize(
+        "skip_unchanged, old_blob, blob, expected_value",
+        (
+            (True, b"blob", b"blob", True),
+            (True, b"blob", b"blub", False),
+            (True, b"blob", b"blobs", False),
+            (False, b"blob", b"blob", False),
+        ),
+    )
+    def it_skips_writing_an_unchanged_file_when_so_configured(
+        self, tmpdir, skip_unchanged, old_blob, blob, expected_value
+    ):
+        path = tmpdir.join("ppt", "media", "image1.png")
+        path.write_binary(old_blob, ensure=True)
+        path.setmtime(42)
+        pkg_writer = _DirPkgWriter(str(tmpdir), skip_unchanged)
+
+        pkg_writer.write(PackURI("/ppt/media/image1.png"), blob)
+
+        assert path.read_binary() == blob
+        assert (path.mtime() == 42) is expected_value
+
+    def it_can_write_a_file_blob_in_chunks(self, tmpdir):
+        path = tmpdir.join("ppt", "media", "media1.mp4")
+        pkg_writer = _DirPkgWriter(str(tmpdir))
+
+        pkg_writer.write_blob(PackURI("/ppt/media/media1.mp4"), BufferBlob(b"blob" * 9))
+
+        assert path.read_binary() == b"blob" * 9
+
+    def but_not_when_the_file_blob_is_that_file(self, tmpdir):
+        path = tmpdir.join("ppt", "media", "media1.mp4")
+        path.write_binary(b"blob", ensure=True)
+        file_blob = FileBlob(str(path))
+        pkg_writer = _DirPkgWriter(str(tmpdir), skip_unchanged=False)
+
+        pkg_writer.write_blob(PackURI("/ppt/media/media1.mp4"), file_blob)
+
+        assert path.read_binary() == b"blob"
+
+    def it_writes_a_package_that_can_be_read_back(self, tmpdir):
+        """Integrates with PackageReader."""
+        src_reader = PackageReader(zip_pkg_path)
+        members = [
+            PackURI("/[Content_Types].xml"),
+            PackURI("/_rels/.rels"),
+            PackURI("/ppt/presentation.xml"),
+        ]
+
+        with _DirPkgWriter(str(tmpdir)) as pkg_writer:
+            for pack_uri in members:
+                pkg_writer.write(pack_uri, src_reader[pack_uri])
+
+        dir_reader = PackageReader(str(tmpdir))
+        for pack_uri in members:
+            assert dir_reader[pack_uri] == src_reader[pack_uri]
+
 
 class Describe_ZipPkgWriter(object):
     """Unit-test suite for `pptx.opc.serialized._ZipPkgWriter` objects."""
@@ -329,6 +782,243 @@ class Describe_ZipPkgWriter(object):
         assert len(members) == 1
         assert members[pack_uri] == b"blob"
 
+    @pytest.mark.parametrize(
+        "compression, content_type, expected_compress_type",
+        (
+            (None, CT.PNG, zipfile.ZIP_DEFLATED),
+            (CompressionPolicy.FAST, CT.PNG, zipfile.ZIP_STORED),
+            (CompressionPolicy.FAST, CT.PML_SLIDE, zipfile.ZIP_DEFLATED),
+        ),
+    )
+    def it_compresses_each_blob_as_its_compression_policy_determines(
+        self, compression, content_type, expected_compress_type
+    ):
+        """Integrates with zipfile.ZipFile."""
+        stream = BytesIO()
+        pkg_writer = _ZipPkgWriter(stream, compression)
+
+        with pkg_writer:
+            pkg_writer.write(PackURI("/ppt/foo.bar"), b"blob" * 100, content_type)
+
+        zipf = zipfile.ZipFile(stream)
+        assert zipf.testzip() is None
+        assert zipf.read("ppt/foo.bar") == b"blob" * 100
+        assert zipf.getinfo("ppt/foo.bar").compress_type == expected_compress_type
+
+    def it_can_write_a_raw_member(self):
+        """Integrates with zipfile.ZipFile."""
+        src_stream = BytesIO()
+        with zipfile.ZipFile(src_stream, "w", zipfile.ZIP_DEFLATED) as src_zipf:
+            src_zipf.writestr("ppt/slides/slide1.xml", b"blob" * 100)
+        raw_member = _ZipPkgReader(src_stream).raw_member(
+            PackURI("/ppt/slides/slide1.xml")
+        )
+        stream = BytesIO()
+        pkg_writer = _ZipPkgWriter(stream)
+
+        with pkg_writer:
+            pkg_writer.write_raw(PackURI("/ppt/slides/slide9.xml"), raw_member)
+
+        zipf = zipfile.ZipFile(stream)
+        assert zipf.testzip() is None
+        assert zipf.read("ppt/slides/slide9.xml") == b"blob" * 100
+        zipinfo = zipf.getinfo("ppt/slides/slide9.xml")
+        assert zipinfo.compress_type == zipfile.ZIP_DEFLATED
+        assert zipinfo.compress_size == raw_member.zipinfo.compress_size
+
+    @pytest.mark.parametrize("workers", (None, 1, 3))
+    def it_can_write_a_sequence_of_pending_members(self, workers):
+        """Integrates with zipfile.ZipFile."""
+        src_stream = BytesIO()
+        with zipfile.ZipFile(src_stream, "w", zipfile.ZIP_DEFLATED) as src_zipf:
+            src_zipf.writestr("ppt/media/image1.png", b"png" * 100)
+        raw_member = _ZipPkgReader(src_stream).raw_member(
+            PackURI("/ppt/media/image1.png")
+        )
+        pending_members = [
+            _PendingMember(
+                PackURI("/ppt/slides/slide%d.xml" % idx),
+                CT.PML_SLIDE,
+                load_blob=lambda idx=idx: b"slide%d" % idx * 100,
+            )
+            for idx in range(1, 12)
+        ]
+        pending_members.insert(
+            8,
+            _PendingMember(
+                PackURI("/ppt/media/media1.mp4"),
+                CT.MP4,
+                file_blob=BufferBlob(b"mp4" * 100),
+            ),
+        )
+        pending_members.insert(
+            5,
+            _PendingMember(
+                PackURI("/ppt/media/image1.png"), None, raw_member=raw_member
+            ),
+        )
+        stream = BytesIO()
+        pkg_writer = _ZipPkgWriter(stream, CompressionPolicy.FAST, workers)
+
+        with pkg_writer:
+            pkg_writer.write_members(iter(pending_members))
+
+        zipf = zipfile.ZipFile(stream)
+        assert zipf.testzip() is None
+        assert zipf.namelist() == [m.pack_uri.membername for m in pending_members]
+        assert zipf.read("ppt/slides/slide11.xml") == b"slide11" * 100
+        assert zipf.read("ppt/media/image1.png") == b"png" * 100
+        assert zipf.read("ppt/media/media1.mp4") == b"mp4" * 100
+
+    def and_it_writes_the_same_bytes_with_or_without_workers(self, request):
+        property_mock(
+            request, _ZipPkgWriter, "_date_time", return_value=(2020, 1, 1, 0, 0, 0)
+        )
+
+        def package_bytes(workers):
+            stream = BytesIO()
+            with _ZipPkgWriter(stream, None, workers) as pkg_writer:
+                pkg_writer.write_members(
+                    _PendingMember(
+                        PackURI("/ppt/slides/slide%d.xml" % idx),
+                        CT.PML_SLIDE,
+                        load_blob=lambda idx=idx: b"slide%d" % idx * 1000,
+                    )
+                    for idx in range(1, 20)
+                )
+            return stream.getvalue()
+
+        assert package_bytes(workers=4) == package_bytes(workers=None)
+
+    @pytest.mark.parametrize(
+        "compression, expected_compress_type",
+        (
+            (None, zipfile.ZIP_DEFLATED),
+            (CompressionPolicy.FAST, zipfile.ZIP_STORED),
+        ),
+    )
+    def it_can_write_a_file_blob_in_chunks(self, compression, expected_compress_type):
+        """Integrates with zipfile.ZipFile."""
+        chunk_sink = _ChunkSink()
+        pkg_writer = _ZipPkgWriter(chunk_sink, compression)
+        blob = b"".join(b"%d" % n for n in range(100000))
+
+        with pkg_writer:
+            pkg_writer.write(PackURI("/ppt/foo.xml"), b"foo", CT.XML)
+            pkg_writer.write_blob(
+                PackURI("/ppt/media/media1.mp4"), BufferBlob(blob), CT.MP4
+            )
+            pkg_writer.write(PackURI("/ppt/bar.xml"), b"bar", CT.XML)
+
+        zipf = zipfile.ZipFile(BytesIO(chunk_sink.drain()))
+        assert zipf.testzip() is None
+        assert zipf.namelist() == ["ppt/foo.xml", "ppt/media/media1.mp4", "ppt/bar.xml"]
+        assert zipf.read("ppt/media/media1.mp4") == blob
+        zipinfo = zipf.getinfo("ppt/media/media1.mp4")
+        assert zipinfo.compress_type == expected_compress_type
+        assert zipinfo.flag_bits & 0x08
+
+    def it_can_write_to_a_write_only_stream(self):
+        """Integrates with zipfile.ZipFile."""
+        chunk_sink = _ChunkSink()
+        pkg_writer = _ZipPkgWriter(chunk_sink)
+
+        with pkg_writer:
+            pkg_writer.write(PackURI("/ppt/foo.xml"), b"foo" * 100, CT.XML)
+            pkg_writer.write(PackURI("/ppt/bar.png"), b"bar" * 100, CT.PNG)
+
+        zipf = zipfile.ZipFile(BytesIO(chunk_sink.drain()))
+        assert zipf.testzip() is None
+        assert zipf.read("ppt/foo.xml") == b"foo" * 100
+        assert zipf.read("ppt/bar.png") == b"bar" * 100
+
+    @pytest.mark.parametrize("opens_for_writing", (True, False))
+    def it_writes_by_way_of_the_public_zipfile_interface_when_it_must(
+        self, request, opens_for_writing
+    ):
+        """Integrates with zipfile.ZipFile."""
+        property_mock(
+            request, _ZipPkgWriter, "_appends_compressed", return_value=False
+        )
+        var_mock(
+            request,
+            "pptx.opc.serialized._ZIPFILE_OPENS_FOR_WRITING",
+            new=opens_for_writing,
+        )
+        src_stream = BytesIO()
+        with zipfile.ZipFile(src_stream, "w", zipfile.ZIP_DEFLATED) as src_zipf:
+            src_zipf.writestr("ppt/media/image1.png", b"png" * 100)
+        raw_member = _ZipPkgReader(src_stream).raw_member(
+            PackURI("/ppt/media/image1.png")
+        )
+        stream = BytesIO()
+        pkg_writer = _ZipPkgWriter(stream, CompressionPolicy.FAST, workers=3)
+
+        with pkg_writer:
+            pkg_writer.write_members(
+                iter(
+                    (
+                        _PendingMember(
+                            PackURI("/ppt/slides/slide1.xml"),
+                            CT.PML_SLIDE,
+                            load_blob=lambda: b"slide1" * 100,
+                        ),
+                        _PendingMember(
+                            PackURI("/ppt/media/image1.png"),
+                            None,
+                            raw_member=raw_member,
+                        ),
+                        _PendingMember(
+                            PackURI("/ppt/media/media1.mp4"),
+                            CT.MP4,
+                            file_blob=BufferBlob(b"mp4" * 100),
+                        ),
+                    )
+                )
+            )
+
+        zipf = zipfile.ZipFile(stream)
+        assert zipf.testzip() is None
+        assert zipf.namelist() == [
+            "ppt/slides/slide1.xml",
+            "ppt/media/image1.png",
+            "ppt/media/media1.mp4",
+        ]
+        assert zipf.read("ppt/slides/slide1.xml") == b"slide1" * 100
+        assert zipf.read("ppt/media/image1.png") == b"png" * 100
+        assert zipf.read("ppt/media/media1.mp4") == b"mp4" * 100
+        assert zipf.getinfo("ppt/media/media1.mp4").compress_type == (
+            zipfile.ZIP_STORED
+        )
+
+    def it_knows_whether_it_can_append_a_member_it_compressed(self, _zipf_prop_):
+        _zipf_prop_.return_value = zipfile.ZipFile(BytesIO(), "w")
+        assert _ZipPkgWriter(None)._appends_compressed is True
+
+        _zipf_prop_.return_value = object()
+        assert _ZipPkgWriter(None)._appends_compressed is False
+
+    def it_can_write_to_an_object_that_only_has_a_write_method(self):
+        """Integrates with zipfile.ZipFile."""
+        stream = BytesIO()
+
+        class WriteOnly(object):
+            def write(self, data):
+                return stream.write(data)
+
+        pkg_writer = _ZipPkgWriter(WriteOnly())
+
+        with pkg_writer:
+            pkg_writer.write(PackURI("/ppt/foo.xml"), b"foo" * 100, CT.XML)
+            pkg_writer.write_blob(
+                PackURI("/ppt/media/media1.mp4"), BufferBlob(b"mp4" * 100), CT.MP4
+            )
+
+        zipf = zipfile.ZipFile(stream)
+        assert zipf.testzip() is None
+        assert zipf.read("ppt/foo.xml") == b"foo" * 100
+        assert zipf.read("ppt/media/media1.mp4") == b"mp4" * 100
+
     def it_provides_access_to_the_open_zip_file_to_help(self, request):
         ZipFile_ = class_mock(request, "pptx.opc.serialized.zipfile.ZipFile")
         pkg_writer = _ZipPkgWriter("prs.pptx")
@@ -340,6 +1030,23 @@ class Describe_ZipPkgWriter(object):
         )
         assert zipf is ZipFile_.return_value
 
+    @pytest.mark.parametrize("pkg_file", (BytesIO(), _ChunkSink()))
+    def but_it_adapts_a_file_that_cannot_flush_seek_and_tell(self, request, pkg_file):
+        ZipFile_ = class_mock(request, "pptx.opc.serialized.zipfile.ZipFile")
+        _WriteOnlyFile_ = class_mock(request, "pptx.opc.serialized._WriteOnlyFile")
+        pkg_writer = _ZipPkgWriter(pkg_file)
+
+        pkg_writer._zipf
+
+        if isinstance(pkg_file, _ChunkSink):
+            _WriteOnlyFile_.assert_called_once_with(pkg_file)
+            pkg_file = _WriteOnlyFile_.return_value
+        else:
+            _WriteOnlyFile_.assert_not_called()
+        ZipFile_.assert_called_once_with(
+            pkg_file, "w", compression=zipfile.ZIP_DEFLATED
+        )
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture
@@ -347,6 +1054,117 @@ class Describe_ZipPkgWriter(object):
         return property_mock(request, _ZipPkgWriter, "_zipf")
 
 
+class Describe_ChunkSink(object):
+    """Unit-test suite for `pptx.opc.serialized._ChunkSink` objects."""
+
+    def it_holds_what_is_written_to_it_until_drained(self):
+        chunk_sink = _ChunkSink()
+
+        assert chunk_sink.write(b"foo") == 3
+        assert chunk_sink.write(memoryview(b"bar")) == 3
+        chunk_sink.flush()
+
+        assert chunk_sink.drain() == b"foobar"
+        assert chunk_sink.drain() == b""
+
+
+class Describe_WriteOnlyFile(object):
+    """Unit-test suite for `pptx.opc.serialized._WriteOnlyFile` objects."""
+
+    def it_writes_to_the_file_it_adapts_and_knows_its_position(self):
+        stream = BytesIO()
+        write_only_file = _WriteOnlyFile(stream)
+
+        assert write_only_file.write(b"foo") == 3
+        assert write_only_file.write(bytearray(b"barbaz")) == 6
+
+        assert stream.getvalue() == b"foobarbaz"
+        assert write_only_file.tell() == 9
+
+    def it_flushes_the_file_it_adapts_when_it_can(self, request):
+        file_ = instance_mock(request, BytesIO)
+        _WriteOnlyFile(file_).flush()
+        file_.flush.assert_called_once_with()
+
+        _WriteOnlyFile(object()).flush()
+
+
+class Describe_RawZipMember(object):
+    """Unit-test suite for `pptx.opc.serialized._RawZipMember` objects."""
+
+    @pytest.mark.parametrize(
+        "compress_type, data",
+        (
+            (zipfile.ZIP_STORED, b"foobar"),
+            (zipfile.ZIP_DEFLATED, b"K\xcb\xcfOJ,\x02\x00"),
+        ),
+    )
+    def it_can_decompress_its_data(self, request, compress_type, data):
+        zipinfo = zipfile.ZipInfo("foo.bar")
+        zipinfo.compress_type = compress_type
+        zipinfo.compress_size = len(data)
+        zip_reader_ = instance_mock(request, _ZipPkgReader)
+        zip_reader_.iter_stored.return_value = iter((data[:3], data[3:]))
+
+        blob = _RawZipMember(zipinfo, zip_reader_, 42).blob
+
+        zip_reader_.iter_stored.assert_called_once_with(42, len(data), CHUNK_SIZE)
+        assert blob == b"foobar"
+
+    @pytest.mark.parametrize(
+        "compress_type, flag_bits, expected_value",
+        (
+            (zipfile.ZIP_STORED, 0, True),
+            (zipfile.ZIP_DEFLATED, 0x800, True),
+            (zipfile.ZIP_DEFLATED, 0x1, False),
+            (zipfile.ZIP_BZIP2, 0, False),
+        ),
+    )
+    def it_knows_which_members_it_can_copy(
+        self, compress_type, flag_bits, expected_value
+    ):
+        zipinfo = zipfile.ZipInfo("foo.bar")
+        zipinfo.compress_type = compress_type
+        zipinfo.flag_bits = flag_bits
+        assert _RawZipMember.can_copy(zipinfo) is expected_value
+
+
+class DescribeCompressionPolicy(object):
+    """Unit-test suite for `pptx.opc.serialized.CompressionPolicy` objects."""
+
+    @pytest.mark.parametrize(
+        "policy, content_type, expected_value",
+        (
+            (CompressionPolicy(), CT.PML_SLIDE, (zipfile.ZIP_DEFLATED, None)),
+            (CompressionPolicy(), CT.PNG, (zipfile.ZIP_DEFLATED, None)),
+            (CompressionPolicy(), None, (zipfile.ZIP_DEFLATED, None)),
+            (CompressionPolicy(level=3), CT.XML, (zipfile.ZIP_DEFLATED, 3)),
+            (
+                CompressionPolicy(level=3, xml_level=9),
+                CT.OPC_RELATIONSHIPS,
+                (zipfile.ZIP_DEFLATED, 9),
+            ),
+            (
+                CompressionPolicy(level=3, xml_level=9),
+                CT.X_EMF,
+                (zipfile.ZIP_DEFLATED, 3),
+            ),
+            (
+                CompressionPolicy(stored_content_types=(CT.JPEG,)),
+                CT.JPEG,
+                (zipfile.ZIP_STORED, None),
+            ),
+            (CompressionPolicy.FAST, CT.MP4, (zipfile.ZIP_STORED, None)),
+            (CompressionPolicy.FAST, CT.PML_SLIDE, (zipfile.ZIP_DEFLATED, 1)),
+            (CompressionPolicy.SMALLEST, CT.PNG, (zipfile.ZIP_DEFLATED, 9)),
+        ),
+    )
+    def it_knows_the_zip_settings_for_a_content_type(
+        self, policy, content_type, expected_value
+    ):
+        assert policy.zip_settings_for(content_type) == expected_value
+
+
 class Describe_ContentTypesItem(object):
     """Unit-test suite for `pptx.opc.serialized._ContentTypesItem` objects."""
 
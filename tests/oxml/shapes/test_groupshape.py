@@ -91,6 +91,21 @@ class DescribeCT_GroupShape(object):
         assert xSp.xml == expected_xml
         assert parent_sp.recalculate_extents.call_args_list == calls
 
+    @pytest.mark.parametrize(
+        "cxml, expected_value",
+        (
+            ("p:spTree", 0),
+            ("p:spTree/p:nvGrpSpPr/p:cNvPr{id=1}", 1),
+            (
+                "p:spTree/(p:nvGrpSpPr/p:cNvPr{id=1},p:sp/p:nvSpPr/p:cNvPr{id=42}"
+                ",p:sp/p:nvSpPr/p:cNvPr{id=foo})",
+                42,
+            ),
+        ),
+    )
+    def it_knows_the_max_shape_id_in_its_document(self, cxml, expected_value):
+        assert element(cxml).max_shape_id == expected_value
+
     def it_calculates_its_child_extents_to_help(self, child_exts_fixture):
         xSp, expected_values = child_exts_fixture
         x, y, cx, cy = xSp._child_extents
@@ -10,11 +10,19 @@ import pytest
 
 from lxml import etree
 
-from pptx.oxml import oxml_parser, parse_xml, register_element_cls
-from pptx.oxml.ns import qn
+import pptx.oxml
+from pptx.oxml import (
+    _DeferredElementClassLookup,
+    _register_element_classes,
+    oxml_parser,
+    parse_xml,
+    register_element_cls,
+)
+from pptx.oxml.ns import nsuri, qn
+from pptx.oxml.text import CT_TextParagraph
 from pptx.oxml.xmlchemy import BaseOxmlElement
 
-from ..unitutil.mock import function_mock, loose_mock, var_mock
+from ..unitutil.mock import ANY, function_mock, loose_mock, var_mock
 
 
 class DescribeOxmlParser(object):
@@ -57,6 +65,93 @@ class DescribeRegisterCustomElementClass(object):
         assert type(foo.find(qn("a:bar"))) is etree._Element
 
 
+class DescribeDeferredElementClassLookup(object):
+    def it_registers_the_element_classes_when_first_consulted(self, request):
+        _register_element_classes_ = function_mock(
+            request, "pptx.oxml._register_element_classes"
+        )
+        register_element_cls("a:foo", CustElmCls)
+        lookup = _DeferredElementClassLookup()
+
+        cls = lookup.lookup("element", None, nsuri("a"), "foo")
+
+        _register_element_classes_.assert_called_once_with()
+        assert cls is CustElmCls
+
+    @pytest.mark.parametrize(
+        "node_type, namespace, name",
+        (
+            ("element", nsuri("a"), "unregistered"),
+            ("element", None, "foo"),
+            ("comment", None, None),
+        ),
+    )
+    def but_it_has_no_class_for_other_nodes(
+        self, request, node_type, namespace, name
+    ):
+        function_mock(request, "pptx.oxml._register_element_classes")
+        lookup = _DeferredElementClassLookup()
+        assert lookup.lookup(node_type, None, namespace, name) is None
+
+
+class Describe_register_element_classes(object):
+    def it_registers_the_element_classes_only_once(self, request):
+        _register_all_element_classes_ = function_mock(
+            request, "pptx.oxml._register_all_element_classes"
+        )
+        element_class_lookup_ = var_mock(request, "pptx.oxml.element_class_lookup")
+        var_mock(request, "pptx.oxml._element_classes_registered", new=False)
+
+        _register_element_classes()
+        _register_element_classes()
+
+        _register_all_element_classes_.assert_called_once_with()
+        element_class_lookup_.set_fallback.assert_called_once_with(ANY)
+
+    def and_it_is_registered_only_once_registration_completes(self, request):
+        calls = []
+
+        def register_all_element_classes():
+            calls.append(pptx.oxml._element_classes_registered)
+            _register_element_classes()
+
+        function_mock(
+            request,
+            "pptx.oxml._register_all_element_classes",
+            side_effect=register_all_element_classes,
+        )
+        var_mock(request, "pptx.oxml.element_class_lookup")
+        var_mock(request, "pptx.oxml._element_classes_registered", new=False)
+
+        _register_element_classes()
+
+        assert calls == [False]
+        assert pptx.oxml._element_classes_registered is True
+
+    def but_not_when_registration_fails(self, request):
+        _register_all_element_classes_ = function_mock(
+            request,
+            "pptx.oxml._register_all_element_classes",
+            side_effect=[ImportError, None],
+        )
+        var_mock(request, "pptx.oxml.element_class_lookup")
+        var_mock(request, "pptx.oxml._element_classes_registered", new=False)
+
+        with pytest.raises(ImportError):
+            _register_element_classes()
+        assert pptx.oxml._element_classes_registered is False
+
+        _register_element_classes()
+
+        assert _register_all_element_classes_.call_count == 2
+        assert pptx.oxml._element_classes_registered is True
+
+    def it_gives_each_element_parsed_its_custom_class(self, xml_bytes):
+        foo = parse_xml(xml_bytes.replace(b"a:foo", b"a:p"))
+        assert type(foo) is CT_TextParagraph
+        assert type(foo.find(qn("a:bar"))) is etree._Element
+
+
 # ===========================================================================
 # fixtures
 # ===========================================================================
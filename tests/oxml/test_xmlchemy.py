@@ -8,13 +8,23 @@ provided by the metaclass-built test classes at the end of the file.
 
 from __future__ import absolute_import, print_function
 
+import threading
+
 import pytest
 
 from pptx.exc import InvalidXmlError
 from pptx.oxml import register_element_cls
 from pptx.oxml.ns import qn
-from pptx.oxml.simpletypes import BaseIntType
+from pptx.enum.text import MSO_ANCHOR
+from pptx.oxml.simpletypes import (
+    BaseIntType,
+    ST_ContentType,
+    ST_TextTypeface,
+    XsdString,
+)
 from pptx.oxml.xmlchemy import (
+    _compiled_xpath,
+    _CompiledXPaths,
     BaseOxmlElement,
     Choice,
     OneAndOnlyOne,
@@ -27,6 +37,8 @@ from pptx.oxml.xmlchemy import (
 )
 
 from ..unitdata import BaseBuilder
+from ..unitutil.cxml import element
+from ..unitutil.mock import var_mock
 
 
 class DescribeCustomElementClass(object):
@@ -34,6 +46,68 @@ class DescribeCustomElementClass(object):
         assert type(CT_Parent).__name__ == "MetaOxmlElement"
 
 
+class DescribeXPath(object):
+    def it_evaluates_an_xpath_expression_with_the_oxml_namespaces(self):
+        p_sld = element("p:sld/p:cSld/p:spTree/(p:sp,p:sp)")
+        assert [e.tag for e in p_sld.xpath("./p:cSld/p:spTree/p:sp")] == [
+            qn("p:sp"),
+            qn("p:sp"),
+        ]
+
+    def it_compiles_each_expression_only_once(self, request):
+        var_mock(
+            request, "pptx.oxml.xmlchemy._compiled_xpaths", new=_CompiledXPaths()
+        )
+        xpath = _compiled_xpath("./p:sp")
+        assert _compiled_xpath("./p:sp") is xpath
+
+    def and_it_compiles_an_expression_returning_plain_strings_separately(
+        self, request
+    ):
+        var_mock(
+            request, "pptx.oxml.xmlchemy._compiled_xpaths", new=_CompiledXPaths()
+        )
+        p_sp = element("p:sp/p:nvSpPr/p:cNvPr{id=42}")
+        xpath = _compiled_xpath("//@id")
+
+        plain_xpath = _compiled_xpath("//@id", smart_strings=False)
+
+        assert plain_xpath is not xpath
+        assert _compiled_xpath("//@id", smart_strings=False) is plain_xpath
+        assert xpath(p_sp)[0].getparent() is not None
+        assert plain_xpath(p_sp) == ["42"]
+        assert not hasattr(plain_xpath(p_sp)[0], "getparent")
+
+    def but_it_forgets_them_all_when_its_cache_is_full(self, request):
+        var_mock(
+            request, "pptx.oxml.xmlchemy._compiled_xpaths", new=_CompiledXPaths()
+        )
+        var_mock(request, "pptx.oxml.xmlchemy._COMPILED_XPATHS_MAX", new=2)
+        xpath = _compiled_xpath("./p:sp")
+        _compiled_xpath("./p:pic")
+
+        _compiled_xpath("./p:grpSp")
+
+        assert _compiled_xpath("./p:sp") is not xpath
+
+    def and_it_compiles_them_separately_for_each_thread(self, request):
+        var_mock(
+            request, "pptx.oxml.xmlchemy._compiled_xpaths", new=_CompiledXPaths()
+        )
+        xpath = _compiled_xpath("./p:sp")
+        xpaths = []
+        thread = threading.Thread(
+            target=lambda: xpaths.extend(_compiled_xpath("./p:sp") for _ in range(2))
+        )
+
+        thread.start()
+        thread.join()
+
+        assert xpaths[0] is xpaths[1]
+        assert xpaths[0] is not xpath
+        assert _compiled_xpath("./p:sp") is xpath
+
+
 class DescribeChoice(object):
     def it_adds_a_getter_property_for_the_choice_element(self, getter_fixture):
         parent, expected_choice = getter_fixture
@@ -242,6 +316,22 @@ class DescribeOptionalAttribute(object):
             "ST_IntegerType type-converted value of "
         )
 
+    @pytest.mark.parametrize(
+        "simple_type, converts",
+        (
+            (XsdString, False),
+            (ST_ContentType, False),
+            (ST_TextTypeface, False),
+            (BaseIntType, True),
+            (MSO_ANCHOR, True),
+        ),
+    )
+    def it_skips_the_conversion_of_strings_returned_unchanged(
+        self, simple_type, converts
+    ):
+        from_xml = OptionalAttribute("foo", simple_type)._from_xml
+        assert from_xml == (simple_type.from_xml if converts else None)
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
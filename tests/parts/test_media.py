@@ -3,6 +3,7 @@
 """Unit test suite for `pptx.parts.media` module."""
 
 from pptx.media import Video
+from pptx.opc.blob import FileBlob
 from pptx.package import Package
 from pptx.parts.media import MediaPart
 
@@ -18,6 +19,7 @@ class DescribeMediaPart(object):
         package_ = instance_mock(request, Package)
         package_.next_media_partname.return_value = "media42.mp4"
         media_.blob, media_.content_type = b"blob-bytes", "video/mp4"
+        media_.file_blob = None
 
         media_part = MediaPart.new(package_, media_)
 
@@ -27,6 +29,23 @@ class DescribeMediaPart(object):
         )
         assert isinstance(media_part, MediaPart)
 
+    def but_it_uses_the_file_blob_of_a_file_backed_media_object(self, request):
+        media_ = instance_mock(request, Video, content_type="video/mp4")
+        media_.file_blob = file_blob_ = instance_mock(request, FileBlob)
+        _init_ = initializer_mock(request, MediaPart)
+        package_ = instance_mock(request, Package)
+        package_.next_media_partname.return_value = "media42.mp4"
+
+        media_part = MediaPart.new(package_, media_)
+
+        _init_.assert_called_once_with(
+            media_part, "media42.mp4", "video/mp4", package_, file_blob_
+        )
+
+    def it_knows_the_sha1_hash_of_a_file_backed_media(self, request):
+        file_blob_ = instance_mock(request, FileBlob, sha1="0123456789abcdef")
+        assert MediaPart(None, None, None, file_blob_).sha1 == "0123456789abcdef"
+
     def it_knows_the_sha1_hash_of_the_media(self):
         assert MediaPart(None, None, None, b"blobish-bytes").sha1 == (
             "61efc464c21e54cfc1382fb5b6ef7512e141ceae"
@@ -114,11 +114,12 @@ class DescribePresentationPart(object):
         related_part_.assert_called_once_with(prs_part, "rId42")
         assert slide_master is slide_master_
 
-    def it_can_rename_related_slide_parts(self, request, related_part_):
+    def it_can_rename_related_slide_parts(self, request, package_, related_part_):
         rIds = tuple("rId%d" % n for n in range(5, 0, -1))
         slide_parts = tuple(instance_mock(request, SlidePart) for _ in range(5))
         related_part_.side_effect = iter(slide_parts)
-        prs_part = PresentationPart(None, None, None, None)
+        package_.read_only = False
+        prs_part = PresentationPart(None, None, package_, None)
 
         prs_part.rename_slide_parts(rIds)
 
@@ -127,9 +128,30 @@ class DescribePresentationPart(object):
             PackURI("/ppt/slides/slide%d.xml" % (i + 1)) for i in range(len(rIds))
         ]
 
+    def but_not_when_its_package_is_read_only(self, package_, related_part_):
+        package_.read_only = True
+        prs_part = PresentationPart(None, None, package_, None)
+
+        prs_part.rename_slide_parts(("rId1", "rId2"))
+
+        related_part_.assert_not_called()
+
+    def it_can_generate_the_package_in_chunks(self, package_):
+        package_.iter_chunks.return_value = iter((b"foo", b"bar"))
+        prs_part = PresentationPart(None, None, package_, None)
+
+        chunks = prs_part.iter_chunks("cmp", 4, True, False)
+
+        package_.iter_chunks.assert_called_once_with("cmp", 4, True, False)
+        assert list(chunks) == [b"foo", b"bar"]
+
     def it_can_save_the_package_to_a_file(self, package_):
-        PresentationPart(None, None, package_, None).save("prs.pptx")
-        package_.save.assert_called_once_with("prs.pptx")
+        PresentationPart(None, None, package_, None).save(
+            "prs.pptx", "compression", 4, True, True
+        )
+        package_.save.assert_called_once_with(
+            "prs.pptx", "compression", 4, True, True
+        )
 
     def it_can_add_a_new_slide(
         self, request, package_, slide_part_, slide_, relate_to_
@@ -0,0 +1,151 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.aio` module."""
+
+import pytest
+
+from pptx.api import Presentation, open_async
+from pptx.compat import BytesIO
+
+from .unitutil.file import absjoin, test_file_dir
+from .unitutil.mock import Mock, function_mock
+
+asyncio = pytest.importorskip("asyncio")
+futures = pytest.importorskip("concurrent.futures")
+aio = pytest.importorskip("pptx.aio")
+
+test_pptx_path = absjoin(test_file_dir, "test.pptx")
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+class Describe_open_async(object):
+    """Unit-test suite for `pptx.aio.open_async()` coroutine."""
+
+    def it_loads_a_presentation_from_a_path(self, loop):
+        prs = loop.run_until_complete(aio.open_async(test_pptx_path))
+        assert len(prs.slides) == len(Presentation(test_pptx_path).slides)
+
+    def it_loads_a_presentation_from_an_asyncio_stream(self, loop):
+        with open(test_pptx_path, "rb") as f:
+            blob = f.read()
+        stream = asyncio.StreamReader(loop=loop)
+        stream.feed_data(blob)
+        stream.feed_eof()
+
+        prs = loop.run_until_complete(aio.open_async(stream))
+
+        assert len(prs.slides) == len(Presentation(test_pptx_path).slides)
+
+    def it_loads_a_presentation_as_it_is_told_to(self, request, loop):
+        Presentation_ = function_mock(request, "pptx.aio.Presentation")
+        executor = futures.ThreadPoolExecutor(1)
+
+        try:
+            prs = loop.run_until_complete(
+                aio.open_async("foo.pptx", executor, read_only=True, lazy=True)
+            )
+        finally:
+            executor.shutdown()
+
+        Presentation_.assert_called_once_with("foo.pptx", True, True)
+        assert prs is Presentation_.return_value
+
+    def it_is_provided_by_the_api_module(self, request):
+        open_async_ = function_mock(
+            request, "pptx.aio.open_async", autospec=None, new_callable=Mock
+        )
+
+        coroutine = open_async("foo.pptx", lazy=True)
+
+        open_async_.assert_called_once_with("foo.pptx", None, False, True)
+        assert coroutine is open_async_.return_value
+
+
+class Describe_save_async(object):
+    """Unit-test suite for `pptx.aio.save_async()` coroutine."""
+
+    def it_saves_a_presentation_to_a_path(self, loop, tmpdir):
+        prs = Presentation(test_pptx_path)
+        path = str(tmpdir.join("saved.pptx"))
+
+        loop.run_until_complete(prs.save_async(path))
+
+        assert len(Presentation(path).slides) == len(prs.slides)
+
+    @pytest.mark.parametrize("is_async", (True, False))
+    def it_saves_a_presentation_to_a_stream_in_chunks(self, loop, is_async):
+        prs = Presentation(test_pptx_path)
+        stream = _AsyncStream(loop) if is_async else BytesIO()
+
+        loop.run_until_complete(aio.save_async(prs, stream, workers=2))
+
+        if is_async:
+            assert len(stream.chunks) > 2
+            assert stream.drain_count == len(stream.chunks)
+        blob = stream.getvalue()
+        assert len(Presentation(BytesIO(blob)).slides) == len(prs.slides)
+
+    def it_stops_between_chunks_when_cancelled(self, loop):
+        prs = Presentation(test_pptx_path)
+        stream = _AsyncStream(loop, block_after=1)
+        task = loop.create_task(aio.save_async(prs, stream))
+        loop.run_until_complete(stream.blocked)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            loop.run_until_complete(task)
+
+        assert len(stream.chunks) == 2
+
+    def it_is_provided_by_Presentation(self, request):
+        save_async_ = function_mock(
+            request, "pptx.aio.save_async", autospec=None, new_callable=Mock
+        )
+        prs = Presentation()
+
+        executor = object()
+
+        coroutine = prs.save_async("foo.pptx", prune=True, executor=executor)
+
+        save_async_.assert_called_once_with(
+            prs, "foo.pptx", None, None, True, False, executor
+        )
+        assert coroutine is save_async_.return_value
+
+
+class _AsyncStream(object):
+    """Stream whose `write()` returns an awaitable, like an aiohttp response.
+
+    When `block_after` is given, writes after that many never complete.
+    """
+
+    def __init__(self, loop, block_after=None):
+        self._loop = loop
+        self._block_after = block_after
+        self.chunks = []
+        self.drain_count = 0
+        self.blocked = loop.create_future()
+
+    def write(self, chunk):
+        self.chunks.append(chunk)
+        future = self._loop.create_future()
+        if self._block_after is not None and len(self.chunks) > self._block_after:
+            self.blocked.set_result(None)
+        else:
+            future.set_result(None)
+        return future
+
+    def drain(self):
+        self.drain_count += 1
+        future = self._loop.create_future()
+        future.set_result(None)
+        return future
+
+    def getvalue(self):
+        return b"".join(self.chunks)
@@ -11,10 +11,13 @@ import os
 import pytest
 
 import pptx
-from pptx.api import Presentation
+from pptx.api import Presentation, Template
+from pptx.exc import ReadOnlyPackageError
 from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.package import Package
 from pptx.parts.presentation import PresentationPart
 
+from .unitutil.file import absjoin, test_file_dir
 from .unitutil.mock import class_mock, instance_mock
 
 
@@ -22,9 +25,26 @@ class DescribePresentation(object):
     def it_opens_default_template_on_no_path_provided(self, call_fixture):
         Package_, path, prs_ = call_fixture
         prs = Presentation()
-        Package_.open.assert_called_once_with(path)
+        Package_.open.assert_called_once_with(path, False, False)
         assert prs is prs_
 
+    def it_raises_on_a_package_that_is_not_a_presentation(self, Package_, prs_part_):
+        Package_.open.return_value.main_document_part = prs_part_
+        prs_part_.content_type = CT.WML_DOCUMENT_MAIN
+
+        with pytest.raises(ValueError) as e:
+            Presentation("foo.docx")
+
+        assert str(e.value).startswith("file 'foo.docx' is not a PowerPoint file")
+
+    def it_can_open_a_presentation_read_only(self):
+        prs = Presentation(absjoin(test_file_dir, "test.pptx"), read_only=True)
+
+        assert prs.part.package.read_only is True
+        assert len(prs.slides) > 0
+        with pytest.raises(ReadOnlyPackageError):
+            prs.slides.add_slide(prs.slide_layouts[0])
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -50,3 +70,51 @@ class DescribePresentation(object):
     @pytest.fixture
     def prs_part_(self, request):
         return instance_mock(request, PresentationPart)
+
+
+class DescribeTemplate(object):
+    """Unit-test suite for `pptx.api.Template` objects."""
+
+    def it_opens_its_package_once_when_constructed(self, request, prs_part_):
+        Package_ = class_mock(request, "pptx.api.Package")
+        Package_.open.return_value.main_document_part = prs_part_
+        prs_part_.content_type = CT.PML_PRESENTATION_MAIN
+
+        template = Template("template.pptx")
+
+        Package_.open.assert_called_once_with("template.pptx", False, False)
+        assert template._package is prs_part_.package
+
+    def it_forms_each_new_presentation_from_a_copy_of_its_package(
+        self, request, prs_part_
+    ):
+        package_ = instance_mock(request, Package)
+        package_.copy.return_value.main_document_part = prs_part_
+        template = Template.__new__(Template)
+        template._package = package_
+
+        prs = template.new_presentation()
+
+        package_.copy.assert_called_once_with()
+        assert prs is prs_part_.presentation
+
+    def it_forms_presentations_that_are_independent_of_one_another(self, tmpdir):
+        template = Template(absjoin(test_file_dir, "test.pptx"))
+        prs_1 = template.new_presentation()
+        prs_2 = template.new_presentation()
+
+        prs_1.slides[0].shapes[0].text_frame.text = "foobar"
+        prs_1.slides.add_slide(prs_1.slide_layouts[0])
+        path = str(tmpdir.join("prs-1.pptx"))
+        prs_1.save(path)
+
+        assert prs_2.slides[0].shapes[0].text_frame.text != "foobar"
+        assert len(prs_2.slides) == len(prs_1.slides) - 1
+        assert len(Presentation(path).slides) == len(prs_1.slides)
+        assert Presentation(path).slides[0].shapes[0].text_frame.text == "foobar"
+
+    # fixture components ---------------------------------------------
+
+    @pytest.fixture
+    def prs_part_(self, request):
+        return instance_mock(request, PresentationPart)
@@ -0,0 +1,102 @@
+# encoding: utf-8
+
+"""Unit-test suite for `pptx.batch` module."""
+
+import pytest
+
+from pptx.api import Presentation, Template
+from pptx.batch import RenderResult, _render_record, render_batch
+from pptx.compat import BytesIO
+
+from .unitutil.file import absjoin, test_file_dir
+from .unitutil.mock import instance_mock, method_mock
+
+
+def render_title(prs, record):
+    """Render callable used by these tests; must be module-level to be pickled."""
+    title, path = record
+    if title is None:
+        raise ValueError("record has no title")
+    slide = prs.slides.add_slide(prs.slide_layouts[0])
+    slide.shapes.title.text = title
+    return path
+
+
+class Describe_render_batch(object):
+    """Unit-test suite for `pptx.batch.render_batch()` function."""
+
+    def it_renders_each_record_on_a_pool_of_processes(self, tmpdir):
+        path = str(tmpdir.join("bar.pptx"))
+        records = [("foo", None), ("bar", path), ("baz", None)]
+        progressed = []
+
+        results = list(
+            render_batch(
+                absjoin(test_file_dir, "test.pptx"),
+                records,
+                render_title,
+                processes=2,
+                progress=progressed.append,
+            )
+        )
+
+        assert [result.index for result in results] == [0, 1, 2]
+        assert results[1].output == path
+        titles = [
+            Presentation(
+                BytesIO(r.output) if isinstance(r.output, bytes) else r.output
+            )
+            .slides[-1]
+            .shapes.title.text
+            for r in results
+        ]
+        assert titles == ["foo", "bar", "baz"]
+        assert all(r.render_time >= 0.0 and r.save_time > 0.0 for r in results)
+        assert sorted(r.index for r in progressed) == [0, 1, 2]
+
+    def it_accepts_a_file_like_template(self):
+        with open(absjoin(test_file_dir, "test.pptx"), "rb") as f:
+            stream = BytesIO(f.read())
+
+        (result,) = render_batch(stream, [("foo", None)], render_title, processes=1)
+
+        prs = Presentation(BytesIO(result.output))
+        assert prs.slides[-1].shapes.title.text == "foo"
+
+    def it_takes_no_more_than_max_in_flight_records_ahead(self):
+        taken = []
+
+        def records():
+            for n in range(5):
+                taken.append(n)
+                yield ("title %d" % n, None)
+
+        results = render_batch(
+            None, records(), render_title, processes=1, max_in_flight=2
+        )
+        next(results)
+
+        assert taken == [0, 1]
+        results.close()
+
+    def it_raises_the_exception_raised_by_render(self):
+        results = render_batch(None, [(None, None)], render_title, processes=1)
+
+        with pytest.raises(ValueError) as e:
+            list(results)
+
+        assert str(e.value) == "record has no title"
+
+    def it_renders_a_record_in_a_worker_to_help(self, request, monkeypatch):
+        prs = Presentation()
+        save_ = method_mock(request, type(prs), "save")
+        template_ = instance_mock(request, Template)
+        template_.new_presentation.return_value = prs
+        monkeypatch.setattr("pptx.batch._worker_template", template_)
+
+        result = _render_record(render_title, 42, ("foo", "foo.pptx"))
+
+        save_.assert_called_once_with(prs, "foo.pptx")
+        assert prs.slides[-1].shapes.title.text == "foo"
+        assert isinstance(result, RenderResult)
+        assert (result.index, result.output) == (42, "foo.pptx")
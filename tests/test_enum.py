@@ -72,6 +72,19 @@ class DescribeEnumeration(object):
             FOOBAR.validate("foobar")
         with pytest.raises(ValueError):
             FOOBAR.validate(FOOBAR.READ_ONLY)
+        with pytest.raises(ValueError):
+            FOOBAR.validate(["unhashable"])
+
+    def it_keeps_its_valid_settings_in_a_frozenset(self):
+        assert FOOBAR._valid_settings == frozenset((FOOBAR.READ_WRITE,))
+        assert XMLFOO._valid_settings == frozenset((None, XMLFOO.XML_RW))
+
+    def it_generates_its_documentation_page_when_asked(self):
+        assert FOOBAR.__docs_rst__ == (
+            ".. _MsoFoobar:\n\n``FOOBAR``\n==========\n\nEnumeration docstring\n\n"
+            "----\n\nREAD_WRITE\n    Readable and settable\n\nREAD_ONLY\n"
+            "    Return value only\n"
+        )
 
     def it_can_be_referred_to_by_a_convenience_alias_if_defined(self):
         assert BARFOO is FOOBAR  # noqa
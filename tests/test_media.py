@@ -2,10 +2,13 @@
 
 """Unit test suite for `pptx.media` module."""
 
+import mmap
+
 import pytest
 
 from pptx.compat import BytesIO
 from pptx.media import Video
+from pptx.opc.blob import BufferBlob, FileBlob
 
 from .unitutil.file import absjoin, test_file_dir
 from .unitutil.mock import initializer_mock, instance_mock, method_mock, property_mock
@@ -24,9 +27,33 @@ class DescribeVideo(object):
 
         video = Video.from_path_or_file_like(TEST_VIDEO_PATH, "video/mp4")
 
-        Video.from_blob.assert_called_once_with(blob, "video/mp4", "dummy.mp4")
+        file_blob, mime_type, filename = Video.from_blob.call_args[0]
+        assert file_blob == blob
+        assert (mime_type, filename) == ("video/mp4", "dummy.mp4")
         assert video is video_
 
+    def it_can_construct_from_an_mmap(self, video_, from_blob_):
+        from_blob_.return_value = video_
+        with open(TEST_VIDEO_PATH, "rb") as f:
+            blob = f.read()
+            movie_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        video = Video.from_path_or_file_like(movie_mmap, "video/mp4")
+
+        buffer_blob, mime_type, filename = Video.from_blob.call_args[0]
+        assert isinstance(buffer_blob, BufferBlob)
+        assert buffer_blob.read() == blob
+        assert (mime_type, filename) == ("video/mp4", None)
+        assert video is video_
+        movie_mmap.close()
+
+    @pytest.mark.parametrize("is_file_blob", (True, False))
+    def it_provides_access_to_the_file_blob_it_is_backed_by(self, is_file_blob):
+        blob = FileBlob(TEST_VIDEO_PATH) if is_file_blob else b"foobar"
+        video = Video(blob, None, None)
+
+        assert video.file_blob is (blob if is_file_blob else None)
+
     def it_can_construct_from_a_stream(self, from_stream_fixture):
         movie_stream, mime_type, blob, video_ = from_stream_fixture
         video = Video.from_path_or_file_like(movie_stream, mime_type)
@@ -16,7 +16,7 @@ from pptx.parts.coreprops import CorePropertiesPart
 from pptx.parts.image import Image, ImagePart
 from pptx.parts.media import MediaPart
 
-
+from .unitutil.file import test_file_dir
 from .unitutil.mock import call, class_mock, instance_mock, method_mock, property_mock
 
 
@@ -58,6 +58,49 @@ class DescribePackage(object):
         _MediaParts_.assert_called_once_with(package)
         assert media_parts is media_parts_
 
+    def it_forms_its_image_and_media_indexes_again_after_a_reset(self):
+        package = Package(None)
+        image_parts, media_parts = package._image_parts, package._media_parts
+
+        package._reset_part_indexes()
+
+        assert package._image_parts is not image_parts
+        assert package._media_parts is not media_parts
+
+    def it_forgets_a_picture_image_once_its_last_relationship_is_dropped(self):
+        """Integrates with the API."""
+        image_path = os.path.join(test_file_dir, "python-icon.jpeg")
+        prs = pptx.Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        package = prs.part.package
+        picture = slide.shapes.add_picture(image_path, 0, 0)
+        rId = picture._element.blip_rId
+        image_part = slide.part.related_part(rId)
+        picture._element.getparent().remove(picture._element)
+
+        slide.part.drop_rel(rId)
+
+        assert package.next_image_partname("jpg") == image_part.partname
+        new_picture = slide.shapes.add_picture(image_path, 0, 0)
+        new_image_part = slide.part.related_part(new_picture._element.blip_rId)
+        assert new_image_part is not image_part
+        assert list(package.iter_parts()).count(new_image_part) == 1
+
+    def but_it_reuses_an_image_related_to_again(self):
+        """Integrates with the API."""
+        image_path = os.path.join(test_file_dir, "python-icon.jpeg")
+        prs = pptx.Presentation()
+        slide = prs.slides.add_slide(prs.slide_layouts[6])
+        package = prs.part.package
+        rId = slide.shapes.add_picture(image_path, 0, 0)._element.blip_rId
+        image_part = slide.part.related_part(rId)
+        slide.part.drop_rel(rId)
+
+        slide.part.relate_to(image_part, RT.IMAGE)
+
+        assert package.next_image_partname("jpg") != image_part.partname
+        assert package.get_or_add_image_part(image_path) is image_part
+
     # fixtures -------------------------------------------------------
 
     @pytest.fixture
@@ -185,6 +228,7 @@ class Describe_ImageParts(object):
         Image_.from_file.assert_called_once_with("image.png")
         _find_by_sha1_.assert_called_once_with(image_parts, image_.sha1)
         ImagePart_.new.assert_called_once_with(package_, image_)
+        assert image_parts._image_parts_by_sha1 == {image_.sha1: image_part_}
         assert image_part is image_part_
 
     def it_can_find_an_image_part_by_sha1_hash(self, find_fixture):
@@ -204,6 +248,17 @@ class Describe_ImageParts(object):
 
         assert result == png_part_
 
+    def it_finds_image_parts_without_iterating_the_package_again(self, request, _iter_):
+        image_part_ = instance_mock(request, ImagePart, sha1="f00beed")
+        _iter_.return_value = iter((image_part_,))
+        image_parts = _ImageParts(None)
+
+        image_parts._find_by_sha1("f00beed")
+        image_part = image_parts._find_by_sha1("f00beed")
+
+        _iter_.assert_called_once_with(image_parts)
+        assert image_part is image_part_
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -285,6 +340,9 @@ class Describe_MediaParts(object):
 
         media_parts._find_by_sha1.assert_called_once_with(media_parts, sha1)
         assert MediaPart_.new.call_args_list == calls
+        assert media_parts._media_parts_by_sha1 == (
+            {} if not calls else {sha1: media_part_}
+        )
         assert media_part is media_part_
 
     def it_can_find_a_media_part_by_sha1(self, find_fixture):
@@ -292,6 +350,16 @@ class Describe_MediaParts(object):
         media_part = media_parts._find_by_sha1(sha1)
         assert media_part is expected_value
 
+    def but_it_skips_a_part_of_unrecognized_media_type(self, request, _iter_):
+        part_ = instance_mock(request, Part, name="part_")
+        media_part_ = instance_mock(request, MediaPart, sha1="f00beed")
+        _iter_.return_value = iter((part_, media_part_))
+        media_parts = _MediaParts(None)
+
+        assert media_parts._find_by_sha1("f00beed") is media_part_
+        assert media_parts._find_by_sha1("f00beed") is media_part_
+        _iter_.assert_called_once_with(media_parts)
+
     # fixtures ---------------------------------------------
 
     @pytest.fixture(params=[True, False])
@@ -77,10 +77,19 @@ class DescribePresentation(object):
         assert slide_masters is slide_masters_
         assert prs._element.xml == expected_xml
 
+    def it_can_generate_the_presentation_in_chunks(self, prs_part_):
+        prs_part_.iter_chunks.return_value = iter((b"foo", b"bar"))
+        prs = Presentation(None, prs_part_)
+
+        chunks = prs.iter_chunks(workers=4, prune=True, dedupe=True)
+
+        prs_part_.iter_chunks.assert_called_once_with(None, 4, True, True)
+        assert list(chunks) == [b"foo", b"bar"]
+
     def it_can_save_the_presentation_to_a_file(self, save_fixture):
         prs, file_, prs_part_ = save_fixture
         prs.save(file_)
-        prs_part_.save.assert_called_once_with(file_)
+        prs_part_.save.assert_called_once_with(file_, None, None, False, False)
 
     # fixtures -------------------------------------------------------
 